@@ -0,0 +1,42 @@
+"""
+Benchmark :any:`BinaryImporter` against :any:`pickle`.
+
+Run via::
+
+    $ python benchmarks/bench_binary.py
+"""
+
+import pickle
+import sys
+import timeit
+
+from anytree import Node
+from anytree.exporter import BinaryExporter
+from anytree.importer import BinaryImporter
+
+SIZE = 1_000_000
+
+
+def create(size=SIZE, degree=8):
+    """`Node` tree with `size` nodes, in which every node has `degree` children."""
+    nodes = [Node("n0", value=0, weight=0.0)]
+    for idx in range(1, size):
+        nodes.append(Node(f"n{idx}", parent=nodes[(idx - 1) // degree], value=idx, weight=idx / 2))
+    return nodes[0]
+
+
+def main(number=3):
+    """Print the load durations."""
+    root = create()
+    pickled = pickle.dumps(root, protocol=pickle.HIGHEST_PROTOCOL)
+    binary = BinaryExporter().export(root)
+    del root
+    # like in real life: with garbage collector
+    pickletime = min(timeit.repeat(lambda: pickle.loads(pickled), "gc.enable()", number=1, repeat=number))
+    binarytime = min(timeit.repeat(lambda: BinaryImporter().import_(binary), "gc.enable()", number=1, repeat=number))
+    print(f"pickle {len(pickled):12,d} bytes {pickletime:8.3f} s")
+    print(f"binary {len(binary):12,d} bytes {binarytime:8.3f} s ({pickletime / binarytime:.1f}x)")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+"""
+Benchmark :any:`DictExporter` on deep, wide and balanced trees.
+
+Run via::
+
+    $ python benchmarks/bench_dictexporter.py
+"""
+
+import sys
+import timeit
+
+from anytree import AnyNode
+from anytree.exporter import DictExporter
+
+SIZE = 100_000
+
+
+def deep(size=SIZE):
+    """Single chain of `size` nodes."""
+    root = AnyNode(id=size - 1)
+    for idx in range(size - 2, -1, -1):
+        root = AnyNode(id=idx, children=[root])
+    return root
+
+
+def wide(size=SIZE):
+    """Root with `size - 1` children."""
+    return AnyNode(id=0, children=[AnyNode(id=idx) for idx in range(1, size)])
+
+
+def balanced(size=SIZE, degree=4):
+    """Tree with `size` nodes, in which every node has `degree` children."""
+    nodes = [AnyNode(id=0)]
+    for idx in range(1, size):
+        nodes.append(AnyNode(id=idx, parent=nodes[(idx - 1) // degree]))
+    return nodes[0]
+
+
+def main(number=5):
+    """Print the throughput in nodes per second."""
+    exporters = {
+        "default": DictExporter(),
+        "attrnames": DictExporter(attrnames=["id"]),
+    }
+    for create in (deep, wide, balanced):
+        root = create()
+        for name, exporter in exporters.items():
+            duration = min(timeit.repeat(lambda: exporter.export(root), number=1, repeat=number))  # noqa: B023
+            print(f"{create.__name__:10s} {name:10s} {SIZE / duration:12,.0f} nodes/s")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,28 @@
+"""
+Benchmark :any:`DictImporter` on deep, wide and balanced data.
+
+Run via::
+
+    $ python benchmarks/bench_dictimporter.py
+"""
+
+import sys
+import timeit
+
+from bench_dictexporter import SIZE, balanced, deep, wide
+
+from anytree.exporter import DictExporter
+from anytree.importer import DictImporter
+
+
+def main(number=5):
+    """Print the throughput in nodes per second."""
+    importer = DictImporter()
+    for create in (deep, wide, balanced):
+        data = DictExporter().export(create())
+        duration = min(timeit.repeat(lambda: importer.import_(data), number=1, repeat=number))  # noqa: B023
+        print(f"{create.__name__:10s} {SIZE / duration:12,.0f} nodes/s")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
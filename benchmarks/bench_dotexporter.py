@@ -0,0 +1,43 @@
+"""
+Benchmark :any:`DotExporter` and :any:`UniqueDotExporter` on deep, wide and balanced trees.
+
+Run via::
+
+    $ python benchmarks/bench_dotexporter.py
+"""
+
+import sys
+import timeit
+from collections import deque
+
+from bench_dictexporter import SIZE, balanced, deep, wide
+
+from anytree.exporter import DotExporter, UniqueDotExporter
+
+
+def nodename(node):
+    """Node name."""
+    return f"node{node.id}"
+
+
+def label(node):
+    """Node label."""
+    return f'label="{node.id}"'
+
+
+def main(number=5):
+    """Print the throughput in nodes per second."""
+    for create in (deep, wide, balanced):
+        root = create()
+        exporters = {
+            "DotExporter": DotExporter(root, nodenamefunc=nodename),
+            "DotExporter(stream)": DotExporter(root, nodenamefunc=nodename, stream=True),
+            "UniqueDotExporter": UniqueDotExporter(root, nodeattrfunc=label),
+        }
+        for name, exporter in exporters.items():
+            duration = min(timeit.repeat(lambda: deque(exporter, maxlen=0), number=1, repeat=number))  # noqa: B023
+            print(f"{create.__name__:10s} {name:20s} {SIZE / duration:12,.0f} nodes/s")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
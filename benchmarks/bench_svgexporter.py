@@ -0,0 +1,38 @@
+"""
+Benchmark :any:`TidyLayout` and :any:`SvgExporter` on deep, wide and balanced trees.
+
+Run via::
+
+    $ python benchmarks/bench_svgexporter.py
+"""
+
+import sys
+import timeit
+from collections import deque
+
+from bench_dictexporter import SIZE, balanced, deep, wide
+
+from anytree.exporter import SvgExporter
+from anytree.layout import TidyLayout
+
+
+def nodename(node):
+    """Node name."""
+    return f"node{node.id}"
+
+
+def main(number=5):
+    """Print the throughput in nodes per second."""
+    for create in (deep, wide, balanced):
+        root = create()
+        iterables = {
+            "TidyLayout": TidyLayout(root),
+            "SvgExporter": SvgExporter(root, nodenamefunc=nodename),
+        }
+        for name, iterable in iterables.items():
+            duration = min(timeit.repeat(lambda: deque(iterable, maxlen=0), number=1, repeat=number))  # noqa: B023
+            print(f"{create.__name__:10s} {name:20s} {SIZE / duration:12,.0f} nodes/s")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
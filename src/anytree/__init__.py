@@ -8,8 +8,22 @@ __url__ = "https://github.com/c0fec0de/anytree"
 
 from . import cachedsearch, util
 from .iterators import LevelOrderGroupIter, LevelOrderIter, PostOrderIter, PreOrderIter, ZigZagGroupIter
-from .node import AnyNode, LightNodeMixin, LoopError, Node, NodeMixin, SymlinkNode, SymlinkNodeMixin, TreeError
-from .render import AbstractStyle, AsciiStyle, ContRoundStyle, ContStyle, DoubleStyle, RenderTree
+from .node import (
+    AnyNode,
+    Journal,
+    LightNodeMixin,
+    LoopError,
+    MerkleNodeMixin,
+    Node,
+    NodeMixin,
+    SharedNode,
+    SymlinkNode,
+    SymlinkNodeMixin,
+    TreeError,
+    batch,
+    subscribe,
+)
+from .render import AbstractStyle, AsciiStyle, ContRoundStyle, ContStyle, DoubleStyle, RenderSummary, RenderTree
 from .resolver import ChildResolverError, Resolver, ResolverError, RootResolverError
 from .search import CountError, find, find_by_attr, findall, findall_by_attr
 from .walker import Walker, WalkError
@@ -27,29 +41,35 @@ __all__ = [
     "ContStyle",
     "CountError",
     "DoubleStyle",
+    "Journal",
     "LevelGroupOrderIter",
     "LevelOrderGroupIter",
     "LevelOrderIter",
     "LightNodeMixin",
     "LoopError",
+    "MerkleNodeMixin",
     "Node",
     "NodeMixin",
     "PostOrderIter",
     "PreOrderIter",
+    "RenderSummary",
     "RenderTree",
     "Resolver",
     "ResolverError",
     "RootResolverError",
+    "SharedNode",
     "SymlinkNode",
     "SymlinkNodeMixin",
     "TreeError",
     "WalkError",
     "Walker",
     "ZigZagGroupIter",
+    "batch",
     "cachedsearch",
     "find",
     "find_by_attr",
     "findall",
     "findall_by_attr",
+    "subscribe",
     "util",
 ]
@@ -0,0 +1,170 @@
+"""
+Compact binary tree format, shared by :any:`BinaryExporter`, :any:`BinaryImporter` and :any:`MmapTree`.
+
+Layout (version 1)::
+
+    magic (8 bytes) | version (u32) | header size (u32) | header (JSON) | padding | sections
+
+The JSON header describes the tree:
+
+* ``count``: number of nodes.
+* ``classes``: node classes as ``module:qualname``.
+* ``columns``: attribute schema, a list of ``[name, type, full]``.
+  ``type`` is one of ``int``, ``float``, ``bool``, ``str``, ``node`` and ``object``.
+  ``full`` is set if every node has the attribute.
+* ``tables``: number of entries and the split-ability of the ``strings`` and ``objects`` tables.
+* ``byteorder``: byte order of all sections.
+* ``sections``: ``name: [offset, size, typecode]`` relative to the first section.
+
+All nodes are stored in pre-order. Every section is aligned to 8 bytes:
+
+* ``parent`` (i32): index of the parent node, ``-1`` for the root.
+  This is the only topology section. As the nodes are in pre-order,
+  the children of every node follow in ascending order and the subtree of node ``i``
+  spans the nodes ``i`` up to the next node, which is not a descendant of ``i``.
+  The readers derive the children and the subtree sizes from it.
+* ``class`` (u16): index into ``classes``. Omitted for a single class.
+* ``column.<name>`` (typecode by type): one value per node.
+  Strings and objects are indices into the corresponding table, nodes are node indices.
+* ``present.<name>`` (u8): one flag per node. Omitted for ``full`` columns.
+* ``<table>.offsets`` (i64) and ``<table>.data``: the entries of the ``strings`` table (UTF-8)
+  and the ``objects`` table (pickles). Every entry is followed by a NUL byte.
+
+Loading a file imports the modules of the node classes and unpickles the ``objects`` table.
+Both can execute arbitrary code, so files from untrusted sources must not be loaded.
+"""
+
+import importlib
+import json
+import struct
+import sys
+from array import array
+
+from anytree.node import LightNodeMixin, NodeMixin
+
+MAGIC = b"ANYTREE\x00"
+VERSION = 1
+TYPECODES = {"int": "q", "float": "d", "bool": "B", "str": "i", "object": "i", "node": "i"}
+
+_PREFIX = struct.Struct("<8sII")
+_ALIGN = 8
+
+
+def _align(offset):
+    return -(-offset // _ALIGN) * _ALIGN
+
+
+def classname(cls):
+    """Return `module:qualname` of `cls`."""
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def resolve_class(name):
+    """Return node class for `module:qualname`."""
+    modname, qualname = name.split(":")
+    obj = importlib.import_module(modname)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    if not (isinstance(obj, type) and issubclass(obj, (NodeMixin, LightNodeMixin))):
+        msg = f"{name!r} is not a node class."
+        raise ValueError(msg)
+    return obj
+
+
+def encode_table(items):
+    """Return offsets and data of a table of `items` (bytes)."""
+    offsets = array("q", [0])
+    pos = 0
+    for item in items:
+        pos += len(item) + 1
+        offsets.append(pos)
+    return offsets, b"\x00".join(items) + b"\x00" if items else b""
+
+
+def dump(header, sections):
+    """
+    Return the chunks of the binary representation.
+
+    `sections` maps the section names to :any:`array` or :any:`bytes`.
+    """
+    offsets = {}
+    offset = 0
+    for name, section in sections.items():
+        typecode = section.typecode if isinstance(section, array) else "B"
+        size = len(section) * (section.itemsize if isinstance(section, array) else 1)
+        offsets[name] = [offset, size, typecode]
+        offset = _align(offset + size)
+    header = dict(header, version=VERSION, byteorder=sys.byteorder, sections=offsets)
+    headerdata = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    prefix = _PREFIX.pack(MAGIC, VERSION, len(headerdata))
+    size = len(prefix) + len(headerdata)
+    yield prefix + headerdata + bytes(_align(size) - size)
+    for section in sections.values():
+        data = section.tobytes() if isinstance(section, array) else section
+        yield data
+        yield bytes(_align(len(data)) - len(data))
+
+
+class Layout:
+    """Random access to the sections of a binary tree within `buffer`."""
+
+    def __init__(self, buffer):
+        self.buffer = buffer = memoryview(buffer)
+        if len(buffer) < _PREFIX.size:
+            msg = "Not an anytree binary file."
+            raise ValueError(msg)
+        magic, version, headersize = _PREFIX.unpack_from(buffer)
+        if magic != MAGIC:
+            msg = "Not an anytree binary file."
+            raise ValueError(msg)
+        if version != VERSION:
+            msg = f"Unsupported anytree binary file version {version}."
+            raise ValueError(msg)
+        start = _PREFIX.size
+        self.header = header = json.loads(bytes(buffer[start : start + headersize]))
+        self.count = header["count"]
+        self.start = _align(start + headersize)
+        self.swap = header["byteorder"] != sys.byteorder
+        self.columns = {name: (type_, full) for name, type_, full in header["columns"]}
+
+    def section(self, name):
+        """
+        Return section `name`.
+
+        Either a zero-copy :any:`memoryview` or an :any:`array` for a foreign byte order.
+        """
+        offset, size, typecode = self.header["sections"][name]
+        offset += self.start
+        view = self.buffer[offset : offset + size]
+        if typecode == "B":
+            return view
+        if self.swap:
+            data = array(typecode)
+            data.frombytes(view)
+            data.byteswap()
+            return data
+        return view.cast(typecode)
+
+    def classes(self):
+        """Node classes."""
+        return [resolve_class(name) for name in self.header["classes"]]
+
+    def table(self, name):
+        """Return all entries of table `name` as bytes."""
+        offsets = self.section(f"{name}.offsets").tolist()
+        data = self.section(f"{name}.data")
+        return [data[start : end - 1].tobytes() for start, end in zip(offsets, offsets[1:])]
+
+    def strings(self):
+        """Return all entries of the string table."""
+        table = self.header["tables"]["strings"]
+        if table["split"]:
+            if not table["count"]:
+                return []
+            return self.section("strings.data").tobytes()[:-1].decode("utf-8").split("\x00")
+        return [item.decode("utf-8") for item in self.table("strings")]
+
+    def entry(self, name, idx):
+        """Return entry `idx` of table `name` as bytes."""
+        offsets = self.section(f"{name}.offsets")
+        return self.section(f"{name}.data")[offsets[idx] : offsets[idx + 1] - 1].tobytes()
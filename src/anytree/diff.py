@@ -0,0 +1,290 @@
+"""
+Tree Difference.
+
+* :any:`diff`: determine the edit script between two trees.
+* :any:`apply`: apply an edit script to a tree.
+
+The nodes of both trees are matched by their key path: the keys of all ancestors
+below the root node and the key of the node itself.
+The edit script (patch) is a list of operations, all plain tuples of
+keys, dictionaries and lists:
+
+``("update", path, changed, removed)``
+    Set the attributes in the dictionary `changed` and remove the attributes listed in `removed`.
+
+``("delete", path)``
+    Remove the node at `path` with all its descendants.
+
+``("insert", parentpath, index, data)``
+    Insert a new subtree, exported by :any:`DictExporter`, as child number `index`.
+
+``("move", path, parentpath, index)``
+    Move the node at `path` to child number `index` of the node at `parentpath`.
+
+The indices refer to the final order of the children.
+"""
+
+import itertools
+from bisect import bisect_left
+
+from .exporter import DictExporter
+from .importer import DictImporter
+from .node import MerkleNodeMixin, batch
+
+
+def diff(a, b, key=None, exporter=None):
+    """
+    Return edit script to turn tree `a` into tree `b`.
+
+    Args:
+        a: Root node of the original tree.
+        b: Root node of the modified tree.
+
+    Keyword Args:
+        key: Function returning the key of a node, unique among its siblings. The `name` by default.
+        exporter (DictExporter): Exporter for attributes and new subtrees.
+
+    Subtrees with equal :any:`MerkleNodeMixin.subtree_hash` are skipped without any further comparison,
+    if the `exporter` compares a fixed list of `attrnames` only, which are all part of the `hashattrs`
+    of both subtree root nodes. So the effort just depends on the size of the modification for
+    :any:`MerkleNodeMixin` trees exported like ``DictExporter(attrnames=MerkleNode.hashattrs)``.
+    Any other attribute might differ despite an equal hash, so the attributes are compared then.
+    A subtree, which is removed at one place and inserted unmodified with the same key at another place,
+    is moved. Changing the order of siblings results in the minimum number of moves.
+
+    >>> from anytree import Node, RenderTree
+    >>> from anytree.diff import apply, diff
+    >>> from pprint import pprint
+    >>> a = Node("root", children=[
+    ...     Node("sub0", children=[Node("sub0A"), Node("sub0B", value=1)]),
+    ...     Node("sub1", children=[Node("sub1A")]),
+    ...     Node("sub2"),
+    ... ])
+    >>> b = Node("root", children=[
+    ...     Node("sub2"),
+    ...     Node("sub0", children=[Node("sub0B", value=2), Node("sub1A")]),
+    ...     Node("sub1", children=[Node("sub1B", foo=4)]),
+    ... ])
+    >>> patch = diff(a, b)
+    >>> pprint(patch)
+    [('move', ('sub2',), (), 0),
+     ('update', ('sub0', 'sub0B'), {'value': 2}, []),
+     ('insert', ('sub1',), 0, {'foo': 4, 'name': 'sub1B'}),
+     ('move', ('sub1', 'sub1A'), ('sub0',), 1),
+     ('delete', ('sub0', 'sub0A'))]
+    >>> root = apply(a, patch)
+    >>> print(RenderTree(root))
+    Node('/root')
+    ├── Node('/root/sub2')
+    ├── Node('/root/sub0')
+    │   ├── Node('/root/sub0/sub0B', value=2)
+    │   └── Node('/root/sub0/sub1A')
+    └── Node('/root/sub1')
+        └── Node('/root/sub1/sub1B', foo=4)
+    >>> diff(root, b)
+    []
+    """
+    getkey = key or _get_name
+    exporter = exporter or DictExporter()
+    iter_attr_values = exporter._get_iter_attr_values()  # pylint: disable=protected-access
+    attriter = exporter.attriter or (lambda attr_values: attr_values)
+
+    def get_attrs(node):
+        return dict(attriter(iter_attr_values(node)))
+
+    patch = []
+    deleted = {}
+    inserted = []
+    stack = [(a, b, ())]
+    while stack:
+        nodea, nodeb, path = stack.pop()
+        if _equal_hash(nodea, nodeb, exporter):
+            continue
+        attrsa, attrsb = get_attrs(nodea), get_attrs(nodeb)
+        changed = {name: value for name, value in attrsb.items() if attrsa.get(name, _MISSING) != value}
+        removed = [name for name in attrsa if name not in attrsb]
+        if changed or removed:
+            patch.append(("update", path, changed, removed))
+        childrena, childrenb = _get_children(nodea, getkey), _get_children(nodeb, getkey)
+        if childrena or childrenb:
+            _diff_children(path, childrena, childrenb, patch, deleted, inserted)
+            stack.extend(
+                (childrena[childkey], child, (*path, childkey))
+                for childkey, child in childrenb.items()
+                if childkey in childrena
+            )
+    for path, idx, childkey, child in inserted:
+        candidates = deleted.get(childkey, ())
+        for pos, (oldpath, oldchild) in enumerate(candidates):
+            if _equal(oldchild, child, exporter):
+                del candidates[pos]
+                patch.append(("move", oldpath, path, idx))
+                break
+        else:
+            patch.append(("insert", path, idx, exporter.export(child)))
+    patch.extend(("delete", path) for path, _ in itertools.chain.from_iterable(deleted.values()))
+    return patch
+
+
+def apply(tree, patch, key=None, importer=None):
+    """
+    Apply edit script `patch`, created by :any:`diff`, to `tree` and return `tree`.
+
+    Args:
+        tree: Root node.
+        patch: Edit script.
+
+    Keyword Args:
+        key: Function returning the key of a node, like on :any:`diff`.
+        importer (DictImporter): Importer for new subtrees. Creates nodes of the same class as `tree` by default.
+
+    All paths are resolved and all new subtrees are imported before the first modification.
+    The modifications are applied as one :any:`batch`: the hooks are called once per changed node
+    and any failure, like an exception raised by a `_pre_` hook, rolls back all modifications.
+    The children of every modified node are updated at once: either by attaching and detaching
+    single nodes, or by setting all children.
+    """
+    getkey = key or _get_name
+    importer = importer or DictImporter(nodecls=type(tree))
+    childmaps = {}
+
+    def resolve(path):
+        node = tree
+        for nodekey in path:
+            childmap = childmaps.get(id(node))
+            if childmap is None:
+                childmap = childmaps[id(node)] = _get_children(node, getkey)
+            node = childmap[nodekey]
+        return node
+
+    updates = []
+    removed = {}
+    added = {}
+    for operation in patch:
+        kind = operation[0]
+        if kind == "update":
+            updates.append((resolve(operation[1]), *operation[2:]))
+        elif kind in ("delete", "move"):
+            node = resolve(operation[1])
+            parent = node.parent
+            removed.setdefault(id(parent), (parent, set()))[1].add(id(node))
+            if kind == "move":
+                parent = resolve(operation[2])
+                added.setdefault(id(parent), (parent, []))[1].append((operation[3], node))
+        elif kind == "insert":
+            parent = resolve(operation[1])
+            added.setdefault(id(parent), (parent, []))[1].append((operation[2], operation[3]))
+        else:
+            msg = f"Unknown operation {kind!r}."
+            raise ValueError(msg)
+
+    parents = {parentid: parent for parentid, (parent, _) in itertools.chain(removed.items(), added.items())}
+    changes = []
+    for parentid, parent in parents.items():
+        removedids = removed.get(parentid, (None, ()))[1]
+        additions = sorted(added.get(parentid, (None, ()))[1], key=lambda item: item[0])
+        additions = [(idx, importer.import_(child) if isinstance(child, dict) else child) for idx, child in additions]
+        changes.append((parent, removedids, additions))
+
+    with batch(tree):
+        for node, changed, removedattrs in updates:
+            for name, value in changed.items():
+                setattr(node, name, value)
+            for name in removedattrs:
+                delattr(node, name)
+        for parent, removedids, additions in changes:
+            _update_children(parent, removedids, additions)
+    return tree
+
+
+def _diff_children(path, childrena, childrenb, patch, deleted, inserted):
+    # pylint: disable=too-many-arguments
+    kept = _get_kept(childrena, childrenb)
+    for childkey, child in childrena.items():
+        if childkey not in childrenb:
+            deleted.setdefault(childkey, []).append(((*path, childkey), child))
+    for idx, (childkey, child) in enumerate(childrenb.items()):
+        if childkey not in childrena:
+            inserted.append((path, idx, childkey, child))
+        elif childkey not in kept:
+            patch.append(("move", (*path, childkey), path, idx))
+
+
+def _update_children(parent, removedids, additions):
+    kept = [child for child in parent.children if id(child) not in removedids]
+    if all(idx >= len(kept) for idx, _ in additions):
+        # just appended: attach and detach the affected nodes only
+        for child in parent.children:
+            if id(child) in removedids:
+                child.parent = None
+        for _, child in additions:
+            child.parent = parent
+    else:
+        for idx, child in additions:
+            kept.insert(idx, child)
+        parent.children = kept
+
+
+def _get_name(node):
+    return node.name
+
+
+def _get_children(node, getkey):
+    children = {}
+    for child in node.children:
+        childkey = getkey(child)
+        if childkey in children:
+            msg = f"Key {childkey!r} is not unique among the children of {node!r}."
+            raise ValueError(msg)
+        children[childkey] = child
+    return children
+
+
+def _get_kept(childrena, childrenb):
+    """Return the keys of the common children, which keep their order: the longest increasing subsequence."""
+    positions = {childkey: idx for idx, childkey in enumerate(childrena)}
+    common = [childkey for childkey in childrenb if childkey in positions]
+    tails = []
+    tailidxs = []
+    previous = []
+    for idx, childkey in enumerate(common):
+        position = positions[childkey]
+        pos = bisect_left(tails, position)
+        previous.append(tailidxs[pos - 1] if pos else None)
+        if pos == len(tails):
+            tails.append(position)
+            tailidxs.append(idx)
+        else:
+            tails[pos] = position
+            tailidxs[pos] = idx
+    kept = set()
+    idx = tailidxs[-1] if tailidxs else None
+    while idx is not None:
+        kept.add(common[idx])
+        idx = previous[idx]
+    return kept
+
+
+def _equal_hash(nodea, nodeb, exporter):
+    """Both subtrees are equal by their hash and the hash covers all compared attributes."""
+    if not (isinstance(nodea, MerkleNodeMixin) and isinstance(nodeb, MerkleNodeMixin)):
+        return False
+    attrnames = exporter.attrnames
+    if attrnames is None or exporter.attriter is not None:
+        return False
+    attrnames = set(attrnames)
+    if not (attrnames.issubset(nodea.hashattrs) and attrnames.issubset(nodeb.hashattrs)):
+        return False
+    return nodea.subtree_hash == nodeb.subtree_hash
+
+
+def _equal(nodea, nodeb, exporter):
+    if isinstance(nodea, MerkleNodeMixin) and isinstance(nodeb, MerkleNodeMixin):
+        if nodea.subtree_hash != nodeb.subtree_hash:
+            return False
+        if _equal_hash(nodea, nodeb, exporter):
+            return True
+    return exporter.export(nodea) == exporter.export(nodeb)
+
+
+_MISSING = object()
@@ -1,14 +1,24 @@
 """Exporter."""
 
+from .adjacencyexporter import AdjacencyExporter
+from .binaryexporter import BinaryExporter
 from .dictexporter import DictExporter
-from .dotexporter import DotExporter, UniqueDotExporter
+from .dotexporter import DotExporter, UniqueDotExporter, render_many
 from .jsonexporter import JsonExporter
 from .mermaidexporter import MermaidExporter
+from .summary import SummaryNode, summarize
+from .svgexporter import SvgExporter
 
 __all__ = [
+    "AdjacencyExporter",
+    "BinaryExporter",
     "DictExporter",
     "DotExporter",
     "JsonExporter",
     "MermaidExporter",
+    "SummaryNode",
+    "SvgExporter",
     "UniqueDotExporter",
+    "render_many",
+    "summarize",
 ]
@@ -0,0 +1,135 @@
+import csv
+
+from .dictexporter import DictExporter
+
+
+class AdjacencyExporter:
+    """
+    Tree to adjacency list exporter.
+
+    Every node is converted to one row, a dictionary with the node id,
+    the id of the parent node and all other instance attributes.
+    The rows are generated in pre-order: every parent row comes before the rows of its children.
+    The root node has the parent id `None`.
+
+    Keyword Args:
+        dictcls: class used as row. :any:`dict` by default.
+        idname (str): Name of the column with the node id.
+        parentidname (str): Name of the column with the parent node id.
+        idfunc: Function to retrieve the node id. Reads the attribute `idname` by default.
+        attriter: attribute iterator for sorting and/or filtering.
+        childiter: child iterator for sorting and/or filtering.
+        maxlevel (int): Limit export to this number of levels.
+
+    >>> from anytree import AnyNode
+    >>> from anytree.exporter import AdjacencyExporter
+    >>> root = AnyNode(id=1, a="root")
+    >>> s0 = AnyNode(id=2, a="sub0", parent=root)
+    >>> s0a = AnyNode(id=3, a="sub0A", b="foo", parent=s0)
+    >>> s1 = AnyNode(id=4, a="sub1", parent=root)
+
+    >>> for row in AdjacencyExporter().export(root):
+    ...     print(row)
+    {'id': 1, 'parent_id': None, 'a': 'root'}
+    {'id': 2, 'parent_id': 1, 'a': 'sub0'}
+    {'id': 3, 'parent_id': 2, 'a': 'sub0A', 'b': 'foo'}
+    {'id': 4, 'parent_id': 1, 'a': 'sub1'}
+
+    Nodes without id attribute need an `idfunc`:
+
+    >>> exporter = AdjacencyExporter(idfunc=lambda node: node.a, attriter=lambda attrs: [])
+    >>> for row in exporter.export(root):
+    ...     print(row)
+    {'id': 'root', 'parent_id': None}
+    {'id': 'sub0', 'parent_id': 'root'}
+    {'id': 'sub0A', 'parent_id': 'sub0'}
+    {'id': 'sub1', 'parent_id': 'root'}
+    """
+
+    def __init__(
+        self,
+        dictcls=dict,
+        idname="id",
+        parentidname="parent_id",
+        idfunc=None,
+        attriter=None,
+        childiter=list,
+        maxlevel=None,
+    ):
+        self.dictcls = dictcls
+        self.idname = idname
+        self.parentidname = parentidname
+        self.idfunc = idfunc
+        self.attriter = attriter
+        self.childiter = childiter
+        self.maxlevel = maxlevel
+
+    def export(self, node):
+        """Return iterator over the rows of the tree starting at `node`."""
+        return self.__export(node)
+
+    def write(self, node, filehandle, fieldnames=None, **kwargs):
+        """
+        Write CSV to `filehandle` starting at `node`.
+
+        The column names are taken from `fieldnames`.
+        Without `fieldnames`, all rows are collected first, to determine the columns.
+        `kwargs` are passed to :any:`csv.DictWriter`.
+
+        >>> from anytree import AnyNode
+        >>> from anytree.exporter import AdjacencyExporter
+        >>> root = AnyNode(id=1, a="root")
+        >>> s0 = AnyNode(id=2, a="sub0", parent=root)
+        >>> s1 = AnyNode(id=3, b="sub1", parent=root)
+        >>> with open("tree.csv", "w", newline="") as filehandle:
+        ...     AdjacencyExporter().write(root, filehandle)
+        >>> with open("tree.csv") as filehandle:
+        ...     print(filehandle.read())
+        id,parent_id,a,b
+        1,,root,
+        2,1,sub0,
+        3,1,,sub1
+        <BLANKLINE>
+        """
+        rows = self.__export(node)
+        if fieldnames is None:
+            rows = list(rows)
+            fieldnames = {}
+            for row in rows:
+                fieldnames.update(dict.fromkeys(row))
+        writer = csv.DictWriter(filehandle, fieldnames=list(fieldnames), **kwargs)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    def __export(self, node):
+        # explicit stack instead of recursion - deep trees must not hit the recursion limit
+        dictcls, idname, parentidname = self.dictcls, self.idname, self.parentidname
+        idfunc = self.idfunc or (lambda node: getattr(node, idname))
+        attriter = self.attriter or (lambda attr_values: attr_values)
+        childiter, maxlevel = self.childiter, self.maxlevel
+        iter_attr_values = DictExporter._iter_attr_values  # pylint: disable=protected-access
+
+        def export(node, parentid):
+            nodeid = idfunc(node)
+            row = dictcls(((idname, nodeid), (parentidname, parentid)))
+            for key, value in attriter(iter_attr_values(node)):
+                if key not in (idname, parentidname):
+                    row[key] = value
+            return nodeid, row
+
+        nodeid, row = export(node, None)
+        yield row
+        # every stack item: id of the parent node and its remaining children
+        stack = []
+        if maxlevel is None or maxlevel > 1:
+            stack.append((nodeid, iter(childiter(node.children))))
+        while stack:
+            parentid, children = stack[-1]
+            for child in children:
+                nodeid, row = export(child, parentid)
+                yield row
+                if maxlevel is None or len(stack) + 1 < maxlevel:
+                    stack.append((nodeid, iter(childiter(child.children))))
+                    break
+            else:
+                stack.pop()
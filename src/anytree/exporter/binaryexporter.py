@@ -0,0 +1,175 @@
+import pickle
+from array import array
+
+from anytree import _binaryformat
+from anytree.node import LightNodeMixin, NodeMixin
+
+from .dictexporter import DictExporter
+
+_MISSING = object()
+_INT64 = (-(1 << 63), (1 << 63) - 1)
+
+
+class BinaryExporter:
+    r"""
+    Tree to compact binary format exporter.
+
+    The tree structure is stored as an array of parent indices in pre-order, the attributes as typed columns
+    with one value per node. Strings are stored once in a string table.
+    Nodes of the same tree, like the `target` of a :any:`SymlinkNode`, are stored as references.
+    Any other value is pickled.
+    Use :any:`BinaryImporter` to load the tree again.
+
+    Keyword Args:
+        attriter: attribute iterator for sorting and/or filtering.
+        childiter: child iterator for sorting and/or filtering.
+        maxlevel (int): Limit export to this number of levels.
+
+    >>> from anytree import Node
+    >>> from anytree.exporter import BinaryExporter
+    >>> root = Node("root")
+    >>> s0 = Node("sub0", parent=root, size=1.5)
+    >>> s1 = Node("sub1", parent=root, size=2.0, tags={"a", "b"})
+    >>> data = BinaryExporter().export(root)
+    >>> data[:8]
+    b'ANYTREE\x00'
+
+    .. note:: The node classes are stored by name and need to be importable on load.
+    """
+
+    def __init__(self, attriter=None, childiter=list, maxlevel=None):
+        self.attriter = attriter
+        self.childiter = childiter
+        self.maxlevel = maxlevel
+
+    def export(self, node):
+        """Return binary representation of the tree starting at `node`."""
+        return b"".join(self.__export(node))
+
+    def write(self, node, filehandle):
+        """Write binary representation of the tree starting at `node` to binary `filehandle`."""
+        for chunk in self.__export(node):
+            filehandle.write(chunk)
+
+    def __export(self, node):
+        nodes, parents = self.__collect(node)
+        count = len(nodes)
+        sections = {"parent": parents}
+
+        classes = {}
+        classidxs = array("H", [classes.setdefault(type(item), len(classes)) for item in nodes])
+        if len(classes) > 1:
+            sections["class"] = classidxs
+
+        columns = {}
+        attriter = self.attriter or (lambda attr_values: attr_values)
+        iter_attr_values = DictExporter._iter_attr_values  # pylint: disable=protected-access
+        for idx, item in enumerate(nodes):
+            for name, value in attriter(iter_attr_values(item)):
+                column = columns.get(name)
+                if column is None:
+                    column = columns[name] = [_MISSING] * count
+                column[idx] = value
+
+        encoder = _Encoder(nodes)
+        schema = []
+        for name, values in columns.items():
+            type_, data, present = encoder.encode(values)
+            schema.append((name, type_, present is None))
+            sections[f"column.{name}"] = data
+            if present is not None:
+                sections[f"present.{name}"] = present
+        strings, objects = encoder.strings, encoder.objects
+        tables = {
+            "strings": {"count": len(strings), "split": not any("\x00" in item for item in strings)},
+            "objects": {"count": len(objects), "split": False},
+        }
+        encode_table = _binaryformat.encode_table
+        sections["strings.offsets"], sections["strings.data"] = encode_table([item.encode("utf-8") for item in strings])
+        sections["objects.offsets"], sections["objects.data"] = encode_table(objects)
+        header = {
+            "count": count,
+            "classes": [_binaryformat.classname(cls) for cls in classes],
+            "columns": schema,
+            "tables": tables,
+        }
+        return _binaryformat.dump(header, sections)
+
+    def __collect(self, node):
+        # pre-order, without recursion
+        childiter, maxlevel = self.childiter, self.maxlevel
+        nodes = [node]
+        parents = array("i", [-1])
+        stack = []
+        if maxlevel is None or maxlevel > 1:
+            stack.append((0, iter(childiter(node.children))))
+        while stack:
+            parentidx, children = stack[-1]
+            for child in children:
+                idx = len(nodes)
+                nodes.append(child)
+                parents.append(parentidx)
+                if maxlevel is None or len(stack) + 1 < maxlevel:
+                    stack.append((idx, iter(childiter(child.children))))
+                    break
+            else:
+                stack.pop()
+        return nodes, parents
+
+
+class _Encoder:
+    def __init__(self, nodes):
+        self.nodeidxs = {id(node): idx for idx, node in enumerate(nodes)}
+        self.strings = []
+        self.stringidxs = {}
+        self.objects = []
+
+    def encode(self, values):
+        """Return type, data and presence flags (`None` if all present) of one column."""
+        present = None
+        if any(value is _MISSING for value in values):
+            present = bytes(value is not _MISSING for value in values)
+        kinds = {type(value) for value in values if value is not _MISSING}
+        type_ = self.__get_type(kinds, values)
+        if type_ == "str":
+            add = self.__add_string
+            data = [0 if value is _MISSING else add(value) for value in values]
+        elif type_ == "node":
+            nodeidxs = self.nodeidxs
+            data = [0 if value is _MISSING else nodeidxs[id(value)] for value in values]
+        elif type_ == "object":
+            add = self.__add_object
+            data = [0 if value is _MISSING else add(value) for value in values]
+        elif present is None:
+            data = values
+        else:
+            data = [0 if value is _MISSING else value for value in values]
+        return type_, array(_binaryformat.TYPECODES[type_], data), present
+
+    def __get_type(self, kinds, values):
+        if kinds == {bool}:
+            return "bool"
+        if kinds == {int} and all(_INT64[0] <= value <= _INT64[1] for value in values if value is not _MISSING):
+            return "int"
+        if kinds == {float}:
+            return "float"
+        if kinds == {str}:
+            return "str"
+        nodeidxs = self.nodeidxs
+        if all(
+            value is _MISSING or (isinstance(value, (NodeMixin, LightNodeMixin)) and id(value) in nodeidxs)
+            for value in values
+        ):
+            return "node"
+        return "object"
+
+    def __add_string(self, value):
+        idx = self.stringidxs.get(value)
+        if idx is None:
+            idx = self.stringidxs[value] = len(self.strings)
+            self.strings.append(value)
+        return idx
+
+    def __add_object(self, value):
+        self.objects.append(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        return len(self.objects) - 1
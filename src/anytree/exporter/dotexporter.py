@@ -1,14 +1,11 @@
 import codecs
+import copy
 import itertools
-import logging
-import re
-from os import path, remove
-from subprocess import check_call
-from tempfile import NamedTemporaryFile
+from concurrent.futures import ThreadPoolExecutor
+from os import cpu_count, path
+from subprocess import PIPE, CalledProcessError, Popen
 
-from anytree import PreOrderIter
-
-_RE_ESC = re.compile(r'["\\]')
+from .summary import SummaryNode, _first_hidden, _iter_chunks, _summary_edgefunc, _summary_nodefunc, summarize
 
 
 class DotExporter:
@@ -54,6 +51,16 @@ class DotExporter:
 
         maxlevel (int): Limit export to this number of levels.
 
+        stream (bool): Emit the edges to the children right after the node itself,
+                       instead of all edges after all nodes.
+                       By default, the tree is traversed twice: for the nodes and for the edges.
+                       `stream` traverses it once and determines every node name just once.
+
+        maxnodes (int): Export a summary with this maximum number of nodes, see :any:`summarize`.
+
+        maxchildren (int): Export a summary with this maximum number of children per node, see :any:`summarize`.
+                           The ``... N more`` nodes are formatted by the defaults, not by custom functions.
+
     >>> from anytree import Node
     >>> root = Node("root")
     >>> s0 = Node("sub0", parent=root, edge=2)
@@ -135,6 +142,34 @@ class DotExporter:
 
     .. image:: ../static/dotexporter1.png
 
+    In `stream` mode, every node is followed by the edges to its children:
+
+    >>> for line in DotExporter(root, stream=True, maxlevel=2):
+    ...     print(line)
+    digraph tree {
+        "root";
+        "root" -> "sub0";
+        "root" -> "sub1";
+        "sub0";
+        "sub1";
+    }
+
+    Huge trees are summarised with a node budget:
+
+    >>> for line in DotExporter(root, maxnodes=5, maxchildren=2):
+    ...     print(line)
+    digraph tree {
+        "root";
+        "sub0";
+        "sub0B";
+        "sub0A";
+        "sub1" [label="sub1 (+4)"];
+        "root" -> "sub0";
+        "root" -> "sub1";
+        "sub0" -> "sub0B";
+        "sub0" -> "sub0A";
+    }
+
     To export custom node implementations or :any:`AnyNode`, please provide a proper `nodenamefunc`:
 
     >>> from anytree import AnyNode
@@ -171,6 +206,9 @@ class DotExporter:
         filter_=None,
         maxlevel=None,
         stop=None,
+        stream=False,
+        maxnodes=None,
+        maxchildren=None,
     ):
         self.node = node
         self.graph = graph
@@ -184,6 +222,9 @@ class DotExporter:
         self.filter_ = filter_
         self.maxlevel = maxlevel
         self.stop = stop
+        self.stream = stream
+        self.maxnodes = maxnodes
+        self.maxchildren = maxchildren
 
     def __iter__(self):
         # prepare
@@ -197,11 +238,15 @@ class DotExporter:
 
     @staticmethod
     def _default_nodenamefunc(node):
+        if isinstance(node, SummaryNode) and node.node is None:
+            # `... N more` is not unique
+            return f"{node.parent.name} {node.name}"
         return node.name
 
     @staticmethod
     def _default_nodeattrfunc(node):
-        # pylint: disable=unused-argument
+        if isinstance(node, SummaryNode) and (node.node is None or node.hidden):
+            return f'label="{DotExporter.esc(node.label)}"'
         return None
 
     @staticmethod
@@ -220,10 +265,29 @@ class DotExporter:
         return True
 
     def __iter(self, indent, nodenamefunc, nodeattrfunc, edgeattrfunc, edgetypefunc, filter_):
+        # pylint: disable=too-many-arguments
         yield f"{self.graph} {self.name} {{"
         yield from self.__iter_options(indent)
-        yield from self.__iter_nodes(indent, nodenamefunc, nodeattrfunc, filter_)
-        yield from self.__iter_edges(indent, nodenamefunc, edgeattrfunc, edgetypefunc, filter_)
+        node = self.node
+        stop = self.stop
+        if self.maxnodes is not None or self.maxchildren is not None:
+            node = summarize(node, maxnodes=self.maxnodes, maxchildren=self.maxchildren)
+            # `... N more` nodes do not have any attribute of the summarised nodes, which custom functions could read
+            if self.nodenamefunc:
+                namefunc = nodenamefunc
+                nodenamefunc = _summary_nodefunc(namefunc, lambda more: f"{namefunc(more.parent)} {more.name}")
+            if self.nodeattrfunc:
+                nodeattrfunc = _summary_nodefunc(nodeattrfunc, self._default_nodeattrfunc)
+            if self.edgeattrfunc:
+                edgeattrfunc = _summary_edgefunc(edgeattrfunc, self._default_edgeattrfunc)
+            if self.edgetypefunc:
+                typefunc = edgetypefunc
+                edgetypefunc = _summary_edgefunc(typefunc, lambda parent, more: typefunc(parent, _first_hidden(more)))
+            if self.filter_:
+                filter_ = _summary_nodefunc(filter_, self._default_filter)
+            if stop:
+                stop = _summary_nodefunc(stop, lambda more: False)
+        yield from self.__iter_tree(node, indent, nodenamefunc, nodeattrfunc, edgeattrfunc, edgetypefunc, filter_, stop)
         yield "}"
 
     def __iter_options(self, indent):
@@ -232,25 +296,85 @@ class DotExporter:
             for option in options:
                 yield f"{indent}{option}"
 
-    def __iter_nodes(self, indent, nodenamefunc, nodeattrfunc, filter_):
-        for node in PreOrderIter(self.node, filter_=filter_, stop=self.stop, maxlevel=self.maxlevel):
-            nodename = nodenamefunc(node)
-            nodeattr = nodeattrfunc(node)
-            nodeattr = f" [{nodeattr}]" if nodeattr is not None else ""
-            yield f'{indent}"{DotExporter.esc(nodename)}"{nodeattr};'
-
-    def __iter_edges(self, indent, nodenamefunc, edgeattrfunc, edgetypefunc, filter_):
+    def __iter_tree(self, root, indent, nodenamefunc, nodeattrfunc, edgeattrfunc, edgetypefunc, filter_, stop):
+        # pylint: disable=too-many-arguments
+        if self.stream:
+            yield from self.__iter_stream(
+                root, indent, nodenamefunc, nodeattrfunc, edgeattrfunc, edgetypefunc, filter_, stop
+            )
+        else:
+            yield from self.__iter_nodes(root, indent, nodenamefunc, nodeattrfunc, filter_, stop)
+            yield from self.__iter_edges(root, indent, nodenamefunc, edgeattrfunc, edgetypefunc, filter_, stop)
+
+    def __iter_nodes(self, root, indent, nodenamefunc, nodeattrfunc, filter_, stop):
+        # pylint: disable=too-many-arguments
+        for node in _iter_preorder(root, filter_, stop, self.maxlevel):
+            yield f"{indent}{DotExporter.__node(node, DotExporter.esc(nodenamefunc(node)), nodeattrfunc)}"
+
+    def __iter_edges(self, root, indent, nodenamefunc, edgeattrfunc, edgetypefunc, filter_, stop):
+        # pylint: disable=too-many-arguments
+        esc = DotExporter.esc
         maxlevel = self.maxlevel - 1 if self.maxlevel else None
-        for node in PreOrderIter(self.node, filter_=filter_, stop=self.stop, maxlevel=maxlevel):
-            nodename = nodenamefunc(node)
+        for node in _iter_preorder(root, filter_, stop, maxlevel):
+            nodename = esc(nodenamefunc(node))
             for child in node.children:
                 if not filter_(child):
                     continue
-                childname = nodenamefunc(child)
-                edgeattr = edgeattrfunc(node, child)
-                edgetype = edgetypefunc(node, child)
-                edgeattr = f" [{edgeattr}]" if edgeattr is not None else ""
-                yield f'{indent}"{DotExporter.esc(nodename)}" {edgetype} "{DotExporter.esc(childname)}"{edgeattr};'
+                childname = esc(nodenamefunc(child))
+                yield DotExporter.__edge(
+                    indent, nodename, childname, edgetypefunc(node, child), edgeattrfunc(node, child)
+                )
+
+    def __iter_stream(self, root, indent, nodenamefunc, nodeattrfunc, edgeattrfunc, edgetypefunc, filter_, stop):
+        # pylint: disable=too-many-arguments
+        # One pre-order traversal: every node is followed by the edges to its children.
+        # Every node name is determined and escaped just once: the names of the children are kept
+        # from their edges until the children themselves are emitted.
+        maxlevel = self.maxlevel
+        esc = DotExporter.esc
+        names = {}
+
+        def iter_edges(node, nodename, children):
+            """Emit the edges to `children` and return their `filter_` results."""
+            flags = list(map(filter_, children))
+            for child in itertools.compress(children, flags):
+                childname = names[id(child)] = esc(nodenamefunc(child))
+                yield DotExporter.__edge(
+                    indent, nodename, childname, edgetypefunc(node, child), edgeattrfunc(node, child)
+                )
+            return flags
+
+        stack = [] if maxlevel is not None and maxlevel < 1 else [iter(((root, None),))]
+        while stack:
+            level = len(stack)
+            for node, flag in stack[-1]:
+                if stop and stop(node):
+                    names.pop(id(node), None)
+                    continue
+                included = filter_(node) if flag is None else flag
+                if included:
+                    nodename = names.pop(id(node), None) or esc(nodenamefunc(node))
+                    yield f"{indent}{DotExporter.__node(node, nodename, nodeattrfunc)}"
+                children = node.children
+                if children and (maxlevel is None or level < maxlevel):
+                    flags = (yield from iter_edges(node, nodename, children)) if included else itertools.repeat(None)
+                    stack.append(zip(children, flags))
+                    break
+            else:
+                stack.pop()
+
+    @staticmethod
+    def __node(node, nodename, nodeattrfunc):
+        nodeattr = nodeattrfunc(node)
+        if isinstance(node, SummaryNode) and node.link:
+            nodeattr = ", ".join(filter(None, (nodeattr, f'URL="{DotExporter.esc(node.link)}"')))
+        nodeattr = f" [{nodeattr}]" if nodeattr is not None else ""
+        return f'"{nodename}"{nodeattr};'
+
+    @staticmethod
+    def __edge(indent, nodename, childname, edgetype, edgeattr):
+        edgeattr = f" [{edgeattr}]" if edgeattr is not None else ""
+        return f'{indent}"{nodename}" {edgetype} "{childname}"{edgeattr};'
 
     def to_dotfile(self, filename):
         """
@@ -279,32 +403,121 @@ class DotExporter:
             for line in self:
                 file.write(f"{line}\n")
 
+    def to_files(self, dirname, maxnodes):
+        """
+        Write graph split into chunks with at most `maxnodes` nodes to the directory `dirname`.
+
+        Every chunk is written to ``<idx>.dot``, starting with ``0.dot`` for the chunk with the root node.
+        Subtrees in other chunks are represented by one stub node, which links to the chunk file via `URL`.
+        The chunks are determined in one traversal and written once they are complete.
+
+        Returns the list of written files, with ``0.dot`` first.
+
+        >>> from anytree import Node
+        >>> from anytree.exporter import DotExporter
+        >>> root = Node("root")
+        >>> s0 = Node("sub0", parent=root)
+        >>> s0b = Node("sub0B", parent=s0)
+        >>> s0a = Node("sub0A", parent=s0)
+        >>> s1 = Node("sub1", parent=root)
+        >>> s1a = Node("sub1A", parent=s1)
+        >>> [path.basename(filename) for filename in DotExporter(root).to_files(".", maxnodes=4)]
+        ['0.dot', '1.dot']
+        >>> print(open("0.dot").read())
+        digraph tree {
+            "root";
+            "sub0" [label="sub0 (+2)", URL="1.dot"];
+            "sub1";
+            "sub1A";
+            "root" -> "sub0";
+            "root" -> "sub1";
+            "sub1" -> "sub1A";
+        }
+        <BLANKLINE>
+        """
+        filenames = []
+        for idx, chunk in _iter_chunks(self.node, maxnodes, "{}.dot", stop=self.stop, maxlevel=self.maxlevel):
+            exporter = copy.copy(self)
+            exporter.node, exporter.stop, exporter.maxlevel = chunk, None, None
+            exporter.maxnodes = exporter.maxchildren = None
+            filename = path.join(dirname, f"{idx}.dot")
+            exporter.to_dotfile(filename)
+            filenames.append(filename)
+        return filenames[-1:] + filenames[:-1]
+
     def to_picture(self, filename):
         """
-        Write graph to a temporary file and invoke `dot`.
+        Write graph to `filename` via `dot`.
 
+        The DOT lines are streamed to `dot` via stdin.
         The output file type is automatically detected from the file suffix.
+        Use :any:`render_many` to render multiple graphs concurrently.
 
         *`graphviz` needs to be installed, before usage of this method.*
         """
         fileformat = path.splitext(filename)[1][1:]
-        with NamedTemporaryFile("wb", delete=False) as dotfile:
-            dotfilename = dotfile.name
-            for line in self:
-                dotfile.write((f"{line}\n").encode())
-            dotfile.flush()
-            cmd = ["dot", dotfilename, "-T", fileformat, "-o", filename]
-            check_call(cmd)
-        try:
-            remove(dotfilename)
-        # pylint: disable=broad-exception-caught
-        except Exception:  # pragma: no cover
-            logging.getLogger(__name__).warning("Could not remove temporary file %s", dotfilename)
+        cmd = ["dot", "-T", fileformat, "-o", str(filename)]
+        with Popen(cmd, stdin=PIPE) as proc:
+            try:
+                for line in self:
+                    proc.stdin.write(f"{line}\n".encode())
+                proc.stdin.close()
+            except BrokenPipeError:  # pragma: no cover
+                # `dot` terminated early - the return code tells why
+                pass
+        if proc.returncode:
+            raise CalledProcessError(proc.returncode, cmd)
 
     @staticmethod
     def esc(value):
         """Escape Strings."""
-        return _RE_ESC.sub(lambda m: rf"\{m.group(0)}", str(value))
+        return str(value).replace("\\", "\\\\").replace('"', '\\"')
+
+
+def _iter_preorder(node, filter_, stop, maxlevel):
+    """Like :any:`PreOrderIter`, without recursion."""
+    if maxlevel is not None and maxlevel < 1:
+        return
+    stack = [iter((node,))]
+    while stack:
+        for item in stack[-1]:
+            if stop and stop(item):
+                continue
+            if filter_(item):
+                yield item
+            children = item.children
+            if children and (maxlevel is None or len(stack) < maxlevel):
+                stack.append(iter(children))
+                break
+        else:
+            stack.pop()
+
+
+def render_many(jobs, workers=None):
+    """
+    Render multiple graphs concurrently via `dot`.
+
+    Args:
+        jobs: Iterable of `(exporter, filename)` pairs. See :any:`DotExporter.to_picture`.
+
+    Keyword Args:
+        workers (int): Maximum number of concurrent `dot` processes.
+                       The number of processors by default.
+
+    Raises the first error of any `dot` process, after all graphs are finished.
+
+    >>> from anytree import Node
+    >>> from anytree.exporter import DotExporter, render_many
+    >>> trees = [Node("root", children=[Node(f"sub{idx}")]) for idx in range(3)]
+    >>> jobs = [(DotExporter(root), f"tree{idx}.png") for idx, root in enumerate(trees)]
+    >>> render_many(jobs, workers=2)  # doctest: +SKIP
+
+    *`graphviz` needs to be installed, before usage of this method.*
+    """
+    with ThreadPoolExecutor(max_workers=workers or cpu_count()) as pool:
+        futures = [pool.submit(exporter.to_picture, filename) for exporter, filename in jobs]
+    for future in futures:
+        future.result()
 
 
 class UniqueDotExporter(DotExporter):
@@ -352,6 +565,13 @@ class UniqueDotExporter(DotExporter):
 
         maxlevel (int): Limit export to this number of levels.
 
+        stream (bool): Emit the edges to the children right after the node itself.
+
+        maxnodes (int): Export a summary with this maximum number of nodes, see :any:`summarize`.
+
+        maxchildren (int): Export a summary with this maximum number of children per node, see :any:`summarize`.
+                           The ``... N more`` nodes are formatted by the defaults, not by custom functions.
+
     >>> from anytree import Node
     >>> root = Node("root")
     >>> s0 = Node("sub0", parent=root)
@@ -426,6 +646,9 @@ class UniqueDotExporter(DotExporter):
         filter_=None,
         stop=None,
         maxlevel=None,
+        stream=False,
+        maxnodes=None,
+        maxchildren=None,
     ):
         super().__init__(
             node,
@@ -440,6 +663,9 @@ class UniqueDotExporter(DotExporter):
             filter_=filter_,
             stop=stop,
             maxlevel=maxlevel,
+            stream=stream,
+            maxnodes=maxnodes,
+            maxchildren=maxchildren,
         )
         self.__node_ids = {}
         self.__node_counter = itertools.count()
@@ -455,4 +681,6 @@ class UniqueDotExporter(DotExporter):
 
     @staticmethod
     def _default_nodeattrfunc(node):
+        if isinstance(node, SummaryNode):
+            return f'label="{node.label}"'
         return f'label="{node.name}"'
@@ -2,6 +2,9 @@ import json
 
 from .dictexporter import DictExporter
 
+_CHUNKSIZE = 1 << 16
+_CHILDREN = object()
+
 
 class JsonExporter:
     """
@@ -67,7 +70,163 @@ class JsonExporter:
         data = self._export(node)
         return json.dumps(data, **self.kwargs)
 
-    def write(self, node, filehandle):
-        """Write JSON to `filehandle` starting at `node`."""
+    def write(self, node, filehandle, stream=False):
+        """
+        Write JSON to `filehandle` starting at `node`.
+
+        By default, the whole tree is converted to a dictionary first.
+        `stream` generates the JSON while walking the tree instead and
+        writes it in chunks of limited size. The output is identical,
+        but the memory consumption does not depend on the tree size.
+
+        >>> from anytree import AnyNode
+        >>> from anytree.exporter import JsonExporter
+        >>> root = AnyNode(a="root")
+        >>> s0 = AnyNode(a="sub0", parent=root)
+        >>> s1 = AnyNode(a="sub1", parent=root)
+        >>> with open("tree.json", "w") as filehandle:
+        ...     JsonExporter(indent=2).write(root, filehandle, stream=True)
+        >>> with open("tree.json") as filehandle:
+        ...     print(filehandle.read())
+        {
+          "a": "root",
+          "children": [
+            {
+              "a": "sub0"
+            },
+            {
+              "a": "sub1"
+            }
+          ]
+        }
+
+        .. note:: Streaming relies on the `encode` method of the JSON encoder for attribute values.
+                  Encoders (`cls`) which override `iterencode` are not supported.
+        """
+        if stream:
+            for chunk in self.__iter_chunks(node):
+                filehandle.write(chunk)
+            return None
         data = self._export(node)
         return json.dump(data, filehandle, **self.kwargs)
+
+    def __iter_chunks(self, node):
+        dictexporter = self.dictexporter or DictExporter()
+        maxlevel = self.maxlevel if self.maxlevel is not None else dictexporter.maxlevel
+        buffer = []
+        size = 0
+        for item in _JsonStream(node, dictexporter, maxlevel, self.kwargs):
+            buffer.append(item)
+            size += len(item)
+            if size >= _CHUNKSIZE:
+                yield "".join(buffer)
+                buffer.clear()
+                size = 0
+        if buffer:
+            yield "".join(buffer)
+
+
+class _JsonStream:
+    """Generate the output of `json.dump()` for the dictionary tree created by `DictExporter` - node by node."""
+
+    def __init__(self, node, dictexporter, maxlevel, kwargs):
+        self.node = node
+        self.maxlevel = maxlevel
+        self.dictcls = dictexporter.dictcls
+        self.attriter = dictexporter.attriter or (lambda attr_values: attr_values)
+        self.childiter = dictexporter.childiter
+        self.iter_attr_values = dictexporter._get_iter_attr_values()
+        kwargs = dict(kwargs)
+        self.encoder = encoder = (kwargs.pop("cls", None) or json.JSONEncoder)(**kwargs)
+        indent = encoder.indent
+        if indent is not None and not isinstance(indent, str):
+            indent = " " * indent
+        self.indent = indent
+
+    def __iter__(self):
+        item_separator = self.encoder.item_separator
+        head, children, tail = self._encode_node(self.node, 1, 0)
+        yield head
+        # every stack item: remaining children, level, JSON level of the children, JSON after the children
+        stack = []
+        if children:
+            stack.append((enumerate(children), 2, 2, tail))
+        else:
+            yield tail
+        while stack:
+            children, level, jsonlevel, tail = stack[-1]
+            for idx, child in children:
+                if idx:
+                    yield item_separator + self._newline(jsonlevel)
+                head, grandchildren, childtail = self._encode_node(child, level, jsonlevel)
+                yield head
+                if grandchildren:
+                    stack.append((enumerate(grandchildren), level + 1, jsonlevel + 2, childtail))
+                    break
+                yield childtail
+            else:
+                stack.pop()
+                yield tail
+
+    def _newline(self, jsonlevel):
+        indent = self.indent
+        if indent is None:
+            return ""
+        return "\n" + indent * jsonlevel
+
+    def _encode_item(self, key, value, jsonlevel):
+        encoder = self.encoder
+        text = encoder.encode(value)
+        if self.indent is not None and "\n" in text:
+            text = text.replace("\n", self._newline(jsonlevel))
+        return f"{encoder.encode(key)}{encoder.key_separator}{text}"
+
+    def _encode_node(self, node, level, jsonlevel):
+        # return the JSON before the children of `node`, the children and the JSON after the children
+        maxlevel = self.maxlevel
+        encoder = self.encoder
+        data = self.dictcls(self.attriter(self.iter_attr_values(node)))
+        children = None
+        if maxlevel is None or level < maxlevel:
+            children = node.children
+            if children:
+                children = list(self.childiter(children))
+            if children:
+                data["children"] = _CHILDREN
+        items = data.items()
+        if encoder.sort_keys:
+            items = sorted(items)
+        head, tail = [], []
+        for key, value in items:
+            name = _convert_key(key, encoder)
+            if name is None:
+                continue
+            if value is _CHILDREN:
+                head.append(f"{encoder.encode(name)}{encoder.key_separator}[{self._newline(jsonlevel + 2)}")
+                tail.append(self._newline(jsonlevel + 1) + "]")
+            elif tail:
+                tail.append(self._encode_item(name, value, jsonlevel + 1))
+            else:
+                head.append(self._encode_item(name, value, jsonlevel + 1))
+        if not head:
+            return "{}", None, ""
+        item_separator = encoder.item_separator + self._newline(jsonlevel + 1)
+        opening = "{" + self._newline(jsonlevel + 1)
+        closing = self._newline(jsonlevel) + "}"
+        if not tail:
+            return opening + item_separator.join(head) + closing, None, ""
+        return opening + item_separator.join(head), children, item_separator.join(tail) + closing
+
+
+def _convert_key(key, encoder):
+    # identical to the key handling of `json.dump()`
+    if isinstance(key, str):
+        return key
+    if isinstance(key, float) or key is True or key is False or key is None:
+        return encoder.encode(key)
+    if isinstance(key, int):
+        return int.__repr__(key)
+    if encoder.skipkeys:
+        return None
+    msg = f"keys must be str, int, float, bool or None, not {key.__class__.__name__}"
+    raise TypeError(msg)
@@ -1,8 +1,10 @@
 import codecs
+import copy
 import itertools
 import re
+from os import path
 
-from anytree import PreOrderIter
+from .summary import SummaryNode, _iter_chunks, _summary_edgefunc, _summary_nodefunc, summarize
 
 _RE_ESC = re.compile(r'["\\]')
 
@@ -27,6 +29,7 @@ class MermaidExporter:
                       The function shall accept one `node` object as
                       argument and return the name of it.
                       Returns a unique identifier by default.
+                      The identifiers are just valid within one export.
 
         nodefunc: Function to decorate a node with attributes.
                       The function shall accept one `node` object as
@@ -50,6 +53,15 @@ class MermaidExporter:
 
         maxlevel (int): Limit export to this number of levels.
 
+        maxnodes (int): Export a summary with this maximum number of nodes, see :any:`summarize`.
+
+        maxchildren (int): Export a summary with this maximum number of children per node, see :any:`summarize`.
+                           The ``... N more`` nodes are formatted by the defaults, not by custom functions.
+
+        stream (bool): Emit the edges to the children right after the node itself.
+                       The tree is traversed once in both cases, but `stream` does not collect the edges
+                       and just keeps the names of the pending nodes.
+
     >>> from anytree import Node
     >>> root = Node("root")
     >>> s0 = Node("sub0", parent=root, edge=2)
@@ -117,6 +129,32 @@ class MermaidExporter:
     N4--8-->N6
     N4--22-->N7
     N7--42-->N8
+
+    Edges directly follow their node with `stream`:
+
+    >>> for line in MermaidExporter(s0, stream=True):
+    ...     print(line)
+    graph TD
+    N0["sub0"]
+    N0-->N1
+    N0-->N2
+    N1["sub0B"]
+    N2["sub0A"]
+
+    Huge trees are summarised with a node budget:
+
+    >>> for line in MermaidExporter(root, maxnodes=5, maxchildren=2):
+    ...     print(line)
+    graph TD
+    N0["root"]
+    N1["sub0"]
+    N2["sub0B"]
+    N3["sub0A"]
+    N4["sub1 (+4)"]
+    N0-->N1
+    N0-->N4
+    N1-->N2
+    N1-->N3
     """
 
     def __init__(
@@ -132,6 +170,9 @@ class MermaidExporter:
         filter_=None,
         stop=None,
         maxlevel=None,
+        maxnodes=None,
+        maxchildren=None,
+        stream=False,
     ):
         self.node = node
         self.graph = graph
@@ -144,13 +185,19 @@ class MermaidExporter:
         self.filter_ = filter_
         self.stop = stop
         self.maxlevel = maxlevel
+        self.maxnodes = maxnodes
+        self.maxchildren = maxchildren
+        self.stream = stream
         self.__node_ids = {}
         self.__node_counter = itertools.count()
 
     def __iter__(self):
         # prepare
         indent = " " * self.indent
-        nodenamefunc = self.nodenamefunc or self._default_nodenamefunc
+        nodenamefunc = self.nodenamefunc
+        if nodenamefunc is None and type(self)._default_nodenamefunc is not MermaidExporter._default_nodenamefunc:
+            # overwritten by a subclass
+            nodenamefunc = self._default_nodenamefunc
         nodefunc = self.nodefunc or self._default_nodefunc
         edgefunc = self.edgefunc or self._default_edgefunc
         filter_ = self.filter_ or (lambda node: True)
@@ -159,6 +206,12 @@ class MermaidExporter:
 
     # pylint: disable=arguments-differ
     def _default_nodenamefunc(self, node):
+        """
+        Unique identifier of `node` for all exports of this exporter.
+
+        Without `nodenamefunc`, the exports number their nodes on their own instead,
+        unless a subclass overwrites this method.
+        """
         node_id = id(node)
         try:
             num = self.__node_ids[node_id]
@@ -169,7 +222,8 @@ class MermaidExporter:
     @staticmethod
     def _default_nodefunc(node):
         # pylint: disable=W0613
-        return f'["{MermaidExporter.esc(node.name)}"]'
+        name = node.label if isinstance(node, SummaryNode) else node.name
+        return f'["{MermaidExporter.esc(name)}"]'
 
     @staticmethod
     def _default_edgefunc(node, child):
@@ -179,8 +233,22 @@ class MermaidExporter:
     def __iter(self, indent, nodenamefunc, nodefunc, edgefunc, filter_, stop):
         yield f"{self.graph} {self.name}"
         yield from self.__iter_options(indent)
-        yield from self.__iter_nodes(indent, nodenamefunc, nodefunc, filter_, stop)
-        yield from self.__iter_edges(indent, nodenamefunc, edgefunc, filter_, stop)
+        node = self.node
+        if self.maxnodes is not None or self.maxchildren is not None:
+            node = summarize(node, maxnodes=self.maxnodes, maxchildren=self.maxchildren)
+            # `... N more` nodes do not have any attribute of the summarised nodes, which custom functions could read
+            if nodenamefunc:
+                namefunc = nodenamefunc
+                nodenamefunc = _summary_nodefunc(namefunc, lambda more: f"{namefunc(more.parent)}_more")
+            if self.nodefunc:
+                nodefunc = _summary_nodefunc(nodefunc, self._default_nodefunc)
+            if self.edgefunc:
+                edgefunc = _summary_edgefunc(edgefunc, self._default_edgefunc)
+            if self.filter_:
+                filter_ = _summary_nodefunc(filter_, lambda more: True)
+            if self.stop:
+                stop = _summary_nodefunc(stop, lambda more: False)
+        yield from self.__iter_tree(node, indent, nodenamefunc, nodefunc, edgefunc, filter_, stop)
 
     def __iter_options(self, indent):
         options = self.options
@@ -188,20 +256,56 @@ class MermaidExporter:
             for option in options:
                 yield f"{indent}{option}"
 
-    def __iter_nodes(self, indent, nodenamefunc, nodefunc, filter_, stop):
-        for node in PreOrderIter(self.node, filter_=filter_, stop=stop, maxlevel=self.maxlevel):
-            nodename = nodenamefunc(node)
+    def __iter_tree(self, root, indent, nodenamefunc, nodefunc, edgefunc, filter_, stop):
+        # pylint: disable=too-many-arguments
+        # One pre-order traversal. The node names, including the generated identifiers,
+        # just live in the scope of this export and every name is determined once.
+        # Without `stream`, the edges are collected and emitted after all nodes.
+        # With `stream`, a name is released once its node has been emitted.
+        stream, maxlevel = self.stream, self.maxlevel
+        counter = itertools.count()
+        names = {}
+        edges = []
+
+        def getname(node):
+            key = id(node)
+            name = names.get(key)
+            if name is None:
+                name = names[key] = nodenamefunc(node) if nodenamefunc else f"N{next(counter)}"
+            return name
+
+        def iter_node(node, children):
+            """Emit the node and emit or collect the edges to `children`."""
+            nodename = getname(node)
+            if stream:
+                del names[id(node)]
             yield f"{indent}{nodename}{nodefunc(node)}"
-
-    def __iter_edges(self, indent, nodenamefunc, edgefunc, filter_, stop):
-        maxlevel = self.maxlevel - 1 if self.maxlevel else None
-        for node in PreOrderIter(self.node, filter_=filter_, stop=stop, maxlevel=maxlevel):
-            nodename = nodenamefunc(node)
-            for child in node.children:
+            if isinstance(node, SummaryNode) and node.link:
+                yield f'{indent}click {nodename} href "{MermaidExporter.esc(node.link)}"'
+            for child in children:
                 if filter_(child) and not stop(child):
-                    childname = nodenamefunc(child)
-                    edge = edgefunc(node, child)
-                    yield f"{indent}{nodename}{edge}{childname}"
+                    if stream:
+                        yield f"{indent}{nodename}{edgefunc(node, child)}{getname(child)}"
+                    else:
+                        edges.append((nodename, edgefunc(node, child), child))
+
+        stack = [] if maxlevel is not None and maxlevel < 1 else [iter((root,))]
+        while stack:
+            level = len(stack)
+            for node in stack[-1]:
+                if stop(node):
+                    continue
+                children = node.children
+                expand = children and (maxlevel is None or level < maxlevel)
+                if filter_(node):
+                    yield from iter_node(node, children if expand else ())
+                if expand:
+                    stack.append(iter(children))
+                    break
+            else:
+                stack.pop()
+        for nodename, edge, child in edges:
+            yield f"{indent}{nodename}{edge}{getname(child)}"
 
     def to_file(self, filename):
         """
@@ -227,6 +331,49 @@ class MermaidExporter:
                 file.write(f"{line}\n")
             file.write("```")
 
+    def to_files(self, dirname, maxnodes):
+        """
+        Write graph split into chunks with at most `maxnodes` nodes to the directory `dirname`.
+
+        Every chunk is written to ``<idx>.md``, starting with ``0.md`` for the chunk with the root node.
+        Subtrees in other chunks are represented by one stub node, which links to the chunk file via `click`.
+        The chunks are determined in one traversal and written once they are complete.
+
+        Returns the list of written files, with ``0.md`` first.
+
+        >>> from anytree import Node
+        >>> from anytree.exporter import MermaidExporter
+        >>> root = Node("root")
+        >>> s0 = Node("sub0", parent=root)
+        >>> s0b = Node("sub0B", parent=s0)
+        >>> s0a = Node("sub0A", parent=s0)
+        >>> s1 = Node("sub1", parent=root)
+        >>> s1a = Node("sub1A", parent=s1)
+        >>> [path.basename(filename) for filename in MermaidExporter(root).to_files(".", maxnodes=4)]
+        ['0.md', '1.md']
+        >>> print(open("0.md").read())
+        ```mermaid
+        graph TD
+        N0["root"]
+        N1["sub0 (+2)"]
+        click N1 href "1.md"
+        N2["sub1"]
+        N3["sub1A"]
+        N0-->N1
+        N0-->N2
+        N2-->N3
+        ```
+        """
+        filenames = []
+        for idx, chunk in _iter_chunks(self.node, maxnodes, "{}.md", stop=self.stop, maxlevel=self.maxlevel):
+            exporter = copy.copy(self)
+            exporter.node, exporter.stop, exporter.maxlevel = chunk, None, None
+            exporter.maxnodes = exporter.maxchildren = None
+            filename = path.join(dirname, f"{idx}.md")
+            exporter.to_file(filename)
+            filenames.append(filename)
+        return filenames[-1:] + filenames[:-1]
+
     @staticmethod
     def esc(value):
         """Escape Strings."""
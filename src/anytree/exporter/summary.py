@@ -0,0 +1,220 @@
+import itertools
+from collections import deque
+
+from anytree.node import NodeMixin
+
+
+class SummaryNode(NodeMixin):
+    """
+    Node of a summarised tree, see :any:`summarize`.
+
+    Any attribute access is forwarded to the summarised `node`.
+
+    Args:
+        node: Summarised node. `None` for a ``... N more`` node standing for hidden sibling nodes.
+              Such a node does not have any attribute of the summarised nodes.
+
+    Keyword Args:
+        hidden (int): Number of hidden nodes: the descendants of a collapsed `node`
+                      or all nodes of the hidden sibling subtrees.
+        more (int): Number of hidden sibling nodes.
+        link (str): File, which continues the tree at `node`.
+        parent: Reference to parent node.
+    """
+
+    def __init__(self, node, hidden=0, more=0, link=None, parent=None):
+        self.node = node
+        self.hidden = hidden
+        self.more = more
+        self.link = link
+        self.parent = parent
+
+    def __getattr__(self, name):
+        node = self.__dict__.get("node")
+        if name.startswith("_") or node is None:
+            msg = f"{self.__class__.__name__!r} object has no attribute {name!r}"
+            raise AttributeError(msg)
+        return getattr(node, name)
+
+    @property
+    def name(self):
+        """Name of `node` or ``... N more``."""
+        if self.node is None:
+            return f"... {self.more:,} more"
+        return self.node.name
+
+    @property
+    def label(self):
+        """`name` with the number of hidden nodes."""
+        if self.node is None:
+            nodes = "1 node" if self.hidden == 1 else f"{self.hidden:,} nodes"
+            return f"{self.name} ({nodes})"
+        if not self.hidden:
+            return str(self.name)
+        return f"{self.name} (+{self.hidden})"
+
+    def __repr__(self):
+        args = [repr(self.node)]
+        if self.hidden:
+            args.append(f"hidden={self.hidden!r}")
+        if self.more:
+            args.append(f"more={self.more!r}")
+        if self.link:
+            args.append(f"link={self.link!r}")
+        return f"{self.__class__.__name__}({', '.join(args)})"
+
+
+def summarize(node, maxnodes=None, maxchildren=None):
+    """
+    Return a summarised copy of the tree starting at `node` with :any:`SummaryNode` objects.
+
+    The tree is expanded level by level, as long as the node budget `maxnodes` allows.
+    The children of a node are shown all together or not at all: a node, whose children do not fit,
+    is collapsed and reports the number of its descendants as `hidden`.
+    Beyond `maxchildren` children, the remaining children are replaced by one ``... N more`` node.
+    The subtree sizes are determined in one bottom-up pass. Apart from that,
+    the effort just depends on `maxnodes`, so arbitrarily large trees result in bounded summaries.
+
+    Args:
+        node: Root node.
+
+    Keyword Args:
+        maxnodes (int): Maximum number of nodes in the summary, at least the root node.
+        maxchildren (int): Maximum number of children per node, including a ``... N more`` node.
+
+    >>> from anytree import Node, RenderTree
+    >>> from anytree.exporter import summarize
+    >>> root = Node("root")
+    >>> s0 = Node("sub0", parent=root)
+    >>> s0b = Node("sub0B", parent=s0)
+    >>> s0a = Node("sub0A", parent=s0)
+    >>> s1 = Node("sub1", parent=root)
+    >>> s1s = [Node(f"sub1{char}", parent=s1) for char in "ABCDEF"]
+    >>> s1ca = Node("sub1Ca", parent=s1s[2])
+    >>> for row in RenderTree(summarize(root, maxnodes=8, maxchildren=3)):
+    ...     print(f"{row.pre}{row.node.label}")
+    root
+    ├── sub0
+    │   ├── sub0B
+    │   └── sub0A
+    └── sub1
+        ├── sub1A
+        ├── sub1B
+        └── ... 4 more (5 nodes)
+    >>> for row in RenderTree(summarize(root, maxnodes=7, maxchildren=3)):
+    ...     print(f"{row.pre}{row.node.label}")
+    root
+    ├── sub0
+    │   ├── sub0B
+    │   └── sub0A
+    └── sub1 (+7)
+    """
+    sizes = _get_sizes(node)
+    budget = float("inf") if maxnodes is None else maxnodes - 1
+    summary = SummaryNode(node)
+    queue = deque([summary])
+    while queue:
+        parent = queue.popleft()
+        children = parent.node.children
+        if not children:
+            continue
+        shown = children
+        if maxchildren is not None and len(children) > maxchildren:
+            shown = children[: max(maxchildren - 1, 0)]
+        needed = len(shown) + (len(shown) < len(children))
+        if needed > budget:
+            parent.hidden = sizes[id(parent.node)] - 1
+            continue
+        budget -= needed
+        queue.extend(SummaryNode(child, parent=parent) for child in shown)
+        if len(shown) < len(children):
+            hidden = children[len(shown) :]
+            SummaryNode(None, hidden=sum(sizes[id(child)] for child in hidden), more=len(hidden), parent=parent)
+    return summary
+
+
+def _is_more(node):
+    return isinstance(node, SummaryNode) and node.node is None
+
+
+def _summary_nodefunc(func, morefunc):
+    """Return `func`, which calls `morefunc` for ``... N more`` nodes instead."""
+
+    def nodefunc(node):
+        return morefunc(node) if _is_more(node) else func(node)
+
+    return nodefunc
+
+
+def _summary_edgefunc(func, morefunc):
+    """Return `func`, which calls `morefunc` for edges to ``... N more`` nodes instead."""
+
+    def edgefunc(node, child):
+        return morefunc(node, child) if _is_more(child) else func(node, child)
+
+    return edgefunc
+
+
+def _first_hidden(more):
+    """First sibling node hidden by the ``... N more`` node `more`."""
+    parent = more.parent
+    return parent.node.children[len(parent.children) - 1]
+
+
+def _iter_chunks(node, maxnodes, link, stop=None, maxlevel=None):
+    """
+    Split the tree starting at `node` into chunks with at most `maxnodes` nodes.
+
+    Yields `(idx, chunk)` pairs, where `chunk` is a tree of :any:`SummaryNode` objects.
+    A subtree, which has been moved to another chunk, is replaced by a stub node with
+    the number of the moved nodes as `hidden` and ``link.format(idx)`` as `link`.
+    All chunks are generated in one post-order traversal and yielded once they are complete.
+    The chunk with the root node has the index ``0`` and comes last.
+    Just nodes with more than ``maxnodes - 1`` children result in larger chunks.
+    """
+    if (maxlevel is not None and maxlevel < 1) or (stop and stop(node)):
+        return
+    counter = itertools.count(1)
+    # node, children iterator, (proxy, pending nodes, size) of the finished children
+    stack = [(node, iter(node.children), [])]
+    while stack:
+        parent, children, done = stack[-1]
+        for child in children:
+            if not stop or not stop(child):
+                expand = maxlevel is None or len(stack) + 1 < maxlevel
+                stack.append((child, iter(child.children if expand else ()), []))
+                break
+        else:
+            stack.pop()
+            pending = 1 + sum(item[1] for item in done)
+            size = 1 + sum(item[2] for item in done)
+            # move the largest pending subtrees into chunks of their own
+            for pos in sorted(range(len(done)), key=lambda pos: done[pos][1], reverse=True):
+                proxy, childpending, childsize = done[pos]
+                if pending <= maxnodes or childpending == 1:
+                    break
+                idx = next(counter)
+                yield idx, proxy
+                done[pos] = SummaryNode(proxy.node, hidden=childsize - 1, link=link.format(idx)), 1, childsize
+                pending -= childpending - 1
+            proxy = SummaryNode(parent)
+            proxy.children = [item[0] for item in done]
+            if stack:
+                stack[-1][2].append((proxy, pending, size))
+            else:
+                yield 0, proxy
+
+
+def _get_sizes(node):
+    # subtree sizes in post-order, without recursion
+    sizes = {}
+    stack = [(node, iter(node.children))]
+    while stack:
+        parent, children = stack[-1]
+        for child in children:
+            stack.append((child, iter(child.children)))
+            break
+        else:
+            stack.pop()
+            sizes[id(parent)] = 1 + sum(sizes[id(child)] for child in parent.children)
+    return sizes
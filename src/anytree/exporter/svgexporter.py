@@ -0,0 +1,170 @@
+import codecs
+import html
+
+from anytree.layout import TidyLayout
+
+
+class SvgExporter:
+    """
+    SVG Exporter.
+
+    The tree is placed by :any:`TidyLayout` and written as SVG directly, without any external tool.
+    The effort is linear with the tree size.
+
+    Args:
+        node (Node): start node.
+
+    Keyword Args:
+        nodenamefunc: Function to extract node name from `node` object.
+                      The function shall accept one `node` object as
+                      argument and return the name of it.
+                      Returns ``node.name`` by default.
+
+        nodeattrfunc: Function to decorate the node box with SVG attributes.
+                      The function shall accept one `node` object as
+                      argument and return the attributes, like ``fill="yellow"``.
+                      Returns `None` by default.
+
+        childiter: Child iterator.
+
+        maxlevel (int): Limit export to this number of levels.
+
+        fontsize (int): Font size in pixels. All other dimensions are derived from it.
+
+        indent (int): number of spaces for indent.
+
+    >>> from anytree import Node
+    >>> root = Node("root")
+    >>> s0 = Node("sub0", parent=root)
+    >>> s0b = Node("sub0B", parent=s0)
+    >>> s0a = Node("sub0A", parent=s0)
+    >>> s1 = Node("sub1", parent=root)
+
+    >>> from anytree.exporter import SvgExporter
+    >>> for line in SvgExporter(root, nodeattrfunc=lambda node: 'fill="yellow"' if node.is_leaf else None):
+    ...     print(line)
+    <svg xmlns="http://www.w3.org/2000/svg" width="175" height="154" viewBox="0 0 175 154">
+      <g fill="none" stroke="black">
+        <path d="M105 35V49H70V63"/>
+        <path d="M70 91V105H35V119"/>
+        <path d="M70 91V105H105V119"/>
+        <path d="M105 35V49H140V63"/>
+      </g>
+      <g fill="white" stroke="black">
+        <rect x="77" y="7" width="56" height="28" rx="4"/>
+        <rect x="42" y="63" width="56" height="28" rx="4"/>
+        <rect x="7" y="119" width="56" height="28" rx="4" fill="yellow"/>
+        <rect x="77" y="119" width="56" height="28" rx="4" fill="yellow"/>
+        <rect x="112" y="63" width="56" height="28" rx="4" fill="yellow"/>
+      </g>
+      <g font-family="monospace" font-size="14" text-anchor="middle" dominant-baseline="central">
+        <text x="105" y="21">root</text>
+        <text x="70" y="77">sub0</text>
+        <text x="35" y="133">sub0B</text>
+        <text x="105" y="133">sub0A</text>
+        <text x="140" y="77">sub1</text>
+      </g>
+    </svg>
+    """
+
+    def __init__(
+        self, node, nodenamefunc=None, nodeattrfunc=None, childiter=list, maxlevel=None, fontsize=14, indent=2
+    ):
+        self.node = node
+        self.nodenamefunc = nodenamefunc
+        self.nodeattrfunc = nodeattrfunc
+        self.childiter = childiter
+        self.maxlevel = maxlevel
+        self.fontsize = fontsize
+        self.indent = indent
+
+    def __iter__(self):
+        # prepare
+        nodenamefunc = self.nodenamefunc or self._default_nodenamefunc
+        nodeattrfunc = self.nodeattrfunc or self._default_nodeattrfunc
+        return self.__iter(nodenamefunc, nodeattrfunc)
+
+    @staticmethod
+    def _default_nodenamefunc(node):
+        return node.name
+
+    @staticmethod
+    def _default_nodeattrfunc(node):
+        # pylint: disable=unused-argument
+        return None
+
+    def __iter(self, nodenamefunc, nodeattrfunc):
+        positions = list(TidyLayout(self.node, childiter=self.childiter, maxlevel=self.maxlevel))
+        names = [str(nodenamefunc(node)) for node, _, _ in positions]
+        # geometry
+        fontsize = self.fontsize
+        charwidth = 0.6 * fontsize
+        boxwidth = max((len(name) for name in names), default=0) * charwidth + fontsize
+        boxheight = 2 * fontsize
+        margin = fontsize / 2
+        xunit = boxwidth + fontsize
+        yunit = 4 * fontsize
+        width = max((x for _, x, _ in positions), default=0) * xunit + boxwidth + 2 * margin
+        height = max((y for _, _, y in positions), default=0) * yunit + boxheight + 2 * margin
+        offsetx, offsety = margin + boxwidth / 2, margin + boxheight / 2
+        centers = {id(node): (offsetx + x * xunit, offsety + y * yunit) for node, x, y in positions}
+
+        indent = " " * self.indent
+        num, esc = _num, SvgExporter.esc
+        yield (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{num(width)}" height="{num(height)}" '
+            f'viewBox="0 0 {num(width)} {num(height)}">'
+        )
+        yield f'{indent}<g fill="none" stroke="black">'
+        halfheight = boxheight / 2
+        for node, _, _ in positions[1:]:
+            parentx, parenty = centers[id(node.parent)]
+            childx, childy = centers[id(node)]
+            bottom, top = parenty + halfheight, childy - halfheight
+            middle = (bottom + top) / 2
+            yield f'{indent * 2}<path d="M{num(parentx)} {num(bottom)}V{num(middle)}H{num(childx)}V{num(top)}"/>'
+        yield f"{indent}</g>"
+        yield f'{indent}<g fill="white" stroke="black">'
+        for node, _, _ in positions:
+            centerx, centery = centers[id(node)]
+            nodeattr = nodeattrfunc(node)
+            nodeattr = f" {nodeattr}" if nodeattr is not None else ""
+            yield (
+                f'{indent * 2}<rect x="{num(centerx - boxwidth / 2)}" y="{num(centery - halfheight)}" '
+                f'width="{num(boxwidth)}" height="{num(boxheight)}" rx="4"{nodeattr}/>'
+            )
+        yield f"{indent}</g>"
+        yield (
+            f'{indent}<g font-family="monospace" font-size="{num(fontsize)}" '
+            'text-anchor="middle" dominant-baseline="central">'
+        )
+        for (node, _, _), name in zip(positions, names):
+            centerx, centery = centers[id(node)]
+            yield f'{indent * 2}<text x="{num(centerx)}" y="{num(centery)}">{esc(name)}</text>'
+        yield f"{indent}</g>"
+        yield "</svg>"
+
+    def to_file(self, filename):
+        """
+        Write SVG to `filename`.
+
+        >>> from anytree import Node
+        >>> root = Node("root")
+        >>> s0 = Node("sub0", parent=root)
+        >>> s1 = Node("sub1", parent=root)
+
+        >>> from anytree.exporter import SvgExporter
+        >>> SvgExporter(root).to_file("tree.svg")
+        """
+        with codecs.open(filename, "w", "utf-8") as file:
+            for line in self:
+                file.write(f"{line}\n")
+
+    @staticmethod
+    def esc(value):
+        """Escape Strings."""
+        return html.escape(str(value))
+
+
+def _num(value):
+    return f"{value:.2f}".rstrip("0").rstrip(".")
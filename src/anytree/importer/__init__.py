@@ -1,9 +1,13 @@
 """Importer."""
 
+from .adjacencyimporter import AdjacencyImporter
+from .binaryimporter import BinaryImporter
 from .dictimporter import DictImporter
 from .jsonimporter import JsonImporter
 
 __all__ = [
+    "AdjacencyImporter",
+    "BinaryImporter",
     "DictImporter",
     "JsonImporter",
 ]
@@ -0,0 +1,136 @@
+import csv
+
+from anytree import AnyNode, LoopError, TreeError
+
+
+class AdjacencyImporter:
+    """
+    Import Tree from an adjacency list.
+
+    Every row describes one node by its id and the id of its parent node,
+    like a database table with a parent id column.
+    Every row is converted to an instance of `nodecls`.
+    All columns, except the parent id, become node attributes.
+    The row with an empty parent id (`None` or `""`) is the root node.
+
+    Keyword Args:
+        nodecls: class used for nodes.
+        idname (str): Name of the column with the node id.
+        parentidname (str): Name of the column with the parent node id.
+        fieldnames: Column names for rows given as sequences instead of mappings.
+
+    >>> from anytree.importer import AdjacencyImporter
+    >>> from anytree import RenderTree
+    >>> importer = AdjacencyImporter()
+    >>> rows = [
+    ...     {"id": 2, "parent_id": 1, "a": "sub0"},
+    ...     {"id": 3, "parent_id": 2, "a": "sub0A"},
+    ...     {"id": 1, "parent_id": None, "a": "root"},
+    ...     {"id": 4, "parent_id": 1, "a": "sub1"},
+    ... ]
+    >>> root = importer.import_(rows)
+    >>> print(RenderTree(root))
+    AnyNode(a='root', id=1)
+    ├── AnyNode(a='sub0', id=2)
+    │   └── AnyNode(a='sub0A', id=3)
+    └── AnyNode(a='sub1', id=4)
+
+    The rows may be in any order. The children keep the order of their rows.
+    Rows, which do not belong to the tree, are reported:
+
+    >>> importer.import_([{"id": 1, "parent_id": None}, {"id": 2, "parent_id": 5}])
+    Traceback (most recent call last):
+        ...
+    anytree.node.exceptions.TreeError: Node id=2 refers to unknown parent id=5.
+    >>> importer.import_([{"id": 1, "parent_id": None}, {"id": 2, "parent_id": 3}, {"id": 3, "parent_id": 2}])
+    Traceback (most recent call last):
+        ...
+    anytree.node.exceptions.LoopError: Node id=2 is part of a loop.
+    """
+
+    def __init__(self, nodecls=AnyNode, idname="id", parentidname="parent_id", fieldnames=None):
+        self.nodecls = nodecls
+        self.idname = idname
+        self.parentidname = parentidname
+        self.fieldnames = fieldnames
+
+    def import_(self, rows):
+        """Import tree from iterable `rows`."""
+        return self.__import(rows, self.fieldnames)
+
+    def read(self, filehandle, **kwargs):
+        r"""
+        Read CSV from `filehandle`.
+
+        The first line is the header with the column names, if `fieldnames` is not set.
+        All values are strings. The root node has an empty parent id.
+        `kwargs` are passed to :any:`csv.DictReader`.
+
+        >>> from anytree.importer import AdjacencyImporter
+        >>> from anytree import RenderTree
+        >>> with open("tree.csv", "w") as filehandle:
+        ...     _ = filehandle.write("id,parent_id,a\n1,,root\n2,1,sub0\n3,1,sub1\n")
+        >>> with open("tree.csv", newline="") as filehandle:
+        ...     root = AdjacencyImporter().read(filehandle)
+        >>> print(RenderTree(root))
+        AnyNode(a='root', id='1')
+        ├── AnyNode(a='sub0', id='2')
+        └── AnyNode(a='sub1', id='3')
+        """
+        return self.__import(csv.DictReader(filehandle, fieldnames=self.fieldnames, **kwargs), None)
+
+    def __import(self, rows, fieldnames):
+        idname, parentidname = self.idname, self.parentidname
+        nodecls = self.nodecls
+        nodes = {}
+        # fix-up table: parent id -> ids of all children, in row order
+        childids = {}
+        parentids = {}
+        rootids = []
+        for row in rows:
+            attrs = dict(zip(fieldnames, row)) if fieldnames is not None else dict(row)
+            parentid = attrs.pop(parentidname, None)
+            nodeid = attrs[idname]
+            if nodeid in nodes:
+                msg = f"Duplicate node {idname}={nodeid!r}."
+                raise TreeError(msg)
+            nodes[nodeid] = nodecls(**attrs)
+            if parentid is None or parentid == "":
+                rootids.append(nodeid)
+            else:
+                parentids[nodeid] = parentid
+                childids.setdefault(parentid, []).append(nodeid)
+        if len(rootids) != 1:
+            msg = f"Expected one root node, but got {len(rootids)}: {rootids!r}."
+            raise TreeError(msg)
+        # all nodes reachable from the root, in breadth-first order
+        order = rootids
+        for nodeid in order:
+            order.extend(childids.get(nodeid, ()))
+        if len(order) != len(nodes):
+            self.__check(nodes, parentids, order)
+        # Attach the children deepest first: every parent is still a root and the loop check stays cheap.
+        for nodeid in reversed(order):
+            ids = childids.get(nodeid)
+            if ids:
+                nodes[nodeid].children = [nodes[childid] for childid in ids]
+        return nodes[order[0]]
+
+    def __check(self, nodes, parentids, order):
+        reached = set(order)
+        for nodeid in nodes:
+            if nodeid not in reached:
+                parentid = parentids[nodeid]
+                if parentid not in nodes:
+                    msg = f"Node {self.idname}={nodeid!r} refers to unknown parent {self.idname}={parentid!r}."
+                    raise TreeError(msg)
+        # every unreached node has a known parent - so it must be part of, or hang below, a loop
+        for nodeid in nodes:
+            if nodeid not in reached:
+                seen = set()
+                loopid = nodeid
+                while loopid not in seen:
+                    seen.add(loopid)
+                    loopid = parentids[loopid]
+                msg = f"Node {self.idname}={loopid!r} is part of a loop."
+                raise LoopError(msg)
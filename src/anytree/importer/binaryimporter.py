@@ -0,0 +1,149 @@
+import gc
+import pickle
+from collections import Counter, deque
+from itertools import accumulate, compress, repeat
+from operator import setitem
+
+from anytree import _binaryformat
+from anytree.node import LightNodeMixin, NodeMixin
+from anytree.node.util import _slotnames
+
+
+class BinaryImporter:
+    """
+    Import Tree from the compact binary format written by :any:`BinaryExporter`.
+
+    All nodes are created in bulk: `__init__` is not called, the attributes and the
+    tree links are set directly. The garbage collector is paused meanwhile.
+
+    >>> from anytree import Node, RenderTree
+    >>> from anytree.exporter import BinaryExporter
+    >>> from anytree.importer import BinaryImporter
+    >>> root = Node("root")
+    >>> s0 = Node("sub0", parent=root, size=1.5)
+    >>> s1 = Node("sub1", parent=root, size=2.0, tags=["a", "b"])
+    >>> data = BinaryExporter().export(root)
+    >>> root = BinaryImporter().import_(data)
+    >>> print(RenderTree(root))
+    Node('/root')
+    ├── Node('/root/sub0', size=1.5)
+    └── Node('/root/sub1', size=2.0, tags=['a', 'b'])
+
+    .. warning:: Loading a file imports the modules of the stored node classes and unpickles
+                 attribute values of other types than `int`, `float`, `bool` and `str`.
+                 Both can execute arbitrary code. Never load data from untrusted sources.
+    """
+
+    def import_(self, data):
+        """Import tree from `data` (bytes or any other buffer)."""
+        layout = _binaryformat.Layout(data)
+        # Millions of new objects would trigger many useless collections.
+        gcenabled = gc.isenabled()
+        gc.disable()
+        try:
+            return self.__import(layout)
+        finally:
+            if gcenabled:
+                gc.enable()
+
+    def read(self, filehandle):
+        """Read tree from binary `filehandle`."""
+        return self.import_(filehandle.read())
+
+    def __import(self, layout):
+        count = layout.count
+        classes = layout.classes()
+        prefixes = [_get_prefix(cls) for cls in classes]
+        if len(classes) == 1:
+            cls = classes[0]
+            nodes = list(map(cls.__new__, repeat(cls, count)))
+        else:
+            nodes = [cls.__new__(cls) for cls in map(classes.__getitem__, layout.section("class").tolist())]
+
+        # parent nodes
+        parents = layout.section("parent").tolist()
+        parentnodes = list(map(nodes.__getitem__, parents))
+        parentnodes[0] = None
+        # children lists - for non-leaf nodes only
+        # pre-order: a stable sort by parent index groups the children in their order
+        childnodes = list(map(nodes.__getitem__, sorted(range(1, count), key=parents.__getitem__)))
+        childcounts = [0] * count
+        for parentidx, childcount in Counter(parents[1:]).items():
+            childcounts[parentidx] = childcount
+        childstart = list(accumulate(childcounts, initial=0))
+        parentidxs = list(compress(range(count), childcounts))
+        childlists = map(
+            childnodes.__getitem__, map(slice, compress(childstart, childcounts), compress(childstart[1:], childcounts))
+        )
+
+        columns = {}
+        sparse = []
+        tables = {}
+        for name, (type_, full) in layout.columns.items():
+            data = layout.section(f"column.{name}")
+            if full:
+                columns[name] = _decode(layout, tables, nodes, type_, data.tolist())
+            else:
+                idxs = list(compress(range(count), layout.section(f"present.{name}")))
+                sparse.append((name, idxs, _decode(layout, tables, nodes, type_, [data[idx] for idx in idxs])))
+
+        if len(classes) == 1 and issubclass(cls, NodeMixin) and not _slotnames(cls):
+            # fast path: fill the instance dictionaries
+            dicts = list(map(vars, nodes))
+            _set_items(dicts, prefixes[0], columns, sparse, parentnodes, parentidxs, childlists)
+        else:
+            _set_attrs(nodes, classes, prefixes, columns, sparse, parentnodes, parentidxs, childlists)
+        return nodes[0]
+
+
+def _set_items(dicts, prefix, columns, sparse, parentnodes, parentidxs, childlists):
+    for name, values in columns.items():
+        _consume(map(setitem, dicts, repeat(name), values))
+    _consume(map(setitem, dicts, repeat(f"{prefix}parent"), parentnodes))
+    _consume(map(setitem, map(dicts.__getitem__, parentidxs), repeat(f"{prefix}children"), childlists))
+    for name, idxs, values in sparse:
+        _consume(map(setitem, map(dicts.__getitem__, idxs), repeat(name), values))
+
+
+def _set_attrs(nodes, classes, prefixes, columns, sparse, parentnodes, parentidxs, childlists):
+    # pylint: disable=too-many-arguments
+    setattr_ = object.__setattr__
+    for name, values in columns.items():
+        _consume(map(setattr_, nodes, repeat(name), values))
+    for name, idxs, values in sparse:
+        _consume(map(setattr_, map(nodes.__getitem__, idxs), repeat(name), values))
+    nodeprefixes = [prefixes[classes.index(type(node))] for node in nodes]
+    for node, prefix, parent in zip(nodes, nodeprefixes, parentnodes):
+        setattr_(node, f"{prefix}parent", parent)
+    for idx, children in zip(parentidxs, childlists):
+        setattr_(nodes[idx], f"{nodeprefixes[idx]}children", children)
+
+
+def _get_prefix(cls):
+    if issubclass(cls, NodeMixin):
+        return "_NodeMixin__"
+    if issubclass(cls, LightNodeMixin):
+        return "_LightNodeMixin__"
+    msg = f"{cls!r} is not a node class."
+    raise TypeError(msg)
+
+
+def _decode(layout, tables, nodes, type_, data):
+    if type_ == "str":
+        if "strings" not in tables:
+            tables["strings"] = layout.strings()
+        return list(map(tables["strings"].__getitem__, data))
+    if type_ == "object":
+        if "objects" not in tables:
+            tables["objects"] = layout.table("objects")
+        objects = tables["objects"]
+        return [pickle.loads(objects[idx]) for idx in data]
+    if type_ == "node":
+        return list(map(nodes.__getitem__, data))
+    if type_ == "bool":
+        return list(map(bool, data))
+    return data
+
+
+def _consume(iterator):
+    deque(iterator, maxlen=0)
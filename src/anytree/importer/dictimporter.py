@@ -1,5 +1,6 @@
-from anytree import AnyNode
+from anytree import AnyNode, SharedNode
 from anytree.config import ASSERTIONS
+from anytree.sharing import _get_shared
 
 
 class DictImporter:
@@ -12,6 +13,10 @@ class DictImporter:
 
     Keyword Args:
         nodecls: class used for nodes.
+        intern (bool): Share identical subtrees, see :any:`intern_subtrees`.
+
+    The nodes are created bottom-up: the children are created first and
+    handed over to their parent node at once. Deep trees are imported without recursion.
 
     >>> from anytree.importer import DictImporter
     >>> from anytree import RenderTree
@@ -28,22 +33,88 @@ class DictImporter:
     │   ├── AnyNode(a='sub0A', b='foo')
     │   └── AnyNode(a='sub0B')
     └── AnyNode(a='sub1')
+
+    With `intern`, identical subtrees are created once and shared by read-only :any:`SharedNode` views.
+    The duplicates are detected by hashing `data` upfront and are never created.
+
+    >>> data = {
+    ...     'a': 'root',
+    ...     'children': [{'a': 'sub0', 'children': [{'a': 'sub0A'}]},
+    ...                  {'a': 'sub1', 'children': [{'a': 'sub0', 'children': [{'a': 'sub0A'}]}]}]}
+    >>> root = DictImporter(intern=True).import_(data)
+    >>> print(RenderTree(root))
+    AnyNode(a='root')
+    ├── SharedNode(AnyNode(a='sub0'))
+    │   └── SharedNode(AnyNode(a='sub0A'))
+    └── AnyNode(a='sub1')
+        └── SharedNode(AnyNode(a='sub0'))
+            └── SharedNode(AnyNode(a='sub0A'))
     """
 
-    def __init__(self, nodecls=AnyNode):
+    def __init__(self, nodecls=AnyNode, intern=False):
         self.nodecls = nodecls
+        self.intern = intern
 
     def import_(self, data):
         """Import tree from `data`."""
+        if self.intern:
+            return self.__import_interned(data)
         return self.__import(data)
 
-    def __import(self, data, parent=None):
+    def _create_node(self, attrs, children):
+        # The `children` are created before their parent.
+        # Attaching them to the fresh root node does not need to walk up the tree for loop detection.
+        node = self.nodecls(**attrs)
+        if children:
+            node.children = children
+        return node
+
+    def __import(self, data, share=None):
+        # Iterative post-order: every node is created after its children
+        # and the children are attached in one go.
+        stack = [self.__prepare(data)]
+        while True:
+            attrs, childdata, children = stack[-1]
+            for item in childdata:
+                node = share(item) if share else None
+                if node is None:
+                    stack.append(self.__prepare(item))
+                    break
+                children.append(node)
+            else:
+                node = self._create_node(attrs, children)
+                stack.pop()
+                if not stack:
+                    return node
+                stack[-1][2].append(node)
+
+    def __import_interned(self, data):
+        get_shared = _get_shared(data, _get_data_attrs, _get_data_children, minsize=2)
+        targets = {}
+
+        def share(item):
+            digest = get_shared(item)
+            if digest is None:
+                return None
+            target = targets.get(digest)
+            if target is None:
+                target = targets[digest] = self.__import(item)
+            return SharedNode(target)
+
+        return self.__import(data, share)
+
+    @staticmethod
+    def __prepare(data):
         if ASSERTIONS:  # pragma: no branch
             assert isinstance(data, dict)
             assert "parent" not in data
         attrs = dict(data)
-        children = attrs.pop("children", [])
-        node = self.nodecls(parent=parent, **attrs)
-        for child in children:
-            self.__import(child, parent=node)
-        return node
+        return attrs, iter(attrs.pop("children", ())), []
+
+
+def _get_data_attrs(data):
+    return ((name, value) for name, value in data.items() if name != "children")
+
+
+def _get_data_children(data):
+    return data.get("children", ())
@@ -1,7 +1,15 @@
+import codecs
 import json
+import re
+
+from anytree.config import ASSERTIONS
 
 from .dictimporter import DictImporter
 
+_CHUNKSIZE = 1 << 16
+_DELIMITERS = frozenset(",:]} \t\n\r")
+_WS = re.compile(r"[ \t\n\r]*")
+
 
 class JsonImporter:
     """
@@ -60,6 +68,167 @@ class JsonImporter:
         """Read JSON from `data`."""
         return self.__import(json.loads(data, **self.kwargs))
 
-    def read(self, filehandle):
-        """Read JSON from `filehandle`."""
+    def read(self, filehandle, stream=False):
+        """
+        Read JSON from `filehandle`.
+
+        By default, the whole JSON document is loaded first and converted to a tree afterwards.
+        `stream` reads and parses the JSON incrementally instead and creates every
+        node as soon as its JSON object is complete. The memory consumption is
+        limited to the resulting tree.
+
+        >>> from anytree.importer import JsonImporter
+        >>> from anytree import RenderTree
+        >>> with open("tree.json", "w") as filehandle:
+        ...     _ = filehandle.write('{"a": "root", "children": [{"a": "sub0"}, {"a": "sub1"}]}')
+        >>> with open("tree.json") as filehandle:
+        ...     root = JsonImporter().read(filehandle, stream=True)
+        >>> print(RenderTree(root))
+        AnyNode(a='root')
+        ├── AnyNode(a='sub0')
+        └── AnyNode(a='sub1')
+
+        .. note:: On streaming, the `object_hook` and `object_pairs_hook` receive the node attributes
+                  without the `children`. Child nodes are created before their parent node.
+        """
+        if stream:
+            dictimporter = self.dictimporter or DictImporter()
+            return _JsonStream(filehandle, dictimporter, self.kwargs).read()
         return self.__import(json.load(filehandle, **self.kwargs))
+
+
+class _JsonStream:
+    """Incremental JSON parser, which creates a node for every completed JSON object."""
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, filehandle, dictimporter, kwargs):
+        self.filehandle = filehandle
+        self.dictimporter = dictimporter
+        kwargs = dict(kwargs)
+        decoder = (kwargs.pop("cls", None) or json.JSONDecoder)(**kwargs)
+        self.decode = decoder.raw_decode
+        self.object_hook = decoder.object_hook
+        self.object_pairs_hook = decoder.object_pairs_hook
+        self.textdecoder = None
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.readsize = _CHUNKSIZE
+
+    def read(self):
+        """Read tree."""
+        self._consume("{")
+        # every stack item: attributes, children, children are currently parsed, first key/child pending
+        stack = [[[], [], False, True]]
+        while True:
+            frame = stack[-1]
+            char = self._peek()
+            if frame[2]:
+                # children
+                if char == "]":
+                    self.pos += 1
+                    # further attributes follow after a comma
+                    frame[2] = frame[3] = False
+                    continue
+                if not frame[3]:
+                    self._consume(",")
+                frame[3] = False
+                self._consume("{")
+                stack.append([[], [], False, True])
+                continue
+            # attributes
+            if char == "}":
+                self.pos += 1
+                node = self._create_node(*frame[:2])
+                stack.pop()
+                if not stack:
+                    break
+                frame = stack[-1]
+                frame[1].append(node)
+                continue
+            if not frame[3]:
+                self._consume(",")
+            if self._peek() != '"':
+                self._error("Expecting property name enclosed in double quotes")
+            key = self._decode()
+            self._consume(":")
+            if key == "children" and self._peek() == "[":
+                self.pos += 1
+                frame[2] = frame[3] = True
+            else:
+                frame[0].append((key, self._decode()))
+                frame[3] = False
+        if self._peek(eof=True):
+            self._error("Extra data")
+        return node
+
+    def _create_node(self, pairs, children):
+        if self.object_pairs_hook is not None:
+            attrs = self.object_pairs_hook(pairs)
+        elif self.object_hook is not None:
+            attrs = self.object_hook(dict(pairs))
+        else:
+            attrs = dict(pairs)
+        if ASSERTIONS:  # pragma: no branch
+            assert "parent" not in attrs
+        return self.dictimporter._create_node(attrs, children)
+
+    def _fill(self):
+        buffer, pos = self.buffer, self.pos
+        if pos > _CHUNKSIZE:
+            buffer, self.pos = buffer[pos:], 0
+        chunk = self.filehandle.read(self.readsize)
+        while isinstance(chunk, bytes):
+            if self.textdecoder is None:
+                self.textdecoder = codecs.getincrementaldecoder("utf-8-sig")()
+            text = self.textdecoder.decode(chunk, final=not chunk)
+            # incomplete multibyte sequences are kept by the decoder until the next chunk
+            chunk = text if text or not chunk else self.filehandle.read(self.readsize)
+        if chunk:
+            self.buffer = buffer + chunk
+        else:
+            self.buffer = buffer
+            self.eof = True
+
+    def _peek(self, eof=False):
+        # skip whitespace and return the next character
+        while True:
+            match = _WS.match(self.buffer, self.pos)
+            self.pos = match.end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if self.eof:
+                if eof:
+                    return ""
+                self._error("Expecting value")
+            self._fill()
+
+    def _consume(self, char):
+        if self._peek() != char:
+            self._error(f"Expecting {char!r}")
+        self.pos += 1
+
+    def _decode(self):
+        self._peek()
+        readsize = self.readsize
+        try:
+            while True:
+                try:
+                    value, end = self.decode(self.buffer, self.pos)
+                except json.JSONDecodeError:
+                    if self.eof:
+                        raise
+                else:
+                    # values at the end of the buffer, like numbers, might continue in the next chunk
+                    if self.eof or (end < len(self.buffer) and self.buffer[end] in _DELIMITERS):
+                        self.pos = end
+                        return value
+                # the value does not fit into the buffer - read more, in growing chunks
+                self._fill()
+                self.readsize = max(self.readsize, len(self.buffer) - self.pos)
+        finally:
+            self.readsize = readsize
+
+    def _error(self, msg):
+        raise json.JSONDecodeError(msg, self.buffer, self.pos)
@@ -0,0 +1,242 @@
+"""
+Tree Layout.
+
+* :any:`TidyLayout` places every node of a tree in the plane.
+"""
+
+import collections
+
+Position = collections.namedtuple("Position", ("node", "x", "y"))
+
+
+class TidyLayout:
+    """
+    Tidy tree layout of the tree starting at `node`.
+
+    The layout follows the rules of Reingold and Tilford, as implemented by Buchheim, Jünger and Leipert
+    ("Improving Walker's Algorithm to Run in Linear Time"):
+
+    * All nodes of one level have the same `y`.
+    * The nodes of one level keep at least `distance` from each other.
+    * Parents are centered above their children.
+    * Identical subtrees are drawn identically, mirrored subtrees are drawn mirrored.
+
+    The effort is linear with the tree size and the implementation does not use recursion.
+
+    Keyword Args:
+        distance: Minimum horizontal distance of two nodes on the same level.
+        leveldistance: Vertical distance of the levels.
+        childiter: Child iterator.
+        maxlevel: Limit layout to this depth.
+
+    :any:`TidyLayout` is an iterator, returning a :any:`Position` tuple with 3 items in pre-order:
+
+    `node`
+        :any:`NodeMixin` object.
+
+    `x`
+        horizontal position, starting at ``0`` for the leftmost node.
+
+    `y`
+        vertical position, ``0`` for `node`.
+
+    >>> from anytree import Node
+    >>> from anytree.layout import TidyLayout
+    >>> root = Node("root")
+    >>> s0 = Node("sub0", parent=root)
+    >>> s0b = Node("sub0B", parent=s0)
+    >>> s0a = Node("sub0A", parent=s0)
+    >>> s1 = Node("sub1", parent=root)
+    >>> s1a = Node("sub1A", parent=s1)
+    >>> s1b = Node("sub1B", parent=s1)
+    >>> s1c = Node("sub1C", parent=s1)
+    >>> for node, x, y in TidyLayout(root):
+    ...     print(f"{node.name:6} {x:g} {y:g}")
+    root   1.75 0
+    sub0   0.5 1
+    sub0B  0 2
+    sub0A  1 2
+    sub1   3 1
+    sub1A  2 2
+    sub1B  3 2
+    sub1C  4 2
+
+    >>> for node, x, y in TidyLayout(root, distance=2, leveldistance=3, childiter=reversed, maxlevel=2):
+    ...     print(f"{node.name:6} {x:g} {y:g}")
+    root   1 0
+    sub1   0 3
+    sub0   2 3
+    """
+
+    def __init__(self, node, distance=1.0, leveldistance=1.0, childiter=list, maxlevel=None):
+        self.node = node
+        self.distance = distance
+        self.leveldistance = leveldistance
+        self.childiter = childiter
+        self.maxlevel = maxlevel
+
+    def __iter__(self):
+        return self.__iter()
+
+    def __iter(self):
+        if self.maxlevel is not None and self.maxlevel < 1:
+            return
+        root = self.__build()
+        _firstwalk(root, self.distance)
+        # second walk: pre-order, accumulating the modifiers
+        items = []
+        stack = [(root, 0.0)]
+        while stack:
+            item, mod = stack.pop()
+            item.x = item.prelim + mod
+            items.append(item)
+            mod += item.mod
+            stack.extend((child, mod) for child in reversed(item.children))
+        offset = min(item.x for item in items)
+        leveldistance = self.leveldistance
+        for item in items:
+            yield Position(item.node, item.x - offset, item.level * leveldistance)
+
+    def __build(self):
+        """Create the internal layout tree."""
+        childiter, maxlevel = self.childiter, self.maxlevel
+        root = _Item(self.node, None, 0, 0)
+        stack = [root]
+        while stack:
+            parent = stack.pop()
+            level = parent.level + 1
+            if maxlevel is None or level < maxlevel:
+                children = parent.node.children
+                if children:
+                    parent.children = [
+                        _Item(child, parent, idx, level) for idx, child in enumerate(childiter(children))
+                    ]
+                    stack.extend(parent.children)
+        return root
+
+
+class _Item:
+    """Layout state of one node."""
+
+    __slots__ = (
+        "ancestor",
+        "change",
+        "children",
+        "level",
+        "mod",
+        "node",
+        "number",
+        "parent",
+        "prelim",
+        "shift",
+        "thread",
+        "x",
+    )
+
+    def __init__(self, node, parent, number, level):
+        self.node = node
+        self.parent = parent
+        self.number = number
+        self.level = level
+        self.children = ()
+        self.prelim = self.mod = self.change = self.shift = self.x = 0.0
+        self.thread = None
+        self.ancestor = self
+
+    def left(self):
+        """Left contour: next node."""
+        return self.children[0] if self.children else self.thread
+
+    def right(self):
+        """Right contour: next node."""
+        return self.children[-1] if self.children else self.thread
+
+    def leftsibling(self):
+        """Left sibling or `None`."""
+        return self.parent.children[self.number - 1] if self.number else None
+
+
+def _firstwalk(root, distance):
+    """Determine the preliminary positions in post-order."""
+    # item, default ancestor of its children, children iterator
+    stack = [[root, None, iter(root.children)]]
+    while stack:
+        entry = stack[-1]
+        item, _, children = entry
+        for child in children:
+            stack.append([child, None, iter(child.children)])
+            break
+        else:
+            stack.pop()
+            leftsibling = item.leftsibling()
+            if item.children:
+                _execute_shifts(item)
+                midpoint = (item.children[0].prelim + item.children[-1].prelim) / 2
+                if leftsibling is not None:
+                    item.prelim = leftsibling.prelim + distance
+                    item.mod = item.prelim - midpoint
+                else:
+                    item.prelim = midpoint
+            elif leftsibling is not None:
+                item.prelim = leftsibling.prelim + distance
+            if stack:
+                parententry = stack[-1]
+                parententry[1] = _apportion(item, parententry[1] or item, distance)
+
+
+def _apportion(item, ancestor, distance):
+    """Move the subtree of `item` next to its left siblings and return the new default ancestor."""
+    leftsibling = item.leftsibling()
+    if leftsibling is None:
+        return ancestor
+    # inner and outer contour, on the left and on the right
+    innerright = outerright = item
+    innerleft = leftsibling
+    outerleft = item.parent.children[0]
+    shiftinnerright = shiftouterright = item.mod
+    shiftinnerleft = innerleft.mod
+    shiftouterleft = outerleft.mod
+    nextinnerleft, nextinnerright = innerleft.right(), innerright.left()
+    while nextinnerleft is not None and nextinnerright is not None:
+        innerleft, innerright = nextinnerleft, nextinnerright
+        outerleft, outerright = outerleft.left(), outerright.right()
+        outerright.ancestor = item
+        shift = (innerleft.prelim + shiftinnerleft) - (innerright.prelim + shiftinnerright) + distance
+        if shift > 0:
+            left = innerleft.ancestor
+            if left.parent is not item.parent:
+                left = ancestor
+            _move_subtree(left, item, shift)
+            shiftinnerright += shift
+            shiftouterright += shift
+        shiftinnerleft += innerleft.mod
+        shiftinnerright += innerright.mod
+        shiftouterleft += outerleft.mod
+        shiftouterright += outerright.mod
+        nextinnerleft, nextinnerright = innerleft.right(), innerright.left()
+    if nextinnerleft is not None and outerright.right() is None:
+        outerright.thread = nextinnerleft
+        outerright.mod += shiftinnerleft - shiftouterright
+    if nextinnerright is not None and outerleft.left() is None:
+        outerleft.thread = nextinnerright
+        outerleft.mod += shiftinnerright - shiftouterleft
+        ancestor = item
+    return ancestor
+
+
+def _move_subtree(left, right, shift):
+    subtrees = right.number - left.number
+    right.change -= shift / subtrees
+    right.shift += shift
+    left.change += shift / subtrees
+    right.prelim += shift
+    right.mod += shift
+
+
+def _execute_shifts(item):
+    shift = change = 0.0
+    for child in reversed(item.children):
+        child.prelim += shift
+        child.mod += shift
+        change += child.change
+        shift += child.shift + change
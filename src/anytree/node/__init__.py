@@ -5,25 +5,56 @@ Node Classes.
 * :any:`Node`: a simple tree node with at least a name attribute and any number of additional attributes.
 * :any:`NodeMixin`: extends any python class to a tree node.
 * :any:`SymlinkNode`: Tree node which references to another tree node.
+* :any:`SharedNode`: Read-only view to a shared subtree.
 * :any:`SymlinkNodeMixin`: extends any Python class to a symbolic link to a tree node.
 * :any:`LightNodeMixin`: A :any:`NodeMixin` using slots.
+* :any:`MerkleNodeMixin`: A :any:`NodeMixin` with a content hash per subtree.
+* :any:`batch`: Batch tree modifications.
+* :any:`subscribe`: Subscribe to tree modifications.
+* :any:`Journal`: Undo and redo tree modifications.
 """
 
 from .anynode import AnyNode
+from .batching import batch
+from .events import (
+    MISSING,
+    AttachEvent,
+    ChangeEvent,
+    DetachEvent,
+    MoveEvent,
+    ReorderEvent,
+    Subscription,
+    subscribe,
+)
 from .exceptions import LoopError, TreeError
+from .journal import Journal
 from .lightnodemixin import LightNodeMixin
+from .merklenodemixin import MerkleNodeMixin
 from .node import Node
 from .nodemixin import NodeMixin
+from .sharednode import SharedNode
 from .symlinknode import SymlinkNode
 from .symlinknodemixin import SymlinkNodeMixin
 
 __all__ = [
+    "MISSING",
     "AnyNode",
+    "AttachEvent",
+    "ChangeEvent",
+    "DetachEvent",
+    "Journal",
     "LightNodeMixin",
     "LoopError",
+    "MerkleNodeMixin",
+    "MoveEvent",
     "Node",
     "NodeMixin",
+    "ReorderEvent",
+    "SharedNode",
+    "Subscription",
     "SymlinkNode",
     "SymlinkNodeMixin",
     "TreeError",
+    "batch",
+    "subscribe",
 ]
@@ -0,0 +1,268 @@
+import contextlib
+import threading
+
+from anytree.config import ASSERTIONS
+
+from .events import _BATCHES, _SUBSCRIPTIONS, MISSING, _get_attr, _publish_change, _publish_links, _step, _update_hooks
+from .exceptions import LoopError
+
+_LOCAL = threading.local()
+
+
+@contextlib.contextmanager
+def batch(root):
+    """
+    Batch all tree modifications within the context.
+
+    Args:
+        root: Root node of the modified tree. Returned by the context.
+
+    Within the context, setting `parent` or `children` of any :any:`NodeMixin` or :any:`LightNodeMixin`
+    within the tree of `root` just updates the links. Modifications of other trees are not affected.
+    A node stays part of the batch, once it has been modified within the batch, even if it left the tree.
+    The loop detection and all hooks, like :any:`_pre_attach` or :any:`_post_attach_children`, are deferred.
+    On exit, the net changes are checked for loops at once and the hooks are called once per changed node
+    and once per changed parent node, with all its attached or detached children.
+    A node, which has been moved several times, is just detached from its original parent and attached to its
+    final parent. A node, which returned to its original parent at the same position, is not reported at all.
+    A parent node, whose children have been reordered, is reported with all its children.
+
+    Any exception within the context, on the loop detection or on the `_pre_` hooks, rolls back all modifications:
+    the links and the attributes of the nodes, including the modifications by the `_pre_` hooks.
+
+    Nested contexts join the outer one and add their tree to it. Every thread has its own batch.
+
+    >>> from anytree import Node, RenderTree, batch
+    >>> class LogNode(Node):
+    ...     def _post_attach(self, parent):
+    ...         print(f"attach {self.name} to {parent.name}")
+    ...     def _post_detach(self, parent):
+    ...         print(f"detach {self.name} from {parent.name}")
+    ...     def _post_attach_children(self, children):
+    ...         print(f"{self.name}: attached {[child.name for child in children]}")
+    >>> root = LogNode("root")
+    >>> s0 = LogNode("sub0", parent=root)
+    attach sub0 to root
+    >>> s1 = LogNode("sub1", parent=root)
+    attach sub1 to root
+    >>> with batch(root):
+    ...     s2 = LogNode("sub2", parent=root)
+    ...     s2.parent = s0
+    ...     s2.parent = s1
+    ...     s0.parent = s1
+    attach sub2 to sub1
+    detach sub0 from root
+    attach sub0 to sub1
+    sub1: attached ['sub2', 'sub0']
+    >>> print(RenderTree(root))
+    LogNode('/root')
+    └── LogNode('/root/sub1')
+        ├── LogNode('/root/sub1/sub2')
+        └── LogNode('/root/sub1/sub0')
+
+    Loops are detected on exit:
+
+    >>> with batch(root):
+    ...     s1.parent = None
+    ...     s1.parent = s0
+    Traceback (most recent call last):
+        ...
+    anytree.node.exceptions.LoopError: Cannot set parent. LogNode('/root/sub1') is parent of LogNode('/root/sub1/sub0').
+    >>> print(RenderTree(root))
+    LogNode('/root')
+    └── LogNode('/root/sub1')
+        ├── LogNode('/root/sub1/sub2')
+        └── LogNode('/root/sub1/sub0')
+    """
+    current = _get_batch()
+    if current is not None:
+        current.add(root)
+        yield root
+        return
+    changes = _Batch(root)
+    with _step():
+        _LOCAL.batch = changes
+        _BATCHES.append(changes)
+        _update_hooks()
+        try:
+            yield root
+            changes.prepare()
+        except BaseException:
+            changes.deactivate()
+            changes.rollback()
+            raise
+        changes.deactivate()
+        changes.finish()
+
+
+def _get_batch(*nodes):
+    """
+    Return the active batch of the current thread or `None`.
+
+    With `nodes`, just return the batch if any of the nodes is part of it.
+    """
+    if not _BATCHES:
+        return None
+    current = getattr(_LOCAL, "batch", None)
+    if current is None or not nodes or current.covers(nodes):
+        return current
+    return None
+
+
+def _change_attr(node, name, oldvalue, value):
+    """Record and publish the change of attribute `name` of `node`, after the modification."""
+    current = _get_batch(node)
+    if current is not None:
+        current.record_attr(node, name, oldvalue)
+    if _SUBSCRIPTIONS:
+        _publish_change(node, name, oldvalue, value)
+
+
+class _Batch:
+    """Original links and attributes of all nodes modified within a :any:`batch`."""
+
+    def __init__(self, root):
+        # ids of all nodes known to be part of the batch
+        self.scope = {id(root)}
+        # link modifications are deferred until :any:`prepare`
+        self.deferred = True
+        # id(node): (node, original parent)
+        self.parents = {}
+        # id(parent): (parent, original children)
+        self.children = {}
+        # (id(node), name): (node, original value)
+        self.attrs = {}
+        # net changes, determined by :any:`prepare`
+        self.changes = []
+        self.reordered = []
+
+    def add(self, root):
+        """Add the tree of `root` to the batch."""
+        self.scope.add(id(root))
+
+    def covers(self, nodes):
+        """Any of `nodes` is part of the batch."""
+        scope = self.scope
+        for node in nodes:
+            path = []
+            item = node
+            while item is not None:
+                if id(item) in scope:
+                    scope.update(id(pathitem) for pathitem in path)
+                    return True
+                path.append(item)
+                item = item.parent
+        return False
+
+    def record(self, node, parent, value):
+        """Record the links of `node` moving from `parent` to `value`, before the modification."""
+        self.scope.add(id(node))
+        if id(node) not in self.parents:
+            self.parents[id(node)] = node, parent
+        for item in (parent, value):
+            if item is not None:
+                self.scope.add(id(item))
+                if id(item) not in self.children:
+                    self.children[id(item)] = item, item.children
+
+    def record_attr(self, node, name, oldvalue):
+        """Record attribute `name` of `node` with its value before the modification."""
+        self.attrs.setdefault((id(node), name), (node, name, oldvalue))
+
+    def deactivate(self):
+        """Stop recording."""
+        _LOCAL.batch = None
+        _BATCHES.remove(self)
+        _update_hooks()
+
+    def rollback(self):
+        """Restore the original links and attributes."""
+        self.__restore_links()
+        for node, name, value in self.attrs.values():
+            if value is not MISSING:
+                setattr(node, name, value)
+            elif _get_attr(node, name) is not MISSING:
+                delattr(node, name)
+
+    def __restore_links(self):
+        for parent, children in self.children.values():
+            object.__setattr__(parent, parent._linknames[1], list(children))  # pylint: disable=protected-access
+        for node, parent in self.parents.values():
+            object.__setattr__(node, node._linknames[0], parent)  # pylint: disable=protected-access
+
+    def prepare(self):
+        """Check the net changes and call the `_pre_` hooks."""
+        self.deferred = False
+        changes = self.changes = [
+            (node, parent, node.parent) for node, parent in self.parents.values() if node.parent is not parent
+        ]
+        loop = _find_loop(changes)
+        if loop is not None:
+            # the node representation might need the path without loop
+            self.__restore_links()
+            msg = "Cannot set parent. %r is parent of %r."
+            raise LoopError(msg % loop)
+        if ASSERTIONS:  # pragma: no branch
+            for parent, _ in self.children.values():
+                children = parent.children
+                assert len({id(child) for child in children}) == len(children), "Tree is corrupt."
+                assert all(child.parent is parent for child in children), "Tree is corrupt."
+        self.reordered = self.__get_reordered()
+        _call_hooks(changes, self.reordered, "pre")
+
+    def finish(self):
+        """Call the `_post_` hooks and publish the net changes."""
+        _call_hooks(self.changes, self.reordered, "post")
+        _publish_links(self.changes, self.reordered)
+
+    def __get_reordered(self):
+        """Parent nodes, whose children order differs from the one established by the attach hooks."""
+        attached = {}
+        for node, _, value in self.changes:
+            if value is not None:
+                attached.setdefault(id(value), []).append(node)
+        reordered = []
+        for parent, children in self.children.values():
+            expected = [child for child in children if child.parent is parent]
+            expected.extend(attached.get(id(parent), ()))
+            current = parent.children
+            if any(child is not other for child, other in zip(current, expected)):
+                reordered.append(parent)
+        return reordered
+
+
+def _call_hooks(changes, reordered, when):
+    """
+    Call the `_pre_` or `_post_` hooks for all `changes`: per node, then per parent node.
+
+    The `reordered` parent nodes get all their children.
+    """
+    detached, attached = {}, {}
+    for node, parent, value in changes:
+        if parent is not None:
+            getattr(node, f"_{when}_detach")(parent)
+            detached.setdefault(id(parent), (parent, []))[1].append(node)
+        if value is not None:
+            getattr(node, f"_{when}_attach")(value)
+            attached.setdefault(id(value), (value, []))[1].append(node)
+    for parent in reordered:
+        attached[id(parent)] = parent, parent.children
+    for parent, nodes in detached.values():
+        getattr(parent, f"_{when}_detach_children")(tuple(nodes))
+    for parent, nodes in attached.values():
+        getattr(parent, f"_{when}_attach_children")(tuple(nodes))
+
+
+def _find_loop(changes):
+    """Return a `(node, parent)` pair closing a loop, or `None`."""
+    checked = set()
+    for changed, _, _ in changes:
+        path = set()
+        node = changed
+        while node is not None and id(node) not in checked:
+            if id(node) in path:
+                return node, node.parent
+            path.add(id(node))
+            node = node.parent
+        checked.update(path)
+    return None
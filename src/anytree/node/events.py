@@ -0,0 +1,239 @@
+import collections
+import contextlib
+import threading
+
+AttachEvent = collections.namedtuple("AttachEvent", ("node", "parent"))
+AttachEvent.__doc__ = "`node` has been attached to `parent`."
+
+DetachEvent = collections.namedtuple("DetachEvent", ("node", "parent"))
+DetachEvent.__doc__ = "`node` has been detached from `parent`."
+
+MoveEvent = collections.namedtuple("MoveEvent", ("node", "oldparent", "parent"))
+MoveEvent.__doc__ = "`node` has been moved from `oldparent` to `parent`."
+
+ReorderEvent = collections.namedtuple("ReorderEvent", ("node", "children"))
+ReorderEvent.__doc__ = "The `children` of `node` have been reordered within a :any:`batch`."
+
+ChangeEvent = collections.namedtuple("ChangeEvent", ("node", "name", "oldvalue", "value"))
+ChangeEvent.__doc__ = "Attribute `name` of `node` changed from `oldvalue` to `value`. Either might be :any:`MISSING`."
+
+
+class _Missing:
+    def __repr__(self):
+        return "MISSING"
+
+
+MISSING = _Missing()
+"""Value of a not existing attribute in :any:`ChangeEvent`."""
+
+# id(node): subscriptions of node
+_SUBSCRIPTIONS = {}  # type: ignore[var-annotated]
+
+# recorders of all single link modifications, like Journal
+_RECORDERS = []  # type: ignore[var-annotated]
+
+# active batches of all threads, see `batch`
+_BATCHES = []  # type: ignore[var-annotated]
+
+# node class: attribute hooks, just installed while any subscription or batch exists
+_HOOKS = {}  # type: ignore[var-annotated]
+_HOOKS_LOCK = threading.Lock()
+
+
+def subscribe(node, callback=None, batched=False, queue=None):
+    """
+    Subscribe to all modifications of the tree starting at `node` and return the :any:`Subscription`.
+
+    Args:
+        node: Observed node. The subscription covers the node and all its descendants at the time of the event.
+
+    Keyword Args:
+        callback: Function called with every event.
+        batched (bool): Deliver a list of events per modification: all net changes of a :any:`batch` at once.
+        queue: Queue, like :any:`queue.Queue` or :any:`asyncio.Queue`, receiving the events via `put_nowait`
+               instead of a `callback`. Another thread or task consumes them asynchronously.
+
+    The events are :any:`AttachEvent`, :any:`DetachEvent`, :any:`MoveEvent`, :any:`ReorderEvent`
+    and :any:`ChangeEvent`.
+    They are emitted after the modification and after the `_post_` hooks of the nodes.
+    A :any:`batch` reports its net changes on exit, just like the hooks.
+    Attribute changes are reported immediately, also within a :any:`batch`.
+    Attributes starting with an underscore are not reported.
+
+    Every event walks up the tree once for looking up the subscriptions.
+    The attribute changes are observed via `__setattr__` and `__delattr__` hooks of :any:`NodeMixin`
+    and :any:`LightNodeMixin`, which are just installed while any subscription or :any:`batch` exists.
+    Without, setting an attribute costs exactly the same as without this feature.
+
+    >>> from anytree import Node, batch, subscribe
+    >>> root = Node("root")
+    >>> s0 = Node("sub0", parent=root)
+    >>> s1 = Node("sub1", parent=root)
+    >>> subscription = subscribe(root, print)
+    >>> s0a = Node("sub0A", parent=s0)
+    AttachEvent(node=Node('/root/sub0/sub0A'), parent=Node('/root/sub0'))
+    >>> s0a.parent = s1
+    MoveEvent(node=Node('/root/sub1/sub0A'), oldparent=Node('/root/sub0'), parent=Node('/root/sub1'))
+    >>> s0a.name = "sub1A"
+    ChangeEvent(node=Node('/root/sub1/sub1A'), name='name', oldvalue='sub0A', value='sub1A')
+    >>> s1.parent = None
+    DetachEvent(node=Node('/sub1'), parent=Node('/root'))
+    >>> s0a.foo = 4
+    >>> subscription.close()
+
+    Batched delivery, with `sub0` returning behind `sub1`:
+
+    >>> def show(events):
+    ...     for event in events:
+    ...         print(event)
+    >>> subscription = subscribe(root, show, batched=True)
+    >>> with batch(root):
+    ...     s1.parent = root
+    ...     s0.parent = s1
+    ...     s0.parent = root
+    AttachEvent(node=Node('/root/sub1'), parent=Node('/root'))
+    ReorderEvent(node=Node('/root'), children=(Node('/root/sub1'), Node('/root/sub0')))
+    >>> subscription.close()
+    """
+    subscription = Subscription(node, callback=callback, batched=batched, queue=queue)
+    _SUBSCRIPTIONS.setdefault(id(node), []).append(subscription)
+    _update_hooks()
+    return subscription
+
+
+class Subscription:
+    """
+    Subscription to tree modifications, created by :any:`subscribe`.
+
+    Use :any:`close` or the subscription as context manager to unsubscribe.
+    """
+
+    def __init__(self, node, callback=None, batched=False, queue=None):
+        if (callback is None) == (queue is None):
+            msg = "Either 'callback' or 'queue' is required."
+            raise ValueError(msg)
+        self.node = node
+        self.callback = callback if callback is not None else queue.put_nowait
+        self.batched = batched
+
+    def close(self):
+        """Unsubscribe."""
+        subscriptions = _SUBSCRIPTIONS.get(id(self.node), [])
+        if any(subscription is self for subscription in subscriptions):
+            subscriptions[:] = [subscription for subscription in subscriptions if subscription is not self]
+            if not subscriptions:
+                del _SUBSCRIPTIONS[id(self.node)]
+                _update_hooks()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.node!r}, batched={self.batched!r})"
+
+
+def _publish_links(changes, reordered=()):
+    """Publish the events of the `(node, parent, value)` link `changes` and of the `reordered` parent nodes."""
+    if not _SUBSCRIPTIONS:
+        return
+    items = []
+    for node, parent, value in changes:
+        if parent is None:
+            items.append((AttachEvent(node, value), (node,)))
+        elif value is None:
+            items.append((DetachEvent(node, parent), (node, parent)))
+        else:
+            items.append((MoveEvent(node, parent, value), (node, parent)))
+    items.extend((ReorderEvent(parent, parent.children), (parent,)) for parent in reordered)
+    _publish(items)
+
+
+def _publish(items):
+    """Deliver all `(event, nodes)` items to the subscriptions of the nodes and their ancestors."""
+    # id(subscription): (subscription, events)
+    delivery = {}
+    for event, nodes in items:
+        seen = set()
+        for start in nodes:
+            node = start
+            while node is not None and id(node) not in seen:
+                seen.add(id(node))
+                for subscription in _SUBSCRIPTIONS.get(id(node), ()):
+                    delivery.setdefault(id(subscription), (subscription, []))[1].append(event)
+                node = node.parent
+    for subscription, events in delivery.values():
+        if subscription.batched:
+            subscription.callback(events)
+        else:
+            for event in events:
+                subscription.callback(event)
+
+
+def _record_link(link):
+    """
+    Hand the link modification `(node, parent, oldindex, value, index)` to all recorders, after the modification.
+
+    `oldindex` is the position in the children of `parent` before and `index` in the children of `value` after.
+    """
+    for recorder in tuple(_RECORDERS):
+        recorder._record_link(link)  # pylint: disable=protected-access
+
+
+@contextlib.contextmanager
+def _step():
+    """Combine all modifications within the context to one step of all recorders."""
+    # pylint: disable=protected-access
+    recorders = tuple(_RECORDERS)
+    for recorder in recorders:
+        recorder._begin()
+    try:
+        yield
+    except BaseException:
+        for recorder in recorders:
+            recorder._end(False)
+        raise
+    for recorder in recorders:
+        recorder._end(True)
+
+
+def _add_hooks(cls, setattr_, delattr_):
+    """Register the attribute hooks `setattr_` and `delattr_` of the node class `cls`."""
+    _HOOKS[cls] = {"__setattr__": setattr_, "__delattr__": delattr_}
+    _update_hooks()
+
+
+def _update_hooks():
+    """Install the attribute hooks while any subscription or batch exists and remove them otherwise."""
+    with _HOOKS_LOCK:
+        active = bool(_SUBSCRIPTIONS or _BATCHES)
+        for cls, hooks in _HOOKS.items():
+            if active != ("__setattr__" in cls.__dict__):
+                for name, hook in hooks.items():
+                    if active:
+                        setattr(cls, name, hook)
+                    else:
+                        delattr(cls, name)
+
+
+def _is_observed(name):
+    """Changes of the attribute `name` are reported."""
+    return not name.startswith("_") and name not in ("parent", "children")
+
+
+def _get_attr(node, name):
+    """Return the value of attribute `name` of `node` or :any:`MISSING`, ignoring class attributes."""
+    namespace = getattr(node, "__dict__", None)
+    if namespace is not None and name in namespace:
+        return namespace[name]
+    if hasattr(getattr(type(node), name, None), "__set__"):
+        # slot or property
+        return getattr(node, name, MISSING)
+    return MISSING
+
+
+def _publish_change(node, name, oldvalue, value):
+    """Publish the :any:`ChangeEvent` of attribute `name`, after the modification."""
+    _publish([(ChangeEvent(node, name, oldvalue, value), (node,))])
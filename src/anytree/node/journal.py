@@ -0,0 +1,216 @@
+import collections
+
+from .batching import batch
+from .events import _RECORDERS, MISSING, ChangeEvent, subscribe
+from .exceptions import TreeError
+from .util import _index
+
+
+class Journal:
+    """
+    Undo and redo journal of the tree starting at `root`.
+
+    Args:
+        root: Root node of the journaled tree.
+
+    Keyword Args:
+        maxsize (int): Maximum number of undo steps. Unlimited if `None`.
+
+    The journal records every modification of the tree, just as the inverse operation: the old and new position
+    of a moved node and the old and new value of a modified attribute.
+    A :any:`batch`, like :any:`group`, and setting `children` form one step.
+    Any other modification is a step of its own.
+    :any:`undo` and :any:`redo` just replay the operations of one step, so the effort depends on the size of the
+    modification, not on the size of the tree. The children of every affected node are set at once within
+    a :any:`batch`, with all hooks being called.
+    Recording a detached node needs its position among its siblings,
+    which takes time linear in the number of siblings, just like the detach itself.
+    If a step cannot be replayed, because a node was moved without the journal recording it,
+    :any:`undo` and :any:`redo` raise a :any:`TreeError`. The tree and the journal are left unmodified.
+
+    A new modification drops all steps to be redone. Attributes starting with an underscore are not recorded.
+
+    >>> from anytree import Journal, Node, RenderTree
+    >>> root = Node("root")
+    >>> s0 = Node("sub0", parent=root)
+    >>> s1 = Node("sub1", parent=root)
+    >>> journal = Journal(root)
+    >>> s0a = Node("sub0A", parent=s0)
+    >>> with journal.group():
+    ...     s1.parent = s0a
+    ...     s0.name = "foo"
+    >>> root.children = [s0, Node("sub2")]
+    >>> print(RenderTree(root))
+    Node('/root')
+    ├── Node('/root/foo')
+    │   └── Node('/root/foo/sub0A')
+    │       └── Node('/root/foo/sub0A/sub1')
+    └── Node('/root/sub2')
+    >>> journal.undo()
+    True
+    >>> journal.undo()
+    True
+    >>> print(RenderTree(root))
+    Node('/root')
+    ├── Node('/root/sub0')
+    │   └── Node('/root/sub0/sub0A')
+    └── Node('/root/sub1')
+    >>> journal.redo()
+    True
+    >>> print(RenderTree(root))
+    Node('/root')
+    └── Node('/root/foo')
+        └── Node('/root/foo/sub0A')
+            └── Node('/root/foo/sub0A/sub1')
+    >>> journal.undo(), journal.undo(), journal.undo()
+    (True, True, False)
+    >>> print(RenderTree(root))
+    Node('/root')
+    ├── Node('/root/sub0')
+    └── Node('/root/sub1')
+    >>> journal.close()
+    """
+
+    def __init__(self, root, maxsize=100):
+        self.root = root
+        self.__undos = collections.deque(maxlen=maxsize)
+        self.__redos = []
+        self.__step = []
+        self.__depth = 0
+        self.__replaying = False
+        self.__subscription = subscribe(root, self.__on_event)
+        _RECORDERS.append(self)
+
+    @property
+    def undos(self):
+        """Number of steps to be undone."""
+        return len(self.__undos)
+
+    @property
+    def redos(self):
+        """Number of steps to be redone."""
+        return len(self.__redos)
+
+    def group(self):
+        """Context combining all modifications to one step: a :any:`batch` of `root`."""
+        return batch(self.root)
+
+    def undo(self):
+        """Undo the last step. Returns `False` if there is nothing to undo."""
+        if not self.__undos:
+            return False
+        step = self.__undos[-1]
+        self.__replay(reversed(step), undo=True)
+        self.__redos.append(self.__undos.pop())
+        return True
+
+    def redo(self):
+        """Redo the last undone step. Returns `False` if there is nothing to redo."""
+        if not self.__redos:
+            return False
+        step = self.__redos[-1]
+        self.__replay(step, undo=False)
+        self.__undos.append(self.__redos.pop())
+        return True
+
+    def clear(self):
+        """Drop all steps."""
+        self.__undos.clear()
+        self.__redos.clear()
+
+    def close(self):
+        """Stop recording."""
+        self.__subscription.close()
+        _RECORDERS[:] = [recorder for recorder in _RECORDERS if recorder is not self]
+
+    def __replay(self, operations, undo):
+        # the new children of all affected nodes
+        childrens = {}
+
+        def get_children(node):
+            return childrens.setdefault(id(node), (node, list(node.children)))[1]
+
+        self.__replaying = True
+        try:
+            with batch(self.root):
+                for operation in operations:
+                    if operation[0] == "attr":
+                        _, node, name, oldvalue, value = operation
+                        _set_attr(node, name, oldvalue if undo else value)
+                        continue
+                    _, node, parent, oldindex, value, index = operation
+                    if undo:
+                        parent, oldindex, value, index = value, index, parent, oldindex
+                    if parent is not None:
+                        _remove(parent, get_children(parent), oldindex, node)
+                    if value is not None:
+                        get_children(value).insert(index, node)
+                for node, children in childrens.values():
+                    current = node.children
+                    if len(current) != len(children) or any(a is not b for a, b in zip(current, children)):
+                        node.children = children
+        finally:
+            self.__replaying = False
+
+    def __on_event(self, event):
+        if isinstance(event, ChangeEvent) and not self.__replaying:
+            self.__add(("attr", event.node, event.name, event.oldvalue, event.value))
+
+    def _record_link(self, link):
+        if not self.__replaying and self.__covers(link):
+            self.__add(("link", *link))
+
+    def _begin(self):
+        self.__depth += 1
+
+    def _end(self, success):
+        self.__depth = max(self.__depth - 1, 0)
+        if not self.__depth:
+            if success:
+                self.__commit()
+            else:
+                self.__step = []
+
+    def __add(self, operation):
+        self.__step.append(operation)
+        if not self.__depth:
+            self.__commit()
+
+    def __commit(self):
+        if self.__step:
+            self.__undos.append(self.__step)
+            self.__redos.clear()
+            self.__step = []
+
+    def __covers(self, link):
+        """Link modification within the tree."""
+        node, parent, _, value, _ = link
+        if node is self.root:
+            return True
+        for start in (parent, value):
+            item = start
+            while item is not None:
+                if item is self.root:
+                    return True
+                item = item.parent
+        return False
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.root!r}, undos={self.undos!r}, redos={self.redos!r})"
+
+
+def _set_attr(node, name, value):
+    if value is MISSING:
+        delattr(node, name)
+    else:
+        setattr(node, name, value)
+
+
+def _remove(parent, children, index, node):
+    if index >= len(children) or children[index] is not node:
+        # out of sync by modifications outside of the journal
+        index = _index(children, node)
+        if index is None:
+            msg = f"Cannot replay journal. {node!r} is not a child of {parent!r}."
+            raise TreeError(msg)
+    del children[index]
@@ -1,7 +1,20 @@
 from anytree.config import ASSERTIONS
 from anytree.iterators import PreOrderIter
 
+from .batching import _change_attr, _get_batch
+from .events import (
+    _RECORDERS,
+    _SUBSCRIPTIONS,
+    MISSING,
+    _add_hooks,
+    _get_attr,
+    _is_observed,
+    _publish_links,
+    _record_link,
+    _step,
+)
 from .exceptions import LoopError, TreeError
+from .util import _copy, _index, _reduce_ex, _remove, _setstate
 
 
 class LightNodeMixin:
@@ -81,6 +94,7 @@ class LightNodeMixin:
     __slots__ = ["__children", "__parent"]
 
     separator = "/"
+    _linknames = ("_LightNodeMixin__parent", "_LightNodeMixin__children")
 
     @property
     def parent(self):
@@ -129,9 +143,30 @@ class LightNodeMixin:
         else:
             parent = None
         if parent is not value:
-            self.__check_loop(value)
-            self.__detach(parent)
-            self.__attach(value)
+            oldindex = link = None
+            if _RECORDERS:
+                # the positions are just needed by the recorders
+                oldindex = None if parent is None else _index(parent.__children_or_empty, self)
+                index = None if value is None else len(value.__children_or_empty)
+                link = self, parent, oldindex, value, index
+            batch = _get_batch(self, value)
+            if batch is not None:
+                batch.record(self, parent, value)
+            if batch is not None and batch.deferred:
+                # links only: the loop check and the hooks are done at the end of the batch
+                if parent is not None:
+                    parent.__children = _remove(parent.__children_or_empty, self, oldindex)
+                if value is not None:
+                    value.__children_or_empty.append(self)
+                self.__parent = value
+            else:
+                self.__check_loop(value)
+                self.__detach(parent, oldindex)
+                self.__attach(value)
+                if _SUBSCRIPTIONS:
+                    _publish_links([(self, parent, value)])
+            if link is not None:
+                _record_link(link)
 
     def __check_loop(self, node):
         if node is not None:
@@ -142,7 +177,7 @@ class LightNodeMixin:
                 msg = "Cannot set parent. %r is parent of %r."
                 raise LoopError(msg % (self, node))
 
-    def __detach(self, parent):
+    def __detach(self, parent, index):
         # pylint: disable=W0212,W0238
         if parent is not None:
             self._pre_detach(parent)
@@ -150,7 +185,7 @@ class LightNodeMixin:
             if ASSERTIONS:  # pragma: no branch
                 assert any(child is self for child in parentchildren), "Tree is corrupt."  # pragma: no cover
             # ATOMIC START
-            parent.__children = [child for child in parentchildren if child is not self]
+            parent.__children = _remove(parentchildren, self, index)
             self.__parent = None
             # ATOMIC END
             self._post_detach(parent)
@@ -241,14 +276,34 @@ class LightNodeMixin:
         # convert iterable to tuple
         children = tuple(children)
         LightNodeMixin.__check_children(children)
+        if _RECORDERS:
+            # all modifications form one step of the recorders
+            with _step():
+                self.__set_children(children)
+        else:
+            self.__set_children(children)
+
+    @children.deleter  # type: ignore[no-redef]
+    def children(self):
+        if _RECORDERS:
+            with _step():
+                self.__del_children()
+        else:
+            self.__del_children()
+
+    def __set_children(self, children):
         # ATOMIC start
         old_children = self.children
         del self.children
+        batch = _get_batch(self)
+        batched = batch is not None and batch.deferred
         try:
-            self._pre_attach_children(children)
+            if not batched:
+                self._pre_attach_children(children)
             for child in children:
                 child.parent = self
-            self._post_attach_children(children)
+            if not batched:
+                self._post_attach_children(children)
             if ASSERTIONS:  # pragma: no branch
                 assert len(self.children) == len(children)
         except Exception:
@@ -256,9 +311,19 @@ class LightNodeMixin:
             raise
         # ATOMIC end
 
-    @children.deleter  # type: ignore[no-redef]
-    def children(self):
+    def __del_children(self):
         children = self.children
+        batch = _get_batch(self)
+        if batch is not None and batch.deferred:
+            # links only, like the parent setter, without removing the children one by one
+            for child in children:
+                batch.record(child, self, None)
+                child.__parent = None
+            self.__children = []
+            if _RECORDERS:
+                for child in children:
+                    _record_link((child, self, 0, None, None))
+            return
         self._pre_detach_children(children)
         for child in self.children:
             child.parent = None
@@ -535,6 +600,15 @@ class LightNodeMixin:
             continue
         return size
 
+    def __reduce_ex__(self, protocol):
+        return _reduce_ex(self, protocol, LightNodeMixin)
+
+    def __setstate__(self, state):
+        _setstate(self, state, LightNodeMixin)
+
+    def __copy__(self):
+        return _copy(self)
+
     def _pre_detach(self, parent):
         """Method call before detaching from `parent`."""
 
@@ -546,3 +620,25 @@ class LightNodeMixin:
 
     def _post_attach(self, parent):
         """Method call after attaching to `parent`."""
+
+
+def _setattr(node, name, value):
+    if _is_observed(name):
+        oldvalue = _get_attr(node, name)
+        super(LightNodeMixin, node).__setattr__(name, value)
+        _change_attr(node, name, oldvalue, value)
+    else:
+        super(LightNodeMixin, node).__setattr__(name, value)
+
+
+def _delattr(node, name):
+    if _is_observed(name):
+        oldvalue = _get_attr(node, name)
+        super(LightNodeMixin, node).__delattr__(name)
+        _change_attr(node, name, oldvalue, MISSING)
+    else:
+        super(LightNodeMixin, node).__delattr__(name)
+
+
+# installed while any subscription or batch exists
+_add_hooks(LightNodeMixin, _setattr, _delattr)
@@ -0,0 +1,144 @@
+import hashlib
+
+from .nodemixin import NodeMixin
+from .util import _slotnames
+
+
+class MerkleNodeMixin(NodeMixin):
+    """
+    The :any:`MerkleNodeMixin` class extends any Python class to a tree node with a content hash per subtree.
+
+    The :any:`subtree_hash` combines the attributes listed in `hashattrs` with the hashes of all children,
+    in their order. Equal hashes indicate equal subtrees.
+
+    The hash is calculated on first access and kept. Attaching and detaching nodes,
+    as well as setting any of the `hashattrs`, drops the kept hash of the node and all its ancestors.
+    Ancestors without a kept hash are skipped, so every modification costs at most the depth of the tree.
+    The next access just recalculates the dropped hashes. Comparing two unmodified trees is therefore
+    independent of their size.
+
+    >>> from anytree import MerkleNodeMixin, Node
+    >>> class MerkleNode(MerkleNodeMixin, Node):
+    ...     hashattrs = ("name", "value")
+    >>> root = MerkleNode("root", value=1)
+    >>> s0 = MerkleNode("sub0", parent=root, value=2)
+    >>> s1 = MerkleNode("sub1", parent=root, value=3)
+    >>> other = MerkleNode("root", value=1, children=[MerkleNode("sub0", value=2), MerkleNode("sub1", value=3)])
+    >>> root.subtree_hash == other.subtree_hash
+    True
+
+    Any modification of a subtree is detected:
+
+    >>> s1.value = 4
+    >>> root.subtree_hash == other.subtree_hash
+    False
+    >>> s0.subtree_hash == other.children[0].subtree_hash
+    True
+    >>> other.children[1].value = 4
+    >>> root.subtree_hash == other.subtree_hash
+    True
+    >>> s0.parent = None
+    >>> root.subtree_hash == other.subtree_hash
+    False
+
+    Attributes not listed in `hashattrs` are ignored:
+
+    >>> s1.foo = 4
+    >>> root.subtree_hash == MerkleNode("root", value=1, children=[MerkleNode("sub1", value=4)]).subtree_hash
+    True
+
+    .. note:: In-place modifications of attribute values (like appending to a list)
+              are not detected. Set the attribute again or call :any:`touch`.
+    """
+
+    hashattrs = ("name",)
+    """Attributes, which contribute to the hash."""
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in self.hashattrs:
+            self.touch()
+
+    def __delattr__(self, name):
+        super().__delattr__(name)
+        if name in self.hashattrs:
+            self.touch()
+
+    @property
+    def subtree_hash(self):
+        """
+        Content hash of the subtree starting at this node (bytes).
+
+        Calculated on demand, without recursion, just for the modified nodes.
+        Descendants, which are no :any:`MerkleNodeMixin`, are hashed by their class name and
+        their public attributes on every calculation. Their modifications, and setting their `parent`,
+        are not tracked: call :any:`touch` on their closest :any:`MerkleNodeMixin` ancestor.
+        """
+        hashname = "_MerkleNodeMixin__hash"
+        # hashes of the nodes, which are no MerkleNodeMixin, by id
+        others = {}
+        stack = [(self, False)]
+        while stack:
+            node, ready = stack.pop()
+            if ready:
+                if isinstance(node, MerkleNodeMixin):
+                    hashdata = node._get_hashdata()  # pylint: disable=protected-access
+                else:
+                    hashdata = _get_default_hashdata(node)
+                digest = hashlib.blake2b(hashdata, digest_size=16)
+                for child in node.children:
+                    digest.update(
+                        getattr(child, hashname) if isinstance(child, MerkleNodeMixin) else others.pop(id(child))
+                    )
+                if isinstance(node, MerkleNodeMixin):
+                    object.__setattr__(node, hashname, digest.digest())
+                else:
+                    others[id(node)] = digest.digest()
+            elif not isinstance(node, MerkleNodeMixin) or getattr(node, hashname, None) is None:
+                stack.append((node, True))
+                stack.extend((child, False) for child in node.children)
+        return getattr(self, hashname)
+
+    def touch(self):
+        """Drop the kept hash of this node and all its ancestors."""
+        node = self
+        while node is not None and getattr(node, "_MerkleNodeMixin__hash", None) is not None:
+            object.__setattr__(node, "_MerkleNodeMixin__hash", None)
+            node = node.parent
+
+    def _get_hashdata(self):
+        """
+        Return the node content as bytes.
+
+        The `repr` of all `hashattrs` values by default. Missing attributes are treated as `None`.
+        Overwrite this method for attribute values without a deterministic `repr`.
+        """
+        data = repr(tuple(getattr(self, name, None) for name in self.hashattrs)).encode("utf-8")
+        return len(data).to_bytes(8, "little") + data
+
+    def _post_detach(self, parent):
+        super()._post_detach(parent)
+        if isinstance(parent, MerkleNodeMixin):
+            parent.touch()
+
+    def _post_attach(self, parent):
+        super()._post_attach(parent)
+        if isinstance(parent, MerkleNodeMixin):
+            parent.touch()
+
+    def _post_attach_children(self, children):
+        # the children might just have been reordered by a batch
+        super()._post_attach_children(children)
+        self.touch()
+
+
+def _get_default_hashdata(node):
+    """Class name and public attributes of `node`, which is no :any:`MerkleNodeMixin`, as bytes."""
+    attrs = [(name, getattr(node, name)) for name in sorted(_public_attrnames(node))]
+    data = repr((node.__class__.__qualname__, attrs)).encode("utf-8")
+    return len(data).to_bytes(8, "little") + data
+
+
+def _public_attrnames(node):
+    yield from (name for name in getattr(node, "__dict__", ()) if not name.startswith("_"))
+    yield from (name for name in _slotnames(node.__class__) if hasattr(node, name))
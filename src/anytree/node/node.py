@@ -77,5 +77,12 @@ class Node(NodeMixin):
             self.children = children
 
     def __repr__(self):
-        args = ["{!r}".format(self.separator.join([""] + [str(node.name) for node in self.path]))]
+        names = [str(node.name) for node in self.iter_path_reverse()]
+        names.append("")
+        names.reverse()
+        return self._repr_path(self.separator.join(names))
+
+    def _repr_path(self, pathstr):
+        # `pathstr` is the path string of this node, i.e. determined by the caller
+        args = [repr(pathstr)]
         return _repr(self, args=args, nameblacklist=["name"])
@@ -0,0 +1,119 @@
+import weakref
+
+from .exceptions import TreeError
+from .symlinknodemixin import SymlinkNodeMixin
+from .util import _repr
+
+
+class SharedNode(SymlinkNodeMixin):
+    """
+    Read-only view to a shared subtree.
+
+    Args:
+        target: Root node of the shared subtree.
+
+    Keyword Args:
+        parent: Reference to parent node.
+
+    Like :any:`SymlinkNode`, all attribute accesses are forwarded to the target node.
+    In addition, the child nodes are :any:`SharedNode` views to the target child nodes,
+    created on access. The views are just weakly cached: they stay the same while they are referenced,
+    but do not occupy memory afterwards. So any number of views share one subtree, which just occupies memory once,
+    also after traversing all views.
+    Attributes cannot be set and the child nodes cannot be detached. The view itself can be moved freely.
+    See :any:`intern_subtrees` for creating the views automatically.
+
+    >>> from anytree import Node, RenderTree, SharedNode
+    >>> template = Node("config", mtu=1500, children=[Node("eth0"), Node("eth1")])
+    >>> root = Node("hosts")
+    >>> host0 = Node("host0", parent=root, children=[SharedNode(template)])
+    >>> host1 = Node("host1", parent=root, children=[SharedNode(template)])
+    >>> print(RenderTree(root))
+    Node('/hosts')
+    ├── Node('/hosts/host0')
+    │   └── SharedNode(Node('/config', mtu=1500))
+    │       ├── SharedNode(Node('/config/eth0'))
+    │       └── SharedNode(Node('/config/eth1'))
+    └── Node('/hosts/host1')
+        └── SharedNode(Node('/config', mtu=1500))
+            ├── SharedNode(Node('/config/eth0'))
+            └── SharedNode(Node('/config/eth1'))
+    >>> host1.children[0].children[1].path
+    (Node('/hosts'), Node('/hosts/host1'), SharedNode(Node('/config', mtu=1500)), SharedNode(Node('/config/eth1')))
+    >>> host0.children[0].mtu = 9000
+    Traceback (most recent call last):
+        ...
+    anytree.node.exceptions.TreeError: SharedNode is read-only.
+
+    .. note:: Nodes attached to a view are not detected. Keep the subtree below any view unmodified.
+    """
+
+    def __init__(self, target, parent=None):
+        self.__dict__["target"] = target
+        self.parent = parent
+
+    @classmethod
+    def _create(cls, target, parent):
+        # the child views are created at once and handed over to their parent without attaching
+        node = cls.__new__(cls)
+        node.__dict__.update(target=target, _NodeMixin__parent=parent)
+        return node
+
+    def __getattr__(self, name):
+        if name == "_NodeMixin__children":
+            return self.__get_children()
+        return super().__getattr__(name)
+
+    def __get_children(self):
+        targets = self.target.children
+        if not targets:
+            return []
+        ref = self.__dict__.get("_SharedNode__childrenref")
+        children = ref() if ref is not None else None
+        if children is None:
+            children = _Views(self._create(target, self) for target in targets)
+            for child in children:
+                # the views keep their siblings alive, so they stay the same while any of them is referenced
+                child.__dict__["_SharedNode__siblings"] = children
+            self.__dict__["_SharedNode__childrenref"] = weakref.ref(children)
+        return children
+
+    def __setattr__(self, name, value):
+        if name not in ("_NodeMixin__parent", "parent"):
+            msg = "SharedNode is read-only."
+            raise TreeError(msg)
+        super().__setattr__(name, value)
+
+    @property
+    def children(self):
+        """All child nodes: views to the target child nodes."""
+        return tuple(self._NodeMixin__children)  # pylint: disable=no-member
+
+    @children.setter
+    def children(self, children):
+        msg = "SharedNode is read-only."
+        raise TreeError(msg)
+
+    @children.deleter
+    def children(self):
+        msg = "SharedNode is read-only."
+        raise TreeError(msg)
+
+    def _pre_attach(self, parent):
+        if isinstance(parent, SharedNode):
+            msg = "SharedNode is read-only."
+            raise TreeError(msg)
+
+    def _pre_detach(self, parent):
+        if isinstance(parent, SharedNode):
+            msg = "SharedNode is read-only."
+            raise TreeError(msg)
+
+    def __repr__(self):
+        return _repr(self, [repr(self.target)], nameblacklist=("target",))
+
+
+class _Views(list):
+    """Child views of a :any:`SharedNode`, just weakly referenced by it."""
+
+    __slots__ = ("__weakref__",)
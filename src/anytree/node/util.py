@@ -1,3 +1,11 @@
+from array import array
+from collections import deque
+from itertools import chain, compress, count, repeat
+from operator import is_
+
+_SLOTNAMES = {}  # type: ignore[var-annotated]
+
+
 def _repr(node, args=None, nameblacklist=None):
     classname = node.__class__.__name__
     args = args or []
@@ -8,3 +16,292 @@ def _repr(node, args=None, nameblacklist=None):
     ):
         args.append(f"{key}={value!r}")
     return "{}({})".format(classname, ", ".join(args))
+
+
+def _slotnames(cls):
+    """
+    Public attribute names declared via `__slots__` by `cls` and its base classes.
+
+    Private (name-mangled) slots, like the tree links of :any:`LightNodeMixin`, are omitted.
+    """
+    try:
+        return _SLOTNAMES[cls]
+    except KeyError:
+        pass
+    names = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name in ("__dict__", "__weakref__") or (name.startswith("__") and not name.endswith("__")):
+                continue
+            if name not in names:
+                names.append(name)
+    names = _SLOTNAMES[cls] = tuple(names)
+    return names
+
+
+def _index(items, item):
+    """Return the position of `item` in `items` by identity or `None`. Items are never compared."""
+    return next(compress(count(), map(is_, items, repeat(item))), None)
+
+
+def _remove(items, item, index=None):
+    """Return a copy of the list `items` without `item`, which is expected at `index`, if given."""
+    if index is None or index >= len(items) or items[index] is not item:
+        return [other for other in items if other is not item]
+    items = items.copy()
+    del items[index]
+    return items
+
+
+# Marker of the pickled tree state, see `_reduce_ex`.
+_TREE = "anytree.tree"
+_TREESTATE_SIZE = 5
+_STATE_SLOTS = 2
+_OBJECT_GETSTATE = getattr(object, "__getstate__", None)
+# Marker of a node state, which is pickled by the `__reduce__` of the node class.
+_REDUCED = "anytree.reduced"
+
+
+def _reduce_ex(node, protocol, mixin):
+    """
+    Flat, recursion-free pickle protocol for trees.
+
+    The root node is pickled together with the whole tree: the node classes,
+    the state of every node without the tree links and the parent index of every node in level-order.
+    Any other node is pickled as reference to its root node and the path of child indices from there.
+    The links are rebuilt in bulk on unpickle.
+    Trees with a root node class, which implements its own `__setstate__` or `__reduce__`, are pickled as usual.
+    Any other node class with its own `__reduce__` is pickled with it.
+    """
+    if _has_reduce(type(node)):
+        return node.__reduce__()
+    parentname, childrenname = mixin._linknames  # pylint: disable=protected-access
+    root, path = _get_root_path(node, parentname, childrenname)
+    if type(root).__setstate__ is not mixin.__setstate__ or _has_reduce(type(root)):
+        return object.__reduce_ex__(node, protocol)
+    if path:
+        return _restore_node, (root, path, type(node))
+    nodes, parents = _flatten(root, childrenname)
+    types = list(map(type, nodes))
+    if types.count(types[0]) == len(types):
+        classes = [types[0]]
+        classidxs = None
+    else:
+        classmap = {}
+        classidxs = array("H", [classmap.setdefault(cls, len(classmap)) for cls in types])
+        classes = list(classmap)
+    states = _get_states(nodes, types, classes, parentname, childrenname)
+    return _restore_tree, (type(root),), (_TREE, classes, classidxs, states, parents)
+
+
+def _has_reduce(cls):
+    return cls.__reduce__ is not object.__reduce__
+
+
+def _get_root_path(node, parentname, childrenname):
+    path = []
+    parent = getattr(node, parentname, None)
+    while parent is not None:
+        for idx, child in enumerate(getattr(parent, childrenname)):
+            if child is node:
+                path.append(idx)
+                break
+        node = parent
+        parent = getattr(node, parentname, None)
+    path.reverse()
+    return node, tuple(path)
+
+
+def _flatten(root, childrenname):
+    # level-order, without recursion and without python calls per node
+    nodes = [root]
+    parents = array("i", [-1])
+    level = nodes
+    offset = 0
+    while level:
+        childlists = list(map(getattr, level, repeat(childrenname), repeat(())))
+        parents.extend(chain.from_iterable(map(repeat, range(offset, offset + len(level)), map(len, childlists))))
+        offset += len(level)
+        level = list(chain.from_iterable(childlists))
+        nodes.extend(level)
+    return nodes, parents
+
+
+def _get_states(nodes, types, classes, parentname, childrenname):
+    if len(classes) == 1 and _is_plain(classes[0]):
+        # fast path: copies of the instance dictionaries without the tree links
+        states = list(map(dict.copy, map(vars, nodes)))
+        _consume(map(dict.pop, states, repeat(parentname), repeat(None)))
+        _consume(map(dict.pop, states, repeat(childrenname), repeat(None)))
+        return states
+    return [_get_state(node, cls, parentname, childrenname) for node, cls in zip(nodes, types)]
+
+
+def _is_plain(cls):
+    """Instances of `cls` just have an instance dictionary as state."""
+    return (
+        getattr(cls, "__getstate__", None) is _OBJECT_GETSTATE
+        and cls.__dictoffset__ != 0
+        and not _slotnames(cls)
+        and not _has_reduce(cls)
+    )
+
+
+def _get_state(node, cls, parentname, childrenname):
+    if _has_reduce(cls):
+        # the node itself, unpickled by its `__reduce__`
+        return (_REDUCED, node)
+    if getattr(cls, "__getstate__", None) is not _OBJECT_GETSTATE:
+        state = node.__getstate__()
+        stripped = _strip_links(state, parentname, childrenname)
+        return state if stripped is _UNKNOWN else stripped
+    try:
+        state = _strip_links(vars(node), parentname, childrenname)
+    except TypeError:
+        state = None
+    slotnames = _slotnames(cls)
+    if slotnames:
+        slotstate = {}
+        for name in slotnames:
+            value = getattr(node, name, _UNKNOWN)
+            if value is not _UNKNOWN:
+                slotstate[name] = value
+        return (state or None, slotstate or None)
+    return state
+
+
+_UNKNOWN = object()
+
+
+def _strip_links(state, parentname, childrenname):
+    if state is None:
+        return None
+    if isinstance(state, dict):
+        state = dict(state)
+        state.pop(parentname, None)
+        state.pop(childrenname, None)
+        return state
+    if isinstance(state, tuple) and len(state) == _STATE_SLOTS:
+        return tuple(_strip_links(item, parentname, childrenname) for item in state)
+    return _UNKNOWN
+
+
+class _Pending:
+    """
+    Nodes of a tree, whose state is not unpickled yet, by their path.
+
+    Kept in the parent link of the root node until `_build_tree` takes them.
+    A failed unpickle leaves nothing behind.
+    """
+
+    __slots__ = ("nodes",)
+
+    def __init__(self):
+        self.nodes = {}
+
+
+def _restore_tree(cls):
+    """Create root node, see :any:`_reduce_ex`."""
+    root = cls.__new__(cls)
+    object.__setattr__(root, cls._linknames[0], _Pending())  # pylint: disable=protected-access
+    return root
+
+
+def _restore_node(root, path, cls):
+    """Return node at `path` below `root`, see :any:`_reduce_ex`."""
+    parentname, childrenname = type(root)._linknames  # pylint: disable=protected-access
+    pending = getattr(root, parentname, None)
+    if isinstance(pending, _Pending):
+        # the tree is not restored yet - `_build_tree` takes this node
+        node = pending.nodes.get(path)
+        if node is None:
+            node = pending.nodes[path] = cls.__new__(cls)
+        return node
+    node = root
+    for idx in path:
+        node = getattr(node, childrenname)[idx]
+    return node
+
+
+def _setstate(node, state, mixin):
+    """Counterpart of :any:`_reduce_ex`."""
+    if type(state) is tuple and len(state) == _TREESTATE_SIZE and state[0] == _TREE:
+        _build_tree(node, mixin, *state[1:])
+    else:
+        _apply_state(node, state)
+
+
+def _build_tree(root, mixin, classes, classidxs, states, parents):
+    # pylint: disable=too-many-arguments,too-many-locals
+    parentname, childrenname = mixin._linknames  # pylint: disable=protected-access
+    count = len(states)
+    if classidxs is None:
+        cls = classes[0]
+        nodes = [root, *map(cls.__new__, repeat(cls, count - 1))]
+    else:
+        nodes = [root, *(cls.__new__(cls) for cls in map(classes.__getitem__, classidxs[1:]))]
+    pending = getattr(root, parentname, None)
+    parents = parents.tolist()
+    childidxs = [[] for _ in range(count)]
+    _consume(map(list.append, map(childidxs.__getitem__, parents[1:]), range(1, count)))
+    if isinstance(pending, _Pending):
+        for path, node in pending.nodes.items():
+            idx = 0
+            for pos in path:
+                idx = childidxs[idx][pos]
+            nodes[idx] = node
+
+    setstate = mixin.__setstate__
+    if classidxs is None and _is_plain(cls) and cls.__setstate__ is setstate:
+        _consume(map(dict.update, map(vars, nodes), states))
+    else:
+        for idx, (node, state) in enumerate(zip(nodes, states)):
+            if type(state) is tuple and len(state) == _STATE_SLOTS and state[0] == _REDUCED:
+                nodes[idx] = state[1]
+            elif type(node).__setstate__ is setstate:
+                _apply_state(node, state)
+            else:
+                node.__setstate__(state)
+
+    setattr_ = object.__setattr__
+    parentnodes = list(map(nodes.__getitem__, parents))
+    parentnodes[0] = None
+    _consume(map(setattr_, nodes, repeat(parentname), parentnodes))
+    haschildren = list(map(bool, childidxs))
+    _consume(
+        map(
+            setattr_,
+            compress(nodes, haschildren),
+            repeat(childrenname),
+            ([*map(nodes.__getitem__, idxs)] for idxs in compress(childidxs, haschildren)),
+        )
+    )
+
+
+def _apply_state(node, state):
+    # like the default of `pickle`
+    if isinstance(state, tuple) and len(state) == _STATE_SLOTS:
+        state, slotstate = state
+    else:
+        slotstate = None
+    if state:
+        node.__dict__.update(state)
+    if slotstate:
+        for key, value in slotstate.items():
+            setattr(node, key, value)
+
+
+def _consume(iterator):
+    deque(iterator, maxlen=0)
+
+
+def _copy(node):
+    """Shallow copy - as without :any:`_reduce_ex`."""
+    reduced = object.__reduce_ex__(node, 4)
+    copied = reduced[0](*reduced[1])
+    if len(reduced) > _STATE_SLOTS and reduced[2] is not None:
+        _apply_state(copied, reduced[2])
+    return copied
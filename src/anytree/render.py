@@ -6,11 +6,15 @@ Tree Rendering.
     * :any:`ContStyle`
     * :any:`ContRoundStyle`
     * :any:`DoubleStyle`
+* :any:`RenderSummary` as placeholder for omitted nodes.
 """
 
+import bisect
 import collections
+import itertools
 
 from .config import ASSERTIONS
+from .node import Node
 
 Row = collections.namedtuple("Row", ("pre", "fill", "node"))
 
@@ -152,6 +156,8 @@ class RenderTree:
         style (AbstractStyle): Render Style.
         childiter: Child iterator.
         maxlevel: Limit rendering to this depth.
+        max_children: Limit rendering to this number of children per node.
+        max_rows: Limit rendering to this number of rows.
 
     :any:`RenderTree` is an iterator, returning a tuple with 3 items:
 
@@ -258,28 +264,186 @@ class RenderTree:
     │   ├── 1 2 3
     │   └── a b
     └── Z
+
+    `max_children` and `max_rows` truncate huge trees.
+    Omitted nodes are replaced by a :any:`RenderSummary` row:
+
+    >>> print(RenderTree(root, max_children=1).by_attr())
+    root
+    ├── sub0
+    │   ├── sub0B
+    │   └── ... 1 more
+    └── ... 1 more
+    >>> print(RenderTree(root, max_rows=3).by_attr())
+    root
+    ├── sub0
+    │   ├── sub0B
+    ...
     """
 
-    def __init__(self, node, style=CONT_STYLE, childiter=list, maxlevel=None):
+    def __init__(self, node, style=CONT_STYLE, childiter=list, maxlevel=None, max_children=None, max_rows=None):
         if not isinstance(style, AbstractStyle):
             style = style()
         self.node = node
         self.style = style
         self.childiter = childiter
         self.maxlevel = maxlevel
+        self.max_children = max_children
+        self.max_rows = max_rows
+        self.__rowcounts = {}
+        self.__offsetcache = {}
 
     def __iter__(self):
-        return self.__next(self.node, ())
-
-    def __next(self, node, continues, level=0):
-        yield RenderTree.__item(node, continues, self.style)
-        level += 1
-        if self.maxlevel is None or level < self.maxlevel:
-            children = node.children
+        rows = self.__rows(self.node, (), 0, [])
+        if self.max_rows is not None:
+            rows = RenderTree.__truncate(rows, self.max_rows)
+        return rows
+
+    def __rows(self, node, continues, level, stack):
+        # Pre-order without recursion, starting at `node`.
+        # `stack` holds the pending `(node, continues)` items and the level of every level above.
+        style = self.style
+        while True:
+            yield RenderTree.__item(node, continues, style)
+            children = self.__children(node, level)
             if children:
-                children = self.childiter(children)
-                for child, is_last in _is_last(children):
-                    yield from self.__next(child, (*continues, not is_last), level=level)
+                stack.append((_iter_items(children, continues), level + 1))
+            while stack:
+                items, level = stack[-1]
+                item = next(items, None)
+                if item is not None:
+                    node, continues = item
+                    break
+                stack.pop()
+            else:
+                return
+
+    def __children(self, node, level):
+        """Rendered children of `node` at `level`."""
+        if self.maxlevel is not None and level + 1 >= self.maxlevel:
+            return ()
+        children = node.children
+        if not children:
+            return ()
+        return self.__childiter(children)
+
+    def __childiter(self, children):
+        children = self.childiter(children)
+        max_children = self.max_children
+        if max_children is not None:
+            children = list(children)
+            if len(children) > max_children:
+                children = [*children[:max_children], RenderSummary(tuple(children[max_children:]))]
+        return children
+
+    @staticmethod
+    def __truncate(rows, max_rows):
+        yield from itertools.islice(rows, max_rows)
+        # the remaining rows are not rendered, just the existence of one is checked
+        for _ in rows:
+            yield Row("", "", RenderSummary())
+            break
+
+    def window(self, offset=0, limit=None):
+        """
+        Iterate over at most `limit` rows, starting at row number `offset`.
+
+        Subtrees located completely before `offset` are skipped without rendering them.
+        The number of rows of every subtree is determined once and cached, together with the
+        cumulated row numbers of the children of every node on the way to `offset`.
+        The start row is found by bisection on every level, so paging through a huge tree
+        just costs the page size and the depth of the tree.
+
+        >>> from anytree import Node, RenderTree
+        >>> root = Node("root")
+        >>> s0 = Node("sub0", parent=root)
+        >>> s0b = Node("sub0B", parent=s0)
+        >>> s0a = Node("sub0A", parent=s0)
+        >>> s1 = Node("sub1", parent=root)
+        >>> s1a = Node("sub1A", parent=s1)
+        >>> for row in RenderTree(root).window(2, 3):
+        ...     print("%s%s" % (row.pre, row.node.name))
+        │   ├── sub0B
+        │   └── sub0A
+        └── sub1
+
+        .. note:: The cached row counts are bound to the :any:`RenderTree` instance.
+                  Create a new instance after modifying the tree.
+        """
+        return itertools.islice(self.__window(offset), limit)
+
+    def count(self):
+        """
+        Number of rendered rows.
+
+        >>> from anytree import Node, RenderTree
+        >>> root = Node("root")
+        >>> s0 = Node("sub0", parent=root)
+        >>> s1 = Node("sub1", parent=s0)
+        >>> RenderTree(root).count()
+        3
+        >>> RenderTree(root, maxlevel=2).count()
+        2
+        """
+        return self.__rowcount(self.node, 0)
+
+    def __window(self, skip):
+        # descend to the row `skip`, keeping the remaining siblings on every level
+        node, continues, level = self.node, (), 0
+        stack = []
+        while skip:
+            children, offsets = self.__offsets(node, level)
+            idx = bisect.bisect_right(offsets, skip) - 1
+            if skip >= offsets[-1]:
+                return
+            skip -= offsets[idx]
+            items = _iter_items(map(children.__getitem__, range(idx, len(children))), continues)
+            node, continues = next(items)
+            level += 1
+            stack.append((items, level))
+        yield from self.__rows(node, continues, level, stack)
+
+    def __offsets(self, node, level):
+        """Rendered children of `node` and their row numbers within the subtree of `node`, followed by its row count."""
+        key = self.__key(node, level)
+        try:
+            return self.__offsetcache[key]
+        except KeyError:
+            pass
+        children = list(self.__children(node, level))
+        offsets = list(itertools.accumulate((self.__rowcount(child, level + 1) for child in children), initial=1))
+        self.__offsetcache[key] = children, offsets
+        return children, offsets
+
+    def __rowcount(self, node, level):
+        if isinstance(node, RenderSummary):
+            return 1
+        key = self.__key
+        rowcounts = self.__rowcounts
+        rootkey = key(node, level)
+        if rootkey not in rowcounts:
+            # post-order without recursion: every node is counted after its children
+            stack = [(node, level, None)]
+            while stack:
+                node, level, children = stack.pop()
+                if children is None:
+                    children = list(self.__children(node, level))
+                    stack.append((node, level, children))
+                    stack.extend(
+                        (child, level + 1, None)
+                        for child in children
+                        if not isinstance(child, RenderSummary) and key(child, level + 1) not in rowcounts
+                    )
+                else:
+                    rowcounts[key(node, level)] = 1 + sum(
+                        1 if isinstance(child, RenderSummary) else rowcounts[key(child, level + 1)]
+                        for child in children
+                    )
+        return rowcounts[rootkey]
+
+    def __key(self, node, level):
+        # with `maxlevel`, the row count of a node depends on its level
+        return (id(node), level) if self.maxlevel is not None else id(node)
 
     @staticmethod
     def __item(node, continues, style):
@@ -294,8 +458,8 @@ class RenderTree:
 
     def __str__(self):
         def get():
-            for row in self:
-                lines = repr(row.node).splitlines() or [""]
+            for row, text in _iter_repr(self):
+                lines = text.splitlines() or [""]
                 yield f"{row.pre}{lines[0]}"
                 for line in lines[1:]:
                     yield f"{row.fill}{line}"
@@ -337,16 +501,102 @@ class RenderTree:
         def get():
             if callable(attrname):
                 for row in self:
-                    attr = attrname(row.node)
+                    attr = attrname(row.node) if not isinstance(row.node, RenderSummary) else row.node
                     yield from _format_row_any(row, attr)
             else:
                 for row in self:
-                    attr = getattr(row.node, attrname, "")
+                    attr = getattr(row.node, attrname, "") if not isinstance(row.node, RenderSummary) else row.node
                     yield from _format_row_any(row, attr)
 
         return "\n".join(get())
 
 
+class RenderSummary:
+    """
+    Placeholder for nodes omitted by :any:`RenderTree`.
+
+    Args:
+        nodes: Omitted sibling nodes. `None` if unknown.
+
+    The summary is rendered instead of the omitted `nodes`, with their number.
+    The number of all omitted nodes, including their descendants, is just
+    determined on request, as it needs to visit the omitted subtrees:
+
+    >>> from anytree import Node, RenderTree
+    >>> root = Node("root")
+    >>> for idx in range(5):
+    ...     sub = Node(f"sub{idx}", parent=root)
+    ...     sub0 = Node(f"sub{idx}0", parent=sub)
+    >>> def label(node):
+    ...     if isinstance(node, RenderSummary):
+    ...         return f"{node!r} ({node.size} nodes)"
+    ...     return node.name
+    >>> for row in RenderTree(root, max_children=2, maxlevel=2):
+    ...     print("%s%s" % (row.pre, label(row.node)))
+    root
+    ├── sub0
+    ├── sub1
+    └── ... 3 more (6 nodes)
+
+    The rows omitted by `max_rows` are not visited at all. Their summary has no `nodes`:
+
+    >>> for row in RenderTree(root, max_rows=3):
+    ...     print("%s%s" % (row.pre, row.node))
+    Node('/root')
+    ├── Node('/root/sub0')
+    │   └── Node('/root/sub0/sub00')
+    ...
+    """
+
+    children = ()
+
+    def __init__(self, nodes=None):
+        self.nodes = nodes
+        self.__size = None
+
+    @property
+    def count(self):
+        """Number of omitted sibling nodes. `None` if unknown."""
+        nodes = self.nodes
+        if nodes is None:
+            return None
+        return len(nodes)
+
+    @property
+    def size(self):
+        """Number of omitted nodes including their descendants. `None` if unknown. Determined once."""
+        size = self.__size
+        if size is None and self.nodes is not None:
+            size = self.__size = sum(node.size for node in self.nodes)
+        return size
+
+    def __repr__(self):
+        count = self.count
+        if count is None:
+            return "..."
+        return f"... {count:,} more"
+
+
+def _iter_repr(rows):
+    # The path strings of :any:`Node` are derived from the parent row, instead of walking up to the root.
+    stack = []
+    for row in rows:
+        node = row.node
+        if type(node).__repr__ is not Node.__repr__:
+            yield row, repr(node)
+            continue
+        parent = node.parent
+        while stack and stack[-1][0] is not parent:
+            stack.pop()
+        separator = node.separator
+        if stack and stack[-1][1] == separator:
+            pathstr = stack[-1][2] + separator + str(node.name)
+        else:
+            pathstr = separator.join(["", *(str(item.name) for item in node.path)])
+        stack.append((node, separator, pathstr))
+        yield row, node._repr_path(pathstr)
+
+
 def _format_row_any(row, attr):
     if isinstance(attr, (list, tuple)):
         lines = attr or [""]
@@ -357,6 +607,11 @@ def _format_row_any(row, attr):
         yield f"{row.fill}{line}"
 
 
+def _iter_items(children, continues):
+    for child, is_last in _is_last(children):
+        yield child, (*continues, not is_last)
+
+
 def _is_last(iterable):
     iter_ = iter(iterable)
     try:
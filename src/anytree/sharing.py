@@ -0,0 +1,137 @@
+"""
+Subtree Sharing.
+
+* :any:`intern_subtrees`: replace identical subtrees by views to one shared subtree.
+
+Repetitive trees, like the same template below many nodes, occupy the memory of every copy.
+Identical subtrees are detected by a content hash and replaced by read-only :any:`SharedNode` views
+to one shared copy. :any:`DictImporter` does the same on import with ``intern=True``,
+without ever creating the duplicates.
+"""
+
+import hashlib
+from collections import Counter
+
+from .exporter import DictExporter
+from .node import SharedNode
+
+
+def intern_subtrees(root, minsize=2, exporter=None):
+    """
+    Replace identical subtrees below `root` by :any:`SharedNode` views and return `root`.
+
+    Args:
+        root: Root node.
+
+    Keyword Args:
+        minsize (int): Minimum number of nodes of a shared subtree.
+        exporter (DictExporter): Exporter defining the compared attributes.
+
+    All subtrees are hashed in one bottom-up pass: the node class and the attributes, as exported by `exporter`,
+    together with the hashes of the children in their order. Every subtree with at least `minsize` nodes,
+    which occurs more than once, is shared: the first occurrence is detached and all occurrences are
+    replaced by views to it. Just the topmost identical subtrees are shared.
+    Existing :any:`SharedNode` views are kept as they are.
+
+    >>> from anytree import Node, RenderTree
+    >>> from anytree.sharing import intern_subtrees
+    >>> root = Node("hosts")
+    >>> for name in ("host0", "host1", "host2"):
+    ...     host = Node(name, parent=root)
+    ...     config = Node("config", parent=host, mtu=1500, children=[Node("eth0"), Node("eth1")])
+    >>> config.mtu = 9000
+    >>> root = intern_subtrees(root)
+    >>> print(RenderTree(root))
+    Node('/hosts')
+    ├── Node('/hosts/host0')
+    │   └── SharedNode(Node('/config', mtu=1500))
+    │       ├── SharedNode(Node('/config/eth0'))
+    │       └── SharedNode(Node('/config/eth1'))
+    ├── Node('/hosts/host1')
+    │   └── SharedNode(Node('/config', mtu=1500))
+    │       ├── SharedNode(Node('/config/eth0'))
+    │       └── SharedNode(Node('/config/eth1'))
+    └── Node('/hosts/host2')
+        └── Node('/hosts/host2/config', mtu=9000)
+            ├── Node('/hosts/host2/config/eth0')
+            └── Node('/hosts/host2/config/eth1')
+    >>> root.children[0].children[0].target is root.children[1].children[0].target
+    True
+
+    .. note:: The attribute values need a deterministic `repr`.
+    """
+    exporter = exporter or DictExporter()
+    iter_attr_values = exporter._get_iter_attr_values()  # pylint: disable=protected-access
+    attriter = exporter.attriter or (lambda attr_values: attr_values)
+
+    def get_attrs(node):
+        if isinstance(node, SharedNode):
+            return (("", id(node.target)),)
+        return attriter(iter_attr_values(node))
+
+    def get_children(node):
+        return () if isinstance(node, SharedNode) else node.children
+
+    get_shared = _get_shared(root, get_attrs, get_children, minsize)
+    targets = {}
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        children = []
+        replaced = False
+        for child in node.children:
+            digest = get_shared(child)
+            if digest is not None:
+                children.append(SharedNode(targets.setdefault(digest, child)))
+                replaced = True
+            else:
+                children.append(child)
+                if not isinstance(child, SharedNode):
+                    stack.append(child)
+        if replaced:
+            node.children = children
+    return root
+
+
+def _get_shared(root, get_attrs, get_children, minsize):
+    """
+    Hash all subtrees of `root` and return a function telling the hash of a subtree to be shared, or `None`.
+
+    `get_attrs` returns the `(name, value)` pairs of an item and `get_children` its child items.
+    Items of different classes never share a hash.
+    Works on nodes as well as on plain data, without recursion. Items occurring repeatedly,
+    like one dictionary listed several times, are hashed once, but counted on every occurrence.
+    """
+    digests = {}
+    counts = Counter()
+    stack = [(root, iter(get_children(root)))]
+    while stack:
+        item, children = stack[-1]
+        for child in children:
+            known = digests.get(id(child))
+            if known is None:
+                stack.append((child, iter(get_children(child))))
+                break
+            # the very same item occurs again: just count it
+            if known[1] >= minsize:
+                counts[known[0]] += 1
+        else:
+            stack.pop()
+            # items of different classes are never identical
+            data = repr((id(type(item)), sorted(get_attrs(item), key=lambda attr: attr[0]))).encode("utf-8")
+            digest = hashlib.blake2b(len(data).to_bytes(8, "little") + data, digest_size=16)
+            size = 1
+            for child in get_children(item):
+                childdigest, childsize = digests[id(child)]
+                digest.update(childdigest)
+                size += childsize
+            digest = digest.digest()
+            digests[id(item)] = digest, size
+            if size >= minsize:
+                counts[digest] += 1
+
+    def get_shared(item):
+        digest, _ = digests[id(item)]
+        return digest if counts[digest] > 1 else None
+
+    return get_shared
@@ -0,0 +1,16 @@
+"""
+Tree Stores.
+
+* :any:`MmapTree`: Read-only tree backed by a memory-mapped file.
+* :any:`SqliteTree`: Persistent tree in a SQLite database.
+"""
+
+from .mmaptree import MmapNode, MmapTree
+from .sqlitetree import SqliteNode, SqliteTree
+
+__all__ = [
+    "MmapNode",
+    "MmapTree",
+    "SqliteNode",
+    "SqliteTree",
+]
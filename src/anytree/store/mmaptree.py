@@ -0,0 +1,263 @@
+import mmap
+import pickle
+import weakref
+from array import array
+
+from anytree import _binaryformat
+from anytree.node import NodeMixin, SymlinkNodeMixin, TreeError
+
+
+class MmapTree:
+    """
+    Read-only tree backed by a memory-mapped file in the format of :any:`BinaryExporter`.
+
+    Opening is independent of the tree size: just the header is read.
+    The subtree sizes, needed to find children and descendants, are derived from the
+    parent indices on first access.
+    Nodes are created as lightweight :any:`MmapNode` views on first access
+    and released again, once they are not referenced anymore.
+    Multiple processes opening the same file share it via the page cache of the operating system.
+
+    Args:
+        filepath: Path to the file.
+
+    >>> from anytree import Node, PreOrderIter, Resolver
+    >>> from anytree.exporter import BinaryExporter
+    >>> from anytree.store import MmapTree
+    >>> root = Node("root")
+    >>> s0 = Node("sub0", parent=root, size=1.5)
+    >>> s0a = Node("sub0A", parent=s0)
+    >>> s1 = Node("sub1", parent=root)
+    >>> with open("tree.bin", "wb") as file:
+    ...     BinaryExporter().write(root, file)
+
+    >>> with MmapTree("tree.bin") as tree:
+    ...     print(tree.root)
+    ...     print(tree.root.children)
+    ...     print(Resolver().get(tree.root, "sub0/sub0A").path)
+    ...     print([node.name for node in PreOrderIter(tree.root)])
+    MmapNode(name='root')
+    (MmapNode(name='sub0', size=1.5), MmapNode(name='sub1'))
+    (MmapNode(name='root'), MmapNode(name='sub0', size=1.5), MmapNode(name='sub0A'))
+    ['root', 'sub0', 'sub0A', 'sub1']
+
+    .. note:: Attributes, which collide with :any:`NodeMixin` properties (like `size` and `depth`),
+              are just accessible via :any:`MmapNode.getattr`.
+
+    .. warning:: Loading a file imports the modules of the stored node classes and unpickles
+                 attribute values of other types than `int`, `float`, `bool` and `str`.
+                 Both can execute arbitrary code. Never load data from untrusted sources.
+    """
+
+    def __init__(self, filepath):
+        with open(filepath, "rb") as file:
+            self.__mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.__layout = _binaryformat.Layout(self.__mmap)
+        self.__sections = {}
+        self.__views = weakref.WeakValueDictionary()
+        self.__symlinks = None
+        self.__sizes = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self.__layout.count
+
+    @property
+    def root(self):
+        """Root node."""
+        return self._get_node(0)
+
+    def close(self):
+        """Close the file. All nodes become invalid."""
+        for section in self.__sections.values():
+            if isinstance(section, memoryview):
+                section.release()
+        self.__sections.clear()
+        self.__sizes = None
+        self.__layout.buffer.release()
+        self.__mmap.close()
+
+    def _get_node(self, idx):
+        views = self.__views
+        node = views.get(idx)
+        if node is None:
+            node = views[idx] = MmapNode._create(self, idx)
+        return node
+
+    def _section(self, name):
+        sections = self.__sections
+        section = sections.get(name)
+        if section is None:
+            section = sections[name] = self.__layout.section(name)
+        return section
+
+    def _sizes(self):
+        """Subtree sizes, derived from the parent indices on first use."""
+        sizes = self.__sizes
+        if sizes is None:
+            parents = self._section("parent").tolist()
+            sizes = array("i", [1]) * len(parents)
+            # pre-order: every node is counted before its parent
+            for idx in range(len(parents) - 1, 0, -1):
+                sizes[parents[idx]] += sizes[idx]
+            self.__sizes = sizes
+        return sizes
+
+    def _columns(self):
+        return self.__layout.columns
+
+    def _entry(self, table, idx):
+        offsets = self._section(f"{table}.offsets")
+        return self._section(f"{table}.data")[offsets[idx] : offsets[idx + 1] - 1].tobytes()
+
+    def _get_value(self, idx, name, forward=True):
+        column = self.__layout.columns.get(name)
+        if column is None or (not column[1] and not self._section(f"present.{name}")[idx]):
+            if forward and self.__is_symlink(idx):
+                # like SymlinkNodeMixin: forward to target
+                return self._get_value(self._section("column.target")[idx], name)
+            return _MISSING
+        return self.__decode(column[0], self._section(f"column.{name}")[idx])
+
+    def __is_symlink(self, idx):
+        symlinks = self.__symlinks
+        if symlinks is None:
+            layout = self.__layout
+            symlinks = self.__symlinks = [issubclass(cls, SymlinkNodeMixin) for cls in layout.classes()]
+            if layout.columns.get("target", (None,))[0] != "node":
+                symlinks[:] = [False] * len(symlinks)
+        if len(symlinks) == 1:
+            return symlinks[0]
+        return symlinks[self._section("class")[idx]]
+
+    def __decode(self, type_, value):
+        if type_ == "str":
+            return self._entry("strings", value).decode("utf-8")
+        if type_ == "node":
+            return self._get_node(value)
+        if type_ == "object":
+            return pickle.loads(self._entry("objects", value))
+        if type_ == "bool":
+            return bool(value)
+        return value
+
+
+_MISSING = object()
+
+
+class MmapNode(NodeMixin):
+    """
+    Read-only view to one node of a :any:`MmapTree`.
+
+    All node attributes are read on first access.
+    The tree structure cannot be modified.
+    """
+
+    @classmethod
+    def _create(cls, tree, idx):
+        node = cls.__new__(cls)
+        node.__dict__.update(_MmapNode__tree=tree, _MmapNode__idx=idx)
+        return node
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        value = self.getattr(name)
+        if value is _MISSING:
+            msg = f"{self.__class__.__name__!r} object has no attribute {name!r}"
+            raise AttributeError(msg)
+        self.__dict__[name] = value
+        return value
+
+    def getattr(self, name, default=_MISSING):
+        """Return attribute `name` from file, or `default`."""
+        value = self.__tree._get_value(self.__idx, name)  # pylint: disable=protected-access
+        return default if value is _MISSING else value
+
+    def __repr__(self):
+        tree, idx = self.__tree, self.__idx
+        args = []
+        for name in sorted(tree._columns()):  # pylint: disable=protected-access
+            value = tree._get_value(idx, name, forward=False)  # pylint: disable=protected-access
+            if value is not _MISSING and not name.startswith("_"):
+                args.append(f"{name}={value!r}")
+        return f"{self.__class__.__name__}({', '.join(args)})"
+
+    @property
+    def parent(self):
+        """Parent Node."""
+        parentidx = self.__tree._section("parent")[self.__idx]  # pylint: disable=protected-access
+        if parentidx < 0:
+            return None
+        return self.__tree._get_node(parentidx)  # pylint: disable=protected-access
+
+    @parent.setter
+    def parent(self, value):
+        msg = "MmapNode is read-only."
+        raise TreeError(msg)
+
+    @property
+    def children(self):
+        """All child nodes."""
+        tree, idx = self.__tree, self.__idx
+        sizes = tree._sizes()  # pylint: disable=protected-access
+        # pre-order: every child follows the subtree of its preceding sibling
+        childidxs = []
+        childidx, end = idx + 1, idx + sizes[idx]
+        while childidx < end:
+            childidxs.append(childidx)
+            childidx += sizes[childidx]
+        return tuple(map(tree._get_node, childidxs))  # pylint: disable=protected-access
+
+    @children.setter
+    def children(self, children):
+        msg = "MmapNode is read-only."
+        raise TreeError(msg)
+
+    @children.deleter
+    def children(self):
+        msg = "MmapNode is read-only."
+        raise TreeError(msg)
+
+    @property
+    def descendants(self):
+        """All child nodes and all their child nodes."""
+        tree, idx = self.__tree, self.__idx
+        size = tree._sizes()[idx]  # pylint: disable=protected-access
+        return tuple(map(tree._get_node, range(idx + 1, idx + size)))  # pylint: disable=protected-access
+
+    @property
+    def root(self):
+        """Tree Root Node."""
+        return self.__tree.root
+
+    @property
+    def is_leaf(self):
+        """`Node` has no children (External Node)."""
+        # pre-order: the first child directly follows its parent
+        tree, idx = self.__tree, self.__idx
+        return idx + 1 >= len(tree) or tree._section("parent")[idx + 1] != idx  # pylint: disable=protected-access
+
+    @property
+    def height(self):
+        """Number of edges on the longest path to a leaf `Node`."""
+        tree, idx = self.__tree, self.__idx
+        parents = tree._section("parent")  # pylint: disable=protected-access
+        size = tree._sizes()[idx]  # pylint: disable=protected-access
+        # pre-order: every parent is visited before its children
+        depths = {idx: 0}
+        height = 0
+        for descidx in range(idx + 1, idx + size):
+            depth = depths[descidx] = depths[parents[descidx]] + 1
+            height = max(height, depth)
+        return height
+
+    @property
+    def size(self):
+        """Tree size --- the number of nodes in tree starting at this node."""
+        return self.__tree._sizes()[self.__idx]  # pylint: disable=protected-access
@@ -0,0 +1,456 @@
+import pickle
+import sqlite3
+import weakref
+
+from anytree.exporter.dictexporter import DictExporter
+from anytree.node import NodeMixin, TreeError
+from anytree.node.util import _repr
+from anytree.search import CountError
+
+_INT64 = (-(1 << 63), (1 << 63) - 1)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS nodes (
+    id INTEGER PRIMARY KEY,
+    parent INTEGER,
+    position INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS nodes_parent ON nodes (parent, position);
+CREATE TABLE IF NOT EXISTS closure (
+    ancestor INTEGER NOT NULL,
+    descendant INTEGER NOT NULL,
+    depth INTEGER NOT NULL,
+    PRIMARY KEY (ancestor, descendant)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS closure_descendant ON closure (descendant, depth);
+CREATE TABLE IF NOT EXISTS attributes (
+    node INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    value,
+    pickled INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (node, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS attributes_value ON attributes (name, value);
+"""
+
+
+class SqliteTree:
+    """
+    Persistent tree in a SQLite database.
+
+    The tree structure is stored as closure table: one row for every node and each of its ancestors.
+    Nodes are loaded lazily as :any:`SqliteNode` on first access and released again,
+    once they are not referenced anymore. Every modification of the tree structure or of a node attribute
+    is written to the database immediately. Use :any:`commit` or :any:`close` to make it durable.
+    Queries on descendants, ancestors and attributes are executed by SQLite,
+    so huge trees never need to be loaded completely.
+
+    Args:
+        database: Path to the database file or ``":memory:"``.
+
+    Keyword Args:
+        nodecls: Node class, :any:`SqliteNode` by default.
+
+    >>> from anytree import RenderTree
+    >>> from anytree.store import SqliteNode, SqliteTree
+    >>> tree = SqliteTree(":memory:")
+    >>> root = SqliteNode(tree, name="root")
+    >>> s0 = SqliteNode(tree, name="sub0", parent=root, size_=4)
+    >>> s0a = SqliteNode(tree, name="sub0A", parent=s0)
+    >>> s1 = SqliteNode(tree, name="sub1", parent=root, size_=4)
+    >>> print(RenderTree(root))
+    SqliteNode(name='root')
+    ├── SqliteNode(name='sub0', size_=4)
+    │   └── SqliteNode(name='sub0A')
+    └── SqliteNode(name='sub1', size_=4)
+    >>> tree.findall(size_=4)
+    (SqliteNode(name='sub0', size_=4), SqliteNode(name='sub1', size_=4))
+    >>> tree.close()
+
+    Existing trees are copied via :any:`insert`:
+
+    >>> from anytree import Node
+    >>> tree = SqliteTree(":memory:")
+    >>> root = tree.insert(Node("root", children=[Node("sub0"), Node("sub1")]))
+    >>> root.children
+    (SqliteNode(name='sub0'), SqliteNode(name='sub1'))
+    >>> tree.close()
+
+    .. note:: Attribute values of type `int`, `float` and `str` are stored as they are,
+              any other value is pickled.
+
+    .. note:: The closure table grows with the number of nodes times the tree depth.
+    """
+
+    def __init__(self, database, nodecls=None):
+        self.nodecls = nodecls or SqliteNode
+        self.__connection = sqlite3.connect(database)
+        self.__connection.executescript(_SCHEMA)
+        self.__views = weakref.WeakValueDictionary()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self.__connection.execute("SELECT COUNT(*) FROM nodes").fetchone()[0]
+
+    @property
+    def roots(self):
+        """All root nodes in the order of creation."""
+        return self.__get_nodes("SELECT id FROM nodes WHERE parent IS NULL ORDER BY id")
+
+    def get(self, nodeid):
+        """Return node with `nodeid`."""
+        if self.__connection.execute("SELECT 1 FROM nodes WHERE id = ?", (nodeid,)).fetchone() is None:
+            msg = f"Unknown node id {nodeid!r}."
+            raise KeyError(msg)
+        return self._get_node(nodeid)
+
+    def commit(self):
+        """Make all modifications durable."""
+        self.__connection.commit()
+
+    def close(self):
+        """Commit and close the database. All nodes become invalid."""
+        self.__connection.commit()
+        self.__connection.close()
+
+    def insert(self, node, parent=None):
+        """
+        Insert a copy of the tree starting at `node` below `parent` and return the new node.
+
+        `node` can be any node of any tree. It is not modified.
+        Attributes starting with an underscore are not stored.
+        """
+        connection = self.__connection
+        nextid = connection.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM nodes").fetchone()[0]
+        iter_attr_values = DictExporter._iter_attr_values  # pylint: disable=protected-access
+        noderows, closurerows, attrrows = [], [], []
+
+        def add(node, parentid, position, ancestorids):
+            nodeid = nextid + len(noderows)
+            noderows.append((nodeid, parentid, position))
+            ancestorids = (*ancestorids, nodeid)
+            closurerows.extend((ancestorid, nodeid, depth) for depth, ancestorid in enumerate(reversed(ancestorids)))
+            attrs = node._get_attrs().items() if isinstance(node, SqliteNode) else iter_attr_values(node)  # pylint: disable=protected-access
+            attrrows.extend((nodeid, name, *_encode(value)) for name, value in attrs if not name.startswith("_"))
+            return ancestorids, iter(node.children)
+
+        # explicit stack instead of recursion - deep trees must not hit the recursion limit
+        stack = [add(node, None, 0, ())]
+        while stack:
+            ancestorids, children = stack[-1]
+            for position, child in enumerate(children):
+                stack.append(add(child, ancestorids[-1], position, ancestorids))
+                break
+            else:
+                stack.pop()
+        connection.executemany("INSERT INTO nodes (id, parent, position) VALUES (?, ?, ?)", noderows)
+        connection.executemany("INSERT INTO closure (ancestor, descendant, depth) VALUES (?, ?, ?)", closurerows)
+        connection.executemany("INSERT INTO attributes (node, name, value, pickled) VALUES (?, ?, ?, ?)", attrrows)
+        inserted = self._get_node(nextid)
+        inserted.parent = parent
+        return inserted
+
+    def delete(self, node):
+        """Detach `node` and remove it and all its descendants from the database."""
+        node.parent = None
+        nodeid = node.nodeid
+        connection = self.__connection
+        subtree = "SELECT descendant FROM closure WHERE ancestor = ?"
+        for descendantid, *_ in connection.execute(subtree, (nodeid,)).fetchall():
+            self.__views.pop(descendantid, None)
+        connection.execute(f"DELETE FROM attributes WHERE node IN ({subtree})", (nodeid,))
+        connection.execute(f"DELETE FROM nodes WHERE id IN ({subtree})", (nodeid,))
+        connection.execute(f"DELETE FROM closure WHERE descendant IN ({subtree})", (nodeid,))
+
+    def findall(self, top=None, **attrs):
+        """
+        Return all nodes with the given attribute values, in the order of creation.
+
+        The search is limited to the subtree of `top`, including `top` itself.
+        """
+        joins = []
+        params = []
+        if top is not None:
+            joins.append("JOIN closure c ON c.descendant = n.id AND c.ancestor = ?")
+            params.append(top.nodeid)
+        for idx, (name, value) in enumerate(attrs.items()):
+            joins.append(
+                f"JOIN attributes a{idx} ON a{idx}.node = n.id AND a{idx}.name = ? "
+                f"AND a{idx}.value = ? AND a{idx}.pickled = ?"
+            )
+            params.extend((name, *_encode(value)))
+        return self.__get_nodes(f"SELECT n.id FROM nodes n {' '.join(joins)} ORDER BY n.id", params)
+
+    def find(self, top=None, **attrs):
+        """Return the *single* node with the given attribute values or `None`."""
+        result = self.findall(top, **attrs)
+        if len(result) > 1:
+            msg = "Expecting %d elements at maximum, but found %d."
+            raise CountError(msg % (1, len(result)), result)
+        return result[0] if result else None
+
+    def _get_node(self, nodeid):
+        views = self.__views
+        node = views.get(nodeid)
+        if node is None:
+            node = views[nodeid] = self.nodecls._create(self, nodeid)  # pylint: disable=protected-access
+        return node
+
+    def __get_nodes(self, sql, params=()):
+        return tuple(self._get_node(nodeid) for nodeid, *_ in self.__connection.execute(sql, params).fetchall())
+
+    def _execute(self, sql, params=()):
+        return self.__connection.execute(sql, params)
+
+    def _add(self, node, attrs):
+        connection = self.__connection
+        nodeid = connection.execute("INSERT INTO nodes (parent) VALUES (NULL)").lastrowid
+        connection.execute("INSERT INTO closure (ancestor, descendant, depth) VALUES (?, ?, 0)", (nodeid, nodeid))
+        connection.executemany(
+            "INSERT INTO attributes (node, name, value, pickled) VALUES (?, ?, ?, ?)",
+            [(nodeid, name, *_encode(value)) for name, value in attrs.items() if not name.startswith("_")],
+        )
+        self.__views[nodeid] = node
+        return nodeid
+
+    def _get_attrs(self, nodeid):
+        rows = self.__connection.execute("SELECT name, value, pickled FROM attributes WHERE node = ?", (nodeid,))
+        return {name: _decode(value, pickled) for name, value, pickled in rows}
+
+    def _set_attr(self, nodeid, name, value):
+        self.__connection.execute(
+            "INSERT OR REPLACE INTO attributes (node, name, value, pickled) VALUES (?, ?, ?, ?)",
+            (nodeid, name, *_encode(value)),
+        )
+
+    def _del_attr(self, nodeid, name):
+        sql = "DELETE FROM attributes WHERE node = ? AND name = ?"
+        return self.__connection.execute(sql, (nodeid, name)).rowcount
+
+    def _attach(self, nodeid, parentid):
+        connection = self.__connection
+        connection.execute(
+            "UPDATE nodes SET parent = ?, "
+            "position = (SELECT COALESCE(MAX(position) + 1, 0) FROM nodes WHERE parent = ?) WHERE id = ?",
+            (parentid, parentid, nodeid),
+        )
+        connection.execute(
+            "INSERT INTO closure (ancestor, descendant, depth) "
+            "SELECT p.ancestor, c.descendant, p.depth + c.depth + 1 FROM closure p, closure c "
+            "WHERE p.descendant = ? AND c.ancestor = ?",
+            (parentid, nodeid),
+        )
+
+    def _set_positions(self, nodeids):
+        sql = "UPDATE nodes SET position = ? WHERE id = ?"
+        self.__connection.executemany(sql, enumerate(nodeids))
+
+    def _detach(self, nodeid):
+        connection = self.__connection
+        connection.execute(
+            "DELETE FROM closure WHERE descendant IN (SELECT descendant FROM closure WHERE ancestor = ?) "
+            "AND ancestor IN (SELECT ancestor FROM closure WHERE descendant = ? AND depth > 0)",
+            (nodeid, nodeid),
+        )
+        connection.execute("UPDATE nodes SET parent = NULL, position = 0 WHERE id = ?", (nodeid,))
+
+
+def _encode(value):
+    if type(value) in (str, float) or (type(value) is int and _INT64[0] <= value <= _INT64[1]):
+        return value, 0
+    return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), 1
+
+
+def _decode(value, pickled):
+    return pickle.loads(value) if pickled else value
+
+
+class SqliteNode(NodeMixin):
+    """
+    Node of a :any:`SqliteTree`.
+
+    The node attributes, the parent and the children are read on first access.
+    Any modification is written to the database.
+    Attributes starting with an underscore are not stored.
+
+    Args:
+        tree: :any:`SqliteTree`.
+
+    Keyword Args:
+        parent: Reference to parent node.
+        children: Iterable with child nodes.
+        *: Any other given attribute value is stored as attribute.
+
+    .. note:: The database is updated via :any:`_post_attach`, :any:`_post_detach` and
+              :any:`_post_attach_children`.
+              Subclasses, which implement these methods, need to call them on `super()`.
+    """
+
+    def __init__(self, tree, parent=None, children=None, **kwargs):
+        self.__dict__.update(
+            kwargs,
+            _SqliteNode__tree=tree,
+            _SqliteNode__loaded=True,
+            _NodeMixin__parent=None,
+            _NodeMixin__children=[],
+        )
+        self.__dict__["_SqliteNode__id"] = tree._add(self, kwargs)  # pylint: disable=protected-access
+        self.parent = parent
+        if children:
+            self.children = children
+
+    @classmethod
+    def _create(cls, tree, nodeid):
+        node = cls.__new__(cls)
+        node.__dict__.update(_SqliteNode__tree=tree, _SqliteNode__id=nodeid, _SqliteNode__loaded=False)
+        return node
+
+    @property
+    def nodeid(self):
+        """Database id of the node."""
+        return self.__id
+
+    def __getattr__(self, name):
+        if name == "_NodeMixin__parent":
+            return self.__load_parent()
+        if name == "_NodeMixin__children":
+            return self.__load_children()
+        if name.startswith("_") or self.__loaded:
+            msg = f"{self.__class__.__name__!r} object has no attribute {name!r}"
+            raise AttributeError(msg)
+        self.__load_attrs()
+        return getattr(self, name)
+
+    def __setattr__(self, name, value):
+        if not (name.startswith("_") or hasattr(type(self), name)):
+            # the old value is needed by subscriptions
+            self.__load_attrs()
+            self.__tree._set_attr(self.__id, name, value)  # pylint: disable=protected-access
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name):
+        if not (name.startswith("_") or hasattr(type(self), name)):
+            self.__load_attrs()
+            if not self.__tree._del_attr(self.__id, name):  # pylint: disable=protected-access
+                raise AttributeError(name)
+        super().__delattr__(name)
+
+    def __repr__(self):
+        self.__load_attrs()
+        return _repr(self)
+
+    def _get_attrs(self):
+        """Stored attributes."""
+        self.__load_attrs()
+        return {name: value for name, value in self.__dict__.items() if not name.startswith("_")}
+
+    def __load_attrs(self):
+        if not self.__loaded:
+            attrs = self.__tree._get_attrs(self.__id)  # pylint: disable=protected-access
+            for name, value in attrs.items():
+                self.__dict__.setdefault(name, value)
+            self.__dict__["_SqliteNode__loaded"] = True
+
+    def __load_parent(self):
+        sql = "SELECT parent FROM nodes WHERE id = ?"
+        (parentid,) = self.__tree._execute(sql, (self.__id,)).fetchone()  # pylint: disable=protected-access
+        parent = None if parentid is None else self.__tree._get_node(parentid)  # pylint: disable=protected-access
+        self.__dict__["_NodeMixin__parent"] = parent
+        return parent
+
+    def __load_children(self):
+        sql = "SELECT id FROM nodes WHERE parent = ? ORDER BY position, id"
+        tree = self.__tree
+        children = [tree._get_node(childid) for childid, *_ in tree._execute(sql, (self.__id,))]  # pylint: disable=protected-access
+        for child in children:
+            child.__dict__.setdefault("_NodeMixin__parent", self)
+        self.__dict__["_NodeMixin__children"] = children
+        return children
+
+    def __get_nodes(self, sql):
+        tree = self.__tree
+        rows = tree._execute(sql, (self.__id,)).fetchall()  # pylint: disable=protected-access
+        return tuple(tree._get_node(nodeid) for nodeid, *_ in rows)  # pylint: disable=protected-access
+
+    def __get_value(self, sql):
+        return self.__tree._execute(sql, (self.__id,)).fetchone()[0]  # pylint: disable=protected-access
+
+    @property
+    def ancestors(self):
+        """All parent nodes and their parent nodes - from the database."""
+        return self.__get_nodes("SELECT ancestor FROM closure WHERE descendant = ? AND depth > 0 ORDER BY depth DESC")
+
+    @property
+    def descendants(self):
+        """
+        All child nodes and all their child nodes - from the database.
+
+        The whole subtree is read with one query. The links of all nodes are loaded on the way.
+        """
+        tree = self.__tree
+        sql = (
+            "SELECT n.id, n.parent FROM closure c JOIN nodes n ON n.id = c.descendant "
+            "WHERE c.ancestor = ? AND c.depth > 0 ORDER BY n.position, n.id"
+        )
+        childids = {}
+        for nodeid, parentid in tree._execute(sql, (self.__id,)):  # pylint: disable=protected-access
+            childids.setdefault(parentid, []).append(nodeid)
+        # pre-order, without recursion
+        descendants = []
+        stack = [(self, iter(childids.get(self.__id, ())))]
+        while stack:
+            parent, children = stack[-1]
+            for childid in children:
+                child = tree._get_node(childid)  # pylint: disable=protected-access
+                descendants.append(child)
+                child.__dict__.setdefault("_NodeMixin__parent", parent)
+                stack.append((child, iter(childids.get(childid, ()))))
+                break
+            else:
+                stack.pop()
+                if "_NodeMixin__children" not in parent.__dict__:
+                    parent.__dict__["_NodeMixin__children"] = list(
+                        map(tree._get_node, childids.get(parent.nodeid, ()))  # pylint: disable=protected-access
+                    )
+        return tuple(descendants)
+
+    @property
+    def root(self):
+        """Tree Root Node - from the database."""
+        sql = "SELECT ancestor FROM closure WHERE descendant = ? ORDER BY depth DESC LIMIT 1"
+        return self.__get_nodes(sql)[0]
+
+    @property
+    def depth(self):
+        """Number of edges to the root `Node` - from the database."""
+        return self.__get_value("SELECT MAX(depth) FROM closure WHERE descendant = ?")
+
+    @property
+    def height(self):
+        """Number of edges on the longest path to a leaf `Node` - from the database."""
+        return self.__get_value("SELECT MAX(depth) FROM closure WHERE ancestor = ?")
+
+    @property
+    def size(self):
+        """Tree size --- the number of nodes in tree starting at this node - from the database."""
+        return self.__get_value("SELECT COUNT(*) FROM closure WHERE ancestor = ?")
+
+    def _pre_attach(self, parent):
+        if not isinstance(parent, SqliteNode) or parent.__tree is not self.__tree:
+            msg = f"Parent node {parent!r} is not part of the same 'SqliteTree'."
+            raise TreeError(msg)
+
+    def _post_attach(self, parent):
+        self.__tree._attach(self.__id, parent.nodeid)  # pylint: disable=protected-access
+
+    def _post_detach(self, parent):
+        self.__tree._detach(self.__id)  # pylint: disable=protected-access
+
+    def _post_attach_children(self, children):
+        # the children might just have been reordered by a batch
+        self.__tree._set_positions([child.nodeid for child in self.children])  # pylint: disable=protected-access
@@ -0,0 +1,70 @@
+from anytree import AnyNode, Node
+from anytree.exporter import AdjacencyExporter
+from anytree.importer import AdjacencyImporter
+
+from .helper import eq_
+
+
+def test_adjacency_exporter():
+    """Adjacency Exporter."""
+    root = AnyNode(id="root")
+    s0 = AnyNode(id="sub0", parent=root)
+    AnyNode(id="sub0B", parent=s0, parent_id="ignored")
+    AnyNode(id="sub0A", parent=s0)
+    s1 = AnyNode(id="sub1", parent=root, b=2)
+    AnyNode(id="sub1A", parent=s1)
+
+    exporter = AdjacencyExporter()
+    eq_(
+        list(exporter.export(root)),
+        [
+            {"id": "root", "parent_id": None},
+            {"id": "sub0", "parent_id": "root"},
+            {"id": "sub0B", "parent_id": "sub0"},
+            {"id": "sub0A", "parent_id": "sub0"},
+            {"id": "sub1", "parent_id": "root", "b": 2},
+            {"id": "sub1A", "parent_id": "sub1"},
+        ],
+    )
+    eq_(
+        list(exporter.export(s1)),
+        [
+            {"id": "sub1", "parent_id": None, "b": 2},
+            {"id": "sub1A", "parent_id": "sub1"},
+        ],
+    )
+
+    exporter = AdjacencyExporter(childiter=reversed, maxlevel=2, attriter=lambda attrs: [])
+    eq_(
+        list(exporter.export(root)),
+        [
+            {"id": "root", "parent_id": None},
+            {"id": "sub1", "parent_id": "root"},
+            {"id": "sub0", "parent_id": "root"},
+        ],
+    )
+    eq_(list(AdjacencyExporter(maxlevel=1).export(root)), [{"id": "root", "parent_id": None}])
+
+
+def test_adjacency_exporter_csv(tmp_path):
+    """Adjacency Exporter to CSV."""
+    root = Node("root")
+    s0 = Node("sub0", parent=root, a=1)
+    Node("sub0A", parent=s0)
+    Node("sub1", parent=root)
+    exporter = AdjacencyExporter(idname="name", parentidname="parent")
+
+    with open(tmp_path / "tree.csv", "w", newline="") as filehandle:
+        exporter.write(root, filehandle)
+    eq_((tmp_path / "tree.csv").read_text(), "name,parent,a\nroot,,\nsub0,root,1\nsub0A,sub0,\nsub1,root,\n")
+
+    with open(tmp_path / "tree.csv", "w", newline="") as filehandle:
+        exporter.write(root, filehandle, fieldnames=["name", "parent"], extrasaction="ignore", lineterminator="\n")
+    eq_((tmp_path / "tree.csv").read_text(), "name,parent\nroot,\nsub0,root\nsub0A,sub0\nsub1,root\n")
+
+    with open(tmp_path / "tree.csv", newline="") as filehandle:
+        imported = AdjacencyImporter(Node, idname="name", parentidname="parent").read(filehandle)
+    eq_(
+        list(exporter.export(imported)),
+        list(AdjacencyExporter(idname="name", parentidname="parent", attriter=lambda attrs: []).export(root)),
+    )
@@ -0,0 +1,89 @@
+from anytree import LoopError, Node, RenderTree, TreeError
+from anytree.exporter import AdjacencyExporter
+from anytree.importer import AdjacencyImporter
+
+from .helper import assert_raises, eq_
+
+
+def test_adjacency_importer():
+    """Adjacency Importer."""
+    rows = [
+        {"id": "sub1Ca", "parent_id": "sub1C"},
+        {"id": "sub0", "parent_id": "root"},
+        {"id": "sub0B", "parent_id": "sub0", "b": 1},
+        {"id": "sub1C", "parent_id": "sub1"},
+        {"id": "sub0A", "parent_id": "sub0"},
+        {"id": "sub1", "parent_id": "root"},
+        {"id": "root", "parent_id": None},
+        {"id": "sub1A", "parent_id": "sub1"},
+    ]
+    root = AdjacencyImporter().import_(iter(rows))
+    eq_(
+        str(RenderTree(root)).splitlines(),
+        [
+            "AnyNode(id='root')",
+            "├── AnyNode(id='sub0')",
+            "│   ├── AnyNode(b=1, id='sub0B')",
+            "│   └── AnyNode(id='sub0A')",
+            "└── AnyNode(id='sub1')",
+            "    ├── AnyNode(id='sub1C')",
+            "    │   └── AnyNode(id='sub1Ca')",
+            "    └── AnyNode(id='sub1A')",
+        ],
+    )
+
+
+def test_adjacency_importer_fieldnames():
+    """Adjacency Importer with sequences."""
+    rows = [(2, 1, "sub0"), (1, "", "root"), (3, 1, "sub1")]
+    importer = AdjacencyImporter(Node, idname="key", parentidname="up", fieldnames=("key", "up", "name"))
+    root = importer.import_(rows)
+    eq_(
+        str(RenderTree(root)).splitlines(),
+        [
+            "Node('/root', key=1)",
+            "├── Node('/root/sub0', key=2)",
+            "└── Node('/root/sub1', key=3)",
+        ],
+    )
+
+
+def test_adjacency_importer_deep():
+    """Adjacency Importer with deep tree."""
+    depth = 10000
+    rows = [{"id": idx, "parent_id": idx - 1 if idx else None} for idx in range(depth, -1, -1)]
+    root = AdjacencyImporter().import_(rows)
+    rows.reverse()
+    eq_(list(AdjacencyExporter().export(root)), rows)
+
+
+def test_adjacency_importer_csv(tmp_path):
+    """Adjacency Importer from CSV."""
+    (tmp_path / "tree.csv").write_text("1,,root\n2,1,sub0\n3,2,sub0A\n")
+    with open(tmp_path / "tree.csv", newline="") as filehandle:
+        root = AdjacencyImporter(fieldnames=["id", "parent_id", "a"]).read(filehandle)
+    eq_(
+        str(RenderTree(root)).splitlines(),
+        [
+            "AnyNode(a='root', id='1')",
+            "└── AnyNode(a='sub0', id='2')",
+            "    └── AnyNode(a='sub0A', id='3')",
+        ],
+    )
+
+
+def test_adjacency_importer_error():
+    """Adjacency Importer Errors."""
+    importer = AdjacencyImporter()
+    with assert_raises(TreeError, "Duplicate node id=2."):
+        importer.import_([{"id": 1}, {"id": 2, "parent_id": 1}, {"id": 2, "parent_id": 1}])
+    with assert_raises(TreeError, "Expected one root node, but got 0: []."):
+        importer.import_([])
+    with assert_raises(TreeError, "Expected one root node, but got 2: [1, 3]."):
+        importer.import_([{"id": 1}, {"id": 2, "parent_id": 1}, {"id": 3}])
+    with assert_raises(TreeError, "Node id=3 refers to unknown parent id=4."):
+        importer.import_([{"id": 1}, {"id": 2, "parent_id": 3}, {"id": 3, "parent_id": 4}])
+    with assert_raises(LoopError, "Node id=3 is part of a loop."):
+        importer.import_([{"id": 1}, {"id": 2, "parent_id": 3}, {"id": 3, "parent_id": 3}])
+    with assert_raises(LoopError, "Node id=3 is part of a loop."):
+        importer.import_([{"id": 1}, {"id": 2, "parent_id": 3}, {"id": 3, "parent_id": 4}, {"id": 4, "parent_id": 3}])
@@ -0,0 +1,315 @@
+from anytree import LightNodeMixin, LoopError, MerkleNodeMixin, Node, SharedNode, TreeError, batch
+from anytree.store import SqliteTree
+
+from .helper import assert_raises, eq_
+
+
+class LogNode(Node):
+    def __init__(self, name, log, parent=None, children=None):
+        self.__dict__["log"] = log
+        super().__init__(name, parent=parent, children=children)
+
+    def _pre_detach(self, parent):
+        self.log.append(("pre_detach", self.name, parent.name))
+
+    def _post_detach(self, parent):
+        self.log.append(("post_detach", self.name, parent.name))
+
+    def _pre_attach(self, parent):
+        self.log.append(("pre_attach", self.name, parent.name))
+
+    def _post_attach(self, parent):
+        self.log.append(("post_attach", self.name, parent.name))
+
+    def _pre_detach_children(self, children):
+        self.log.append(("pre_detach_children", self.name, [child.name for child in children]))
+
+    def _post_detach_children(self, children):
+        self.log.append(("post_detach_children", self.name, [child.name for child in children]))
+
+    def _pre_attach_children(self, children):
+        self.log.append(("pre_attach_children", self.name, [child.name for child in children]))
+
+    def _post_attach_children(self, children):
+        self.log.append(("post_attach_children", self.name, [child.name for child in children]))
+
+
+def _names(nodes):
+    return [node.name for node in nodes]
+
+
+def test_batch():
+    log = []
+    root = LogNode("root", log)
+    s0 = LogNode("sub0", log, parent=root)
+    s1 = LogNode("sub1", log, parent=root)
+    s2 = LogNode("sub2", log, parent=root)
+    log.clear()
+    with batch(root) as tree:
+        eq_(tree, root)
+        s3 = LogNode("sub3", log, parent=s0)
+        s3.parent = s1
+        s2.parent = s3
+        s0.parent = None
+        s0.parent = root
+        s1.children = [s3]
+        eq_(log, [])
+    eq_(
+        log,
+        [
+            ("pre_attach", "sub3", "sub1"),
+            ("pre_detach", "sub2", "root"),
+            ("pre_attach", "sub2", "sub3"),
+            ("pre_detach_children", "root", ["sub2"]),
+            ("pre_attach_children", "sub1", ["sub3"]),
+            ("pre_attach_children", "sub3", ["sub2"]),
+            # sub0 returned to the end
+            ("pre_attach_children", "root", ["sub1", "sub0"]),
+            ("post_attach", "sub3", "sub1"),
+            ("post_detach", "sub2", "root"),
+            ("post_attach", "sub2", "sub3"),
+            ("post_detach_children", "root", ["sub2"]),
+            ("post_attach_children", "sub1", ["sub3"]),
+            ("post_attach_children", "sub3", ["sub2"]),
+            ("post_attach_children", "root", ["sub1", "sub0"]),
+        ],
+    )
+    eq_(_names(root.children), ["sub1", "sub0"])
+    eq_(_names(s1.children), ["sub3"])
+    eq_(_names(s3.children), ["sub2"])
+
+
+def test_batch_nested():
+    log = []
+    root = LogNode("root", log)
+    s0 = LogNode("sub0", log, parent=root)
+    log.clear()
+    with batch(root):
+        with batch(s0):
+            s1 = LogNode("sub1", log, parent=s0)
+        eq_(log, [])
+        s1.parent = root
+    eq_(
+        log,
+        [
+            ("pre_attach", "sub1", "root"),
+            ("pre_attach_children", "root", ["sub1"]),
+            ("post_attach", "sub1", "root"),
+            ("post_attach_children", "root", ["sub1"]),
+        ],
+    )
+
+
+def test_batch_rollback():
+    log = []
+    root = LogNode("root", log)
+    s0 = LogNode("sub0", log, parent=root)
+    s1 = LogNode("sub1", log, parent=root)
+    s1a = LogNode("sub1A", log, parent=s1)
+    s2 = LogNode("sub2", log, parent=root)
+    log.clear()
+    with assert_raises(RuntimeError, "failed"), batch(root):
+        s1a.parent = s0
+        s2.parent = s0
+        s0.parent = None
+        LogNode("sub3", log, parent=root)
+        root.children = [s1, s2]
+        raise RuntimeError("failed")
+    eq_(log, [])
+    eq_(_names(root.children), ["sub0", "sub1", "sub2"])
+    eq_(s0.children, ())
+    eq_(s1.children, (s1a,))
+    eq_([s0.parent, s1.parent, s2.parent, s1a.parent], [root, root, root, s1])
+
+
+def test_batch_loop():
+    root = Node("root")
+    s0 = Node("sub0", parent=root)
+    s1 = Node("sub1", parent=root)
+    s1a = Node("sub1A", parent=s1)
+    # temporary loops are fine
+    with batch(root):
+        s0.parent = s1a
+        s1.parent = s0
+        s1.parent = root
+    eq_(s0.parent, s1a)
+    # the loop does not need to include the first modified node
+    with assert_raises(LoopError, "Cannot set parent. Node('/root/sub1') is parent of Node('/root/sub1/sub1A/sub0')."):
+        with batch(root):
+            s1a.parent = None
+            s1.parent = s1a
+            s1a.parent = s1
+            s1.parent = s0
+    eq_(s1.parent, root)
+    eq_(s1a.parent, s1)
+    eq_(s0.parent, s1a)
+
+
+def test_batch_pre_hook():
+    root = Node("root")
+    shared = SharedNode(Node("shared", children=[Node("sub")]), parent=root)
+    other = Node("other", parent=root)
+    with assert_raises(TreeError, "SharedNode is read-only."), batch(root):
+        other.parent = None
+        shared.children[0].parent = root
+    eq_(root.children, (shared, other))
+    eq_(shared.children[0].parent, shared)
+
+
+def test_batch_merkle():
+    class MerkleNode(MerkleNodeMixin, Node):
+        pass
+
+    root = MerkleNode("root", children=[MerkleNode("sub0"), MerkleNode("sub1")])
+    other = MerkleNode("root", children=[MerkleNode("sub1", children=[MerkleNode("sub0")])])
+    before = root.subtree_hash
+    with batch(root):
+        root.children[0].parent = root.children[1]
+    assert root.subtree_hash != before
+    eq_(root.subtree_hash, other.subtree_hash)
+
+
+def test_batch_deep():
+    root = Node("0")
+    node = root
+    for idx in range(1, 1000):
+        node = Node(str(idx), parent=node)
+    leaves = [Node(f"leaf{idx}") for idx in range(1000)]
+    with batch(root):
+        for leaf in leaves:
+            leaf.parent = node
+    eq_(len(node.children), 1000)
+    eq_(leaves[-1].depth, 1000)
+
+
+def test_batch_reorder():
+    log = []
+    root = LogNode("root", log)
+    s0 = LogNode("sub0", log, parent=root)
+    s1 = LogNode("sub1", log, parent=root)
+    log.clear()
+    with batch(root):
+        root.children = [s1, s0]
+    eq_(log, [("pre_attach_children", "root", ["sub1", "sub0"]), ("post_attach_children", "root", ["sub1", "sub0"])])
+    # same order again
+    log.clear()
+    with batch(root):
+        root.children = [s1, s0]
+    eq_(log, [])
+
+
+def test_batch_reorder_merkle():
+    class MerkleNode(MerkleNodeMixin, Node):
+        pass
+
+    root = MerkleNode("root", children=[MerkleNode("sub0"), MerkleNode("sub1")])
+    before = root.subtree_hash
+    with batch(root):
+        root.children = root.children[::-1]
+    eq_(root.subtree_hash, MerkleNode("root", children=[MerkleNode("sub1"), MerkleNode("sub0")]).subtree_hash)
+    assert root.subtree_hash != before
+
+
+def test_batch_reorder_sqlite():
+    with SqliteTree(":memory:") as tree:
+        root = tree.insert(Node("root", children=[Node("sub0"), Node("sub1"), Node("sub2")]))
+        s0, s1, s2 = root.children
+        with batch(root):
+            root.children = [s2, s0]
+            s1.parent = root
+        eq_(_names(root.children), ["sub2", "sub0", "sub1"])
+        sql = "SELECT id FROM nodes WHERE parent = ? ORDER BY position, id"
+        eq_([nodeid for (nodeid,) in tree._execute(sql, (root.nodeid,))], [s2.nodeid, s0.nodeid, s1.nodeid])
+
+
+def test_batch_scope():
+    log = []
+    root = LogNode("root", log)
+    s0 = LogNode("sub0", log, parent=root)
+    other = LogNode("other", log)
+    log.clear()
+    with batch(root):
+        # other tree: immediately
+        LogNode("foo", log, parent=other)
+        eq_(log, [("pre_attach", "foo", "other"), ("post_attach", "foo", "other")])
+        # into the tree: deferred
+        other.parent = s0
+        eq_(len(log), 2)
+        # nested batches add their tree
+        third = LogNode("third", log)
+        with batch(third):
+            LogNode("bar", log, parent=third)
+        eq_(len(log), 2)
+    eq_(
+        log[2:],
+        [
+            ("pre_attach", "other", "sub0"),
+            ("pre_attach", "bar", "third"),
+            ("pre_attach_children", "sub0", ["other"]),
+            ("pre_attach_children", "third", ["bar"]),
+            ("post_attach", "other", "sub0"),
+            ("post_attach", "bar", "third"),
+            ("post_attach_children", "sub0", ["other"]),
+            ("post_attach_children", "third", ["bar"]),
+        ],
+    )
+
+
+def test_batch_attrs():
+    class HookNode(Node):
+        def _pre_attach(self, parent):
+            parent.count = getattr(parent, "count", 0) + 1
+            if self.name == "fail":
+                raise TreeError("failed")
+
+    root = HookNode("root", value=1, extra=2)
+    s0 = HookNode("sub0", parent=root)
+    eq_(root.count, 1)
+    with assert_raises(TreeError, "failed"), batch(root):
+        root.value = 2
+        s0.foo = 3
+        del root.extra
+        HookNode("sub1", parent=root)
+        HookNode("fail", parent=root)
+    # including the modifications by the hooks
+    eq_((root.value, root.extra, root.count), (1, 2, 1))
+    assert not hasattr(s0, "foo")
+    eq_(root.children, (s0,))
+    # attributes of other trees are kept
+    other = Node("other")
+    with assert_raises(RuntimeError, "failed"), batch(root):
+        other.value = 4
+        raise RuntimeError("failed")
+    eq_(other.value, 4)
+
+
+def test_batch_lightnode():
+    class LightNode(LightNodeMixin):
+        __slots__ = ["name", "value"]
+
+        def __init__(self, name, parent=None):
+            self.name = name
+            self.parent = parent
+
+        def _post_attach(self, parent):
+            log.append((self.name, parent.name))
+
+    log = []
+    root = LightNode("root")
+    s0 = LightNode("sub0", parent=root)
+    s1 = LightNode("sub1", parent=root)
+    log.clear()
+    with batch(root):
+        s1.parent = s0
+        s1.parent = root
+        s0.parent = s1
+        s1.value = 1
+        eq_(log, [])
+    eq_(log, [("sub0", "sub1")])
+    with assert_raises(RuntimeError, "failed"), batch(root):
+        root.children = []
+        s1.value = 2
+        raise RuntimeError("failed")
+    eq_(root.children, (s1,))
+    eq_(s1.children, (s0,))
+    eq_(s1.value, 1)
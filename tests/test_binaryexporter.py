@@ -0,0 +1,45 @@
+from anytree import AnyNode
+from anytree._binaryformat import Layout
+from anytree.exporter import BinaryExporter
+from anytree.importer import BinaryImporter
+
+from .helper import eq_
+
+
+def test_binary_exporter():
+    """Binary Exporter."""
+    root = AnyNode(id="root")
+    s0 = AnyNode(id="sub0", parent=root, a=1)
+    AnyNode(id="sub0B", parent=s0)
+    AnyNode(id="sub0A", parent=s0, a=2)
+    s1 = AnyNode(id="sub1", parent=root)
+    AnyNode(id="sub1A", parent=s1)
+
+    layout = Layout(BinaryExporter().export(root))
+    eq_(layout.count, 6)
+    eq_(layout.header["classes"], ["anytree.node.anynode:AnyNode"])
+    eq_(layout.columns, {"id": ("str", True), "a": ("int", False)})
+    eq_(layout.section("parent").tolist(), [-1, 0, 1, 1, 0, 4])
+    eq_(
+        sorted(layout.header["sections"]),
+        [
+            "column.a",
+            "column.id",
+            "objects.data",
+            "objects.offsets",
+            "parent",
+            "present.a",
+            "strings.data",
+            "strings.offsets",
+        ],
+    )
+    eq_(layout.strings(), ["root", "sub0", "sub0B", "sub0A", "sub1", "sub1A"])
+    eq_(list(layout.section("present.a")), [0, 1, 0, 1, 0, 0])
+    eq_(layout.entry("strings", 3), b"sub0A")
+
+    exporter = BinaryExporter(
+        childiter=reversed, maxlevel=2, attriter=lambda attrs: [(k, v) for k, v in attrs if k == "id"]
+    )
+    loaded = BinaryImporter().import_(exporter.export(root))
+    eq_([node.id for node in loaded.descendants], ["sub1", "sub0"])
+    eq_(hasattr(loaded.children[1], "a"), False)
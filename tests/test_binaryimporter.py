@@ -0,0 +1,130 @@
+import sys
+from array import array
+
+from anytree import AnyNode, LightNodeMixin, Node, RenderTree, SymlinkNode
+from anytree._binaryformat import Layout, dump
+from anytree.exporter import BinaryExporter, DictExporter
+from anytree.importer import BinaryImporter
+
+from .helper import assert_raises, eq_
+
+
+class LightNode(LightNodeMixin):
+    __slots__ = ["name", "value"]
+
+    def __init__(self, name, value=None, parent=None):
+        self.name = name
+        if value is not None:
+            self.value = value
+        self.parent = parent
+
+
+def _roundtrip(root):
+    return BinaryImporter().import_(BinaryExporter().export(root))
+
+
+def test_binary_importer():
+    """Binary Importer."""
+    root = Node("root", i=1, f=1.5, b=True, s="äö", o=None, big=1 << 70, lst=[1, 2])
+    s0 = Node("sub0", parent=root, i=-2, f=-0.5, b=False, s="", o=(1,), big=-(1 << 70), lst=[])
+    Node("sub0A", parent=s0, i=3, sparse="x")
+    Node("sub0B", parent=s0, nul="a\x00b")
+    s1 = Node("sub1", parent=root, sparse="y", o={"a": 1})
+    Node("sub1A", parent=s1)
+
+    loaded = _roundtrip(root)
+    eq_(str(RenderTree(loaded)), str(RenderTree(root)))
+    eq_(DictExporter().export(loaded), DictExporter().export(root))
+    for node in loaded.descendants:
+        eq_(node.parent.children.count(node), 1)
+    eq_(loaded.parent, None)
+    eq_(loaded.children[0].o, (1,))
+    eq_(loaded.children[0].children[1].nul, "a\x00b")
+
+    # loaded trees behave like usual trees
+    Node("sub2", parent=loaded)
+    loaded.children[0].parent = loaded.children[1]
+    eq_([node.name for node in loaded.descendants], ["sub1", "sub1A", "sub0", "sub0A", "sub0B", "sub2"])
+
+
+def test_binary_importer_classes():
+    """Binary Importer with mixed classes and links within the tree."""
+    root = Node("root")
+    a = Node("a", parent=root)
+    b = AnyNode(parent=a, name="b")
+    SymlinkNode(b, parent=a)
+    SymlinkNode(root, parent=root, extra=1)
+
+    loaded = _roundtrip(root)
+    eq_(str(RenderTree(loaded)), str(RenderTree(root)))
+    eq_(loaded.children[0].children[1].target is loaded.children[0].children[0], True)
+    eq_(loaded.children[1].target is loaded, True)
+    eq_(loaded.extra, 1)
+
+
+def test_binary_importer_light():
+    """Binary Importer with slots."""
+    root = LightNode("root", 1)
+    sub0 = LightNode("sub0", parent=root)
+    LightNode("sub0A", 2, parent=sub0)
+
+    loaded = _roundtrip(root)
+    eq_(DictExporter().export(loaded), DictExporter().export(root))
+    eq_(loaded.children[0].children[0].path[0] is loaded, True)
+
+
+def test_binary_importer_deep(tmp_path):
+    """Binary Importer with deep tree."""
+    depth = 10000
+    root = AnyNode(id=depth)
+    for idx in range(depth - 1, -1, -1):
+        root = AnyNode(id=idx, children=[root])
+
+    with open(tmp_path / "tree.bin", "wb") as file:
+        BinaryExporter().write(root, file)
+    with open(tmp_path / "tree.bin", "rb") as file:
+        node = BinaryImporter().read(file)
+    for idx in range(depth):
+        eq_(node.id, idx)
+        (node,) = node.children
+    eq_(node.id, depth)
+    eq_(node.depth, depth)
+
+
+def test_binary_importer_byteorder(monkeypatch):
+    """Binary Importer with foreign byte order."""
+    root = Node("root", value=1, weight=0.5)
+    Node("sub0", parent=root, value=2, weight=1.5)
+    layout = Layout(BinaryExporter().export(root))
+    sections = {}
+    for name, (_, _, typecode) in layout.header["sections"].items():
+        section = array(typecode, layout.section(name).tobytes())
+        section.byteswap()
+        sections[name] = section
+    foreign = "big" if sys.byteorder == "little" else "little"
+    monkeypatch.setattr("anytree._binaryformat.sys.byteorder", foreign)
+    data = b"".join(dump(layout.header, sections))
+    monkeypatch.undo()
+
+    loaded = BinaryImporter().import_(data)
+    eq_(str(RenderTree(loaded)), str(RenderTree(root)))
+
+
+def test_binary_importer_error():
+    """Binary Importer Errors."""
+    data = BinaryExporter().export(Node("root"))
+    with assert_raises(ValueError, "Not an anytree binary file."):
+        BinaryImporter().import_(b"")
+    with assert_raises(ValueError, "Not an anytree binary file."):
+        BinaryImporter().import_(b"X" + data[1:])
+    with assert_raises(ValueError, "Unsupported anytree binary file version 2."):
+        BinaryImporter().import_(data[:8] + b"\x02" + data[9:])
+
+
+def test_binary_importer_class():
+    """Just node classes are instantiated."""
+    layout = Layout(BinaryExporter().export(Node("root")))
+    sections = {name: layout.section(name) for name in layout.header["sections"]}
+    data = b"".join(dump(dict(layout.header, classes=["builtins:dict"]), sections))
+    with assert_raises(ValueError, "'builtins:dict' is not a node class."):
+        BinaryImporter().import_(data)
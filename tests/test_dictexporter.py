@@ -1,4 +1,4 @@
-from anytree import AnyNode, Node, NodeMixin
+from anytree import AnyNode, LightNodeMixin, Node, NodeMixin
 from anytree.exporter import DictExporter
 
 from .helper import eq_
@@ -131,3 +131,104 @@ def test_dict_exporter_mixin():
             ],
         },
     )
+
+
+def test_dict_exporter_maxlevel():
+    """Dict Exporter with maxlevel."""
+    root = AnyNode(id="root")
+    s0 = AnyNode(id="sub0", parent=root)
+    AnyNode(id="sub0A", parent=s0)
+    AnyNode(id="sub1", parent=root)
+
+    eq_(DictExporter(maxlevel=1).export(root), {"id": "root"})
+    eq_(DictExporter(maxlevel=2).export(root), {"id": "root", "children": [{"id": "sub0"}, {"id": "sub1"}]})
+    eq_(
+        DictExporter(maxlevel=3).export(root),
+        {"id": "root", "children": [{"id": "sub0", "children": [{"id": "sub0A"}]}, {"id": "sub1"}]},
+    )
+    eq_(list(DictExporter().export(s0)), ["id", "children"])
+
+
+def test_dict_exporter_deep():
+    """Dict Exporter on trees deeper than the recursion limit."""
+    root = AnyNode(id=4999)
+    for idx in range(4998, -1, -1):
+        root = AnyNode(id=idx, children=[root])
+
+    data = DictExporter().export(root)
+    for idx in range(5000):
+        eq_(data["id"], idx)
+        data = data.get("children", [None])[0]
+    assert data is None
+
+
+def test_dict_exporter_attrnames():
+    """Dict Exporter with fixed attribute names."""
+    root = AnyNode(id="root", foo=1)
+    AnyNode(id="sub0", parent=root, bar=2)
+    AnyNode(id="sub1", parent=root, foo=3)
+
+    exporter = DictExporter(attrnames=("foo", "id"))
+    eq_(
+        exporter.export(root),
+        {"foo": 1, "id": "root", "children": [{"id": "sub0"}, {"foo": 3, "id": "sub1"}]},
+    )
+    eq_(list(exporter.export(root)), ["foo", "id", "children"])
+
+
+def test_dict_exporter_slots():
+    """Dict Exporter with slots."""
+
+    class Base(LightNodeMixin):
+        __slots__ = ("name",)
+
+    class LightNode(Base):
+        __slots__ = ["__private", "__weakref__", "foo"]
+
+        def __init__(self, name, foo=None, parent=None):
+            self.name = name
+            if foo is not None:
+                self.foo = foo
+            self.__private = 4
+            self.parent = parent
+
+    class DictLightNode(LightNode):
+        def __init__(self, name, parent=None, **kwargs):
+            super().__init__(name, parent=parent)
+            self.__dict__.update(kwargs)
+
+    root = LightNode("root", foo=1)
+    s0 = LightNode("sub0", parent=root)
+    DictLightNode("sub0A", parent=s0, bar=2)
+
+    eq_(
+        DictExporter().export(root),
+        {"name": "root", "foo": 1, "children": [{"name": "sub0", "children": [{"bar": 2, "name": "sub0A"}]}]},
+    )
+    eq_(
+        DictExporter(attrnames=["name"]).export(root),
+        {"name": "root", "children": [{"name": "sub0", "children": [{"name": "sub0A"}]}]},
+    )
+
+
+def test_dict_exporter_mangled():
+    """Name-mangled private attributes of any class are not exported."""
+
+    class MyNode(Node):
+        def __init__(self, name, **kwargs):
+            super().__init__(name, **kwargs)
+            self.__secret = 1
+            self._private = 2
+            self.__dunder__ = 3
+
+    root = MyNode("root")
+    MyNode("sub", parent=root)
+    eq_(
+        DictExporter().export(root),
+        {
+            "name": "root",
+            "_private": 2,
+            "__dunder__": 3,
+            "children": [{"name": "sub", "_private": 2, "__dunder__": 3}],
+        },
+    )
@@ -73,3 +73,19 @@ def test_dict_importer_node():
         "    └── Node('/root/sub1/sub1C')",
         "        └── Node('/root/sub1/sub1C/sub1Ca')",
     ]
+
+
+def test_dict_importer_deep():
+    """Dict Importer with deep data."""
+    depth = 10000
+    data = {"id": "leaf"}
+    for idx in range(depth - 1, -1, -1):
+        data = {"id": idx, "children": [data]}
+    root = DictImporter().import_(data)
+    node = root
+    for idx in range(depth):
+        eq_(node.id, idx)
+        (node,) = node.children
+    eq_(node.id, "leaf")
+    eq_(node.depth, depth)
+    eq_(node.root, root)
@@ -0,0 +1,209 @@
+import json
+import random
+
+from anytree import AnyNode, MerkleNodeMixin, Node
+from anytree.diff import apply, diff
+from anytree.exporter import DictExporter
+from anytree.importer import DictImporter
+
+from .helper import assert_raises
+
+
+class MerkleNode(MerkleNodeMixin, Node):
+    hashattrs = ("name", "value")
+
+
+def _random_tree(rnd, size, cls=Node):
+    nodes = [cls("root", value=0)]
+    for idx in range(1, size):
+        nodes.append(cls(f"n{idx}", parent=rnd.choice(nodes), value=rnd.randint(0, 3)))
+    return nodes[0]
+
+
+def _mutate(rnd, root, count):
+    exporter = DictExporter()
+    other = DictImporter(type(root)).import_(exporter.export(root))
+    nodes = [other, *other.descendants]
+    for idx in range(count):
+        node = rnd.choice(nodes)
+        action = rnd.randrange(5)
+        if action == 0 or node.parent is None:
+            node.value = rnd.randint(0, 3)
+        elif action == 1:
+            node.parent = None
+            nodes = [other, *other.descendants]
+        elif action == 2:
+            type(root)(f"new{idx}", parent=node, value=idx)
+            nodes = [other, *other.descendants]
+        elif action == 3:
+            # reorder siblings
+            node.parent.children = list(reversed(node.parent.children))
+        else:
+            targets = [item for item in nodes if all(ancestor is not node for ancestor in item.path)]
+            target = rnd.choice(targets)
+            if all(child.name != node.name for child in target.children):
+                node.parent = target
+                nodes = [other, *other.descendants]
+    return other
+
+
+def test_roundtrip():
+    """apply(a, diff(a, b)) equals b."""
+    exporter = DictExporter()
+    rnd = random.Random(42)
+    for cls in (Node, MerkleNode):
+        for _ in range(40):
+            a = _random_tree(rnd, rnd.randint(1, 40), cls)
+            b = _mutate(rnd, a, rnd.randint(0, 8))
+            patch = diff(a, b)
+            # the patch survives JSON
+            patch = json.loads(json.dumps(patch))
+            assert apply(a, patch) is a
+            assert exporter.export(a) == exporter.export(b)
+            assert diff(a, b) == []
+
+
+def test_operations():
+    """Minimal moves and cross-parent moves."""
+    a = Node("root", children=[Node(str(idx)) for idx in range(6)])
+    b = Node("root", children=[Node(str(idx)) for idx in (1, 2, 3, 4, 5, 0)])
+    assert diff(a, b) == [("move", ("0",), (), 5)]
+    b = Node("root", children=[Node(str(idx)) for idx in (5, 4, 3, 2, 1, 0)])
+    assert len(diff(a, b)) == 5
+    # subtrees are moved unmodified, or inserted
+    a = Node("root", children=[Node("a", children=[Node("x", children=[Node("y")])]), Node("b")])
+    b = Node("root", children=[Node("a"), Node("b", children=[Node("x", children=[Node("y")])])])
+    assert diff(a, b) == [("move", ("a", "x"), ("b",), 0)]
+    b = Node("root", children=[Node("a"), Node("b", children=[Node("x", children=[Node("z")])])])
+    assert diff(a, b) == [
+        ("insert", ("b",), 0, {"name": "x", "children": [{"name": "z"}]}),
+        ("delete", ("a", "x")),
+    ]
+    # attributes
+    a = Node("root", foo=1, bar=2)
+    b = Node("other", foo=1, baz=3)
+    assert diff(a, b) == [("update", (), {"name": "other", "baz": 3}, ["bar"])]
+
+
+def test_key():
+    """Custom key and exporter."""
+    a = AnyNode(id=0, children=[AnyNode(id=1, value="a"), AnyNode(id=2)])
+    b = AnyNode(id=0, children=[AnyNode(id=2), AnyNode(id=1, value="b"), AnyNode(id=3, tmp=4)])
+    exporter = DictExporter(attriter=lambda attrs: [(name, value) for name, value in attrs if name != "tmp"])
+    patch = diff(a, b, key=lambda node: node.id, exporter=exporter)
+    assert patch == [
+        ("move", (2,), (), 0),
+        ("update", (1,), {"value": "b"}, []),
+        ("insert", (), 2, {"id": 3}),
+    ]
+    apply(a, patch, key=lambda node: node.id)
+    assert DictExporter().export(a) == {
+        "id": 0,
+        "children": [{"id": 2}, {"id": 1, "value": "b"}, {"id": 3}],
+    }
+
+
+def test_merkle():
+    """Subtrees with equal hashes are skipped."""
+    calls = []
+
+    def key(node):
+        calls.append(node.name)
+        return node.name
+
+    a = MerkleNode("root", children=[MerkleNode(f"sub{idx}", children=[MerkleNode("x")]) for idx in range(50)])
+    b = MerkleNode("root", children=[MerkleNode(f"sub{idx}", children=[MerkleNode("x")]) for idx in range(50)])
+    b.children[7].children[0].value = 1
+    exporter = DictExporter(attrnames=MerkleNode.hashattrs)
+    assert diff(a, b, key=key, exporter=exporter) == [("update", ("sub7", "x"), {"value": 1}, [])]
+    assert len(calls) == 2 * 50 + 2 * 1
+    # all nodes are compared with the default exporter
+    calls.clear()
+    assert diff(a, b, key=key) == [("update", ("sub7", "x"), {"value": 1}, [])]
+    assert len(calls) == 2 * 50 + 2 * 50
+
+
+def test_merkle_hashattrs():
+    """Attributes not covered by the hash are compared."""
+
+    class NameMerkleNode(MerkleNodeMixin, Node):
+        pass
+
+    a = NameMerkleNode("root", children=[NameMerkleNode("sub0", value=1), NameMerkleNode("sub1", value=2)])
+    b = NameMerkleNode("root", children=[NameMerkleNode("sub0", value=1), NameMerkleNode("sub1", value=3)])
+    assert a.subtree_hash == b.subtree_hash
+    assert diff(a, b) == [("update", ("sub1",), {"value": 3}, [])]
+    assert diff(a, b, exporter=DictExporter(attrnames=("name", "value"))) == [("update", ("sub1",), {"value": 3}, [])]
+    assert diff(a, b, exporter=DictExporter(attrnames=("name",))) == []
+    # moved subtrees are compared likewise
+    b.children = [NameMerkleNode("other", children=[b.children[1]])]
+    a.children[1].children = [NameMerkleNode("x", value=1)]
+    b.children[0].children[0].children = [NameMerkleNode("x", value=2)]
+    patch = diff(a, b)
+    assert not any(operation[0] == "move" for operation in patch)
+    apply(a, patch)
+    assert DictExporter().export(a) == DictExporter().export(b)
+
+
+def test_errors():
+    """Duplicate keys and unknown operations."""
+    a = Node("root", children=[Node("a"), Node("a")])
+    with assert_raises(ValueError, "Key 'a' is not unique among the children of Node('/root')."):
+        diff(a, Node("root"))
+    with assert_raises(ValueError, "Unknown operation 'rename'."):
+        apply(Node("root"), [("rename", (), "foo")])
+
+
+def test_batch():
+    """The patch is applied as one batch and rolled back on failure."""
+    calls = []
+    failing = []
+
+    class HookNode(Node):
+        def _pre_attach(self, parent):
+            if self.name in failing:
+                msg = "no"
+                raise RuntimeError(msg)
+
+        def _post_attach_children(self, children):
+            calls.append((self.name, [child.name for child in children]))
+
+    a = HookNode("root", value=1, children=[HookNode("a", children=[HookNode("x")]), HookNode("b"), HookNode("c")])
+    b = HookNode("root", value=2, children=[HookNode("c"), HookNode("b", children=[HookNode("x"), HookNode("y")])])
+    calls.clear()
+    apply(a, diff(a, b))
+    assert DictExporter().export(a) == DictExporter().export(b)
+    assert sorted(calls) == [("b", ["x", "y"]), ("root", ["c", "b"])]
+
+    a = HookNode("root", value=1, children=[HookNode("a", children=[HookNode("x")]), HookNode("b"), HookNode("c")])
+    b = HookNode(
+        "root",
+        value=2,
+        children=[HookNode("c"), HookNode("b", children=[HookNode("x"), HookNode("fail")]), HookNode("d")],
+    )
+    ref = DictExporter().export(a)
+    nodes = [a, *a.descendants]
+    calls.clear()
+    failing.append("fail")
+    with assert_raises(RuntimeError, "no"):
+        apply(a, diff(a, b))
+    assert DictExporter().export(a) == ref
+    assert [a, *a.descendants] == nodes
+    assert calls == []
+
+
+def test_deep():
+    """Deep trees do not hit the recursion limit."""
+
+    def create(value):
+        root = Node("9999", value=value)
+        for idx in range(9998, -1, -1):
+            root = Node(str(idx), children=[root])
+        return root
+
+    a, b = create(1), create(2)
+    patch = diff(a, b)
+    assert len(patch) == 1
+    assert len(patch[0][1]) == 9999
+    apply(a, patch)
+    assert diff(a, b) == []
@@ -1,8 +1,16 @@
+import os
+import sys
+import tracemalloc
+from collections import deque
+from subprocess import CalledProcessError
+
 from pytest import fixture
 from test2ref import assert_refdata
 
-from anytree import Node
-from anytree.exporter import DotExporter
+from anytree import AnyNode, Node
+from anytree.exporter import DotExporter, render_many
+
+from .helper import assert_raises
 
 
 @fixture
@@ -76,3 +84,114 @@ def test_esc():
         r'    "6\"-6\\\"";',
         r"}",
     )
+
+
+def test_tree_stream(tmp_path, root):
+    """Tree with stream."""
+    DotExporter(root, stream=True).to_dotfile(tmp_path / "tree.dot")
+    DotExporter(root, stream=True, stop=lambda node: node.name == "sub1A").to_dotfile(tmp_path / "tree_stop.dot")
+    DotExporter(root, stream=True, filter_=lambda node: node.name != "sub1").to_dotfile(tmp_path / "tree_filter.dot")
+    DotExporter(root, stream=True, maxlevel=2).to_dotfile(tmp_path / "tree_maxlevel.dot")
+    assert_refdata(test_tree_stream, tmp_path)
+
+
+def test_tree_deep():
+    """Deep trees do not hit the recursion limit."""
+    root = Node("9999")
+    for idx in range(9998, -1, -1):
+        root = Node(str(idx), children=[root])
+    for stream in (False, True):
+        lines = list(DotExporter(root, stream=stream))
+        assert len(lines) == 2 + 10000 + 9999
+        assert lines[1] == '    "0";'
+        assert lines[-2] == ('    "9999";' if stream else '    "9998" -> "9999";')
+
+
+def test_tree_memory():
+    """Without stream, the lines are generated without collecting the nodes or edges."""
+    root = Node("root", children=[Node(f"sub{idx}") for idx in range(20000)])
+    deque(DotExporter(root), maxlen=0)
+    tracemalloc.start()
+    try:
+        deque(DotExporter(root), maxlen=0)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    # just the tuple of children
+    assert peak < 400_000
+
+
+def test_tree_summary(tmp_path, root):
+    """Summarised Tree."""
+    DotExporter(root, maxnodes=7, maxchildren=2).to_dotfile(tmp_path / "tree.dot")
+    assert_refdata(test_tree_summary, tmp_path)
+
+
+def test_tree_summary_custom(tmp_path):
+    """Summarised Tree with custom functions, which do not apply to `... N more` nodes."""
+    root = AnyNode(id="root", edgetype="--")
+    for idx in range(5):
+        AnyNode(id=f"sub{idx}", parent=root, edgetype="--")
+    DotExporter(
+        root,
+        graph="graph",
+        maxchildren=3,
+        nodenamefunc=lambda node: node.id,
+        nodeattrfunc=lambda node: f'label="{node.id}"',
+        edgeattrfunc=lambda node, child: f'label="{child.id}"',
+        edgetypefunc=lambda node, child: child.edgetype,
+        filter_=lambda node: node.id != "sub1",
+        stop=lambda node: node.id == "sub0",
+    ).to_dotfile(tmp_path / "tree.dot")
+    assert_refdata(test_tree_summary_custom, tmp_path)
+
+
+def test_to_files(tmp_path, root):
+    """Tree split into linked chunks."""
+    filenames = DotExporter(root).to_files(tmp_path, maxnodes=4)
+    assert [os.path.basename(filename) for filename in filenames] == ["0.dot", "1.dot", "2.dot", "3.dot"]
+    assert_refdata(test_to_files, tmp_path)
+
+
+@fixture
+def fakedot(tmp_path, monkeypatch):
+    """Fake `dot`, which copies its input to the output file."""
+    bindir = tmp_path / "bin"
+    bindir.mkdir()
+    script = bindir / "dot"
+    script.write_text(
+        f"#!{sys.executable}\n"
+        "import sys\n"
+        "args = sys.argv[1:]\n"
+        "data = sys.stdin.read()\n"
+        "if 'fail' in data:\n"
+        "    sys.exit(3)\n"
+        "with open(args[args.index('-o') + 1], 'w') as file:\n"
+        "    file.write(args[args.index('-T') + 1] + '\\n' + data)\n"
+    )
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bindir}{os.pathsep}{os.environ['PATH']}")
+    yield tmp_path / "out"
+
+
+def test_to_picture(fakedot, root):
+    """Pipe to `dot`."""
+    fakedot.mkdir()
+    DotExporter(root).to_picture(fakedot / "tree.png")
+    lines = (fakedot / "tree.png").read_text().splitlines()
+    assert lines == ["png", *DotExporter(root)]
+
+
+def test_render_many(fakedot, root):
+    """Render concurrently."""
+    fakedot.mkdir()
+    jobs = [(DotExporter(root, name=f"tree{idx}"), fakedot / f"tree{idx}.svg") for idx in range(10)]
+    render_many(jobs, workers=3)
+    for exporter, filename in jobs:
+        assert filename.read_text().splitlines() == ["svg", *exporter]
+
+    jobs = [(DotExporter(Node("fail")), fakedot / "fail.svg"), (DotExporter(root), fakedot / "ok.svg")]
+    failed = CalledProcessError(3, ["dot", "-T", "svg", "-o", str(fakedot / "fail.svg")])
+    with assert_raises(CalledProcessError, str(failed)):
+        render_many(jobs)
+    assert (fakedot / "ok.svg").exists()
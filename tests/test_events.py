@@ -0,0 +1,208 @@
+import asyncio
+import queue
+
+from anytree import LightNodeMixin, MerkleNodeMixin, Node, NodeMixin, SymlinkNode, batch, subscribe
+from anytree.node import MISSING, AttachEvent, ChangeEvent, DetachEvent, MoveEvent, ReorderEvent
+from anytree.store import SqliteNode, SqliteTree
+
+from .helper import assert_raises, eq_
+
+
+def _tree():
+    root = Node("root")
+    s0 = Node("sub0", parent=root)
+    s1 = Node("sub1", parent=root)
+    return root, s0, s1
+
+
+def test_subscribe():
+    root, s0, s1 = _tree()
+    events = []
+    with subscribe(root, events.append) as subscription:
+        s0a = Node("sub0A", parent=s0, foo=1)
+        s0a.parent = s1
+        s0a.foo = 2
+        del s0a.foo
+        s0a.bar = 3
+        s1.children = []
+        s0a.foo = 4
+        s0.children = [s0a]
+    eq_(
+        events,
+        [
+            AttachEvent(s0a, s0),
+            MoveEvent(s0a, s0, s1),
+            ChangeEvent(s0a, "foo", 1, 2),
+            ChangeEvent(s0a, "foo", 2, MISSING),
+            ChangeEvent(s0a, "bar", MISSING, 3),
+            DetachEvent(s0a, s1),
+            AttachEvent(s0a, s0),
+        ],
+    )
+    eq_(repr(subscription), "Subscription(Node('/root'), batched=False)")
+    # unsubscribed
+    s0a.foo = 5
+    eq_(len(events), 7)
+    subscription.close()
+
+
+def test_subscribe_subtree():
+    root, s0, s1 = _tree()
+    rootevents, s0events = [], []
+    rootsubscription = subscribe(root, rootevents.append)
+    s0subscription = subscribe(s0, s0events.append)
+    s1.name = "foo"
+    s0.name = "bar"
+    s1.parent = s0
+    s0.parent = None
+    s0.baz = 4
+    eq_(
+        rootevents,
+        [
+            ChangeEvent(s1, "name", "sub1", "foo"),
+            ChangeEvent(s0, "name", "sub0", "bar"),
+            MoveEvent(s1, root, s0),
+            DetachEvent(s0, root),
+        ],
+    )
+    eq_(
+        s0events,
+        [
+            ChangeEvent(s0, "name", "sub0", "bar"),
+            MoveEvent(s1, root, s0),
+            DetachEvent(s0, root),
+            ChangeEvent(s0, "baz", MISSING, 4),
+        ],
+    )
+    s0subscription.close()
+    s0.baz = 5
+    eq_(len(rootevents), 4)
+    rootsubscription.close()
+    rootsubscription.close()
+    s1.name = "sub1"
+    eq_(len(rootevents), 4)
+
+
+def test_subscribe_batched():
+    root, s0, s1 = _tree()
+    events = []
+    with subscribe(root, events.append, batched=True):
+        s0.foo = 1
+        with batch(root):
+            s2 = Node("sub2", parent=s0)
+            s1.parent = s2
+            s2.parent = root
+            s0.parent = None
+            s0.parent = root
+    eq_(
+        events,
+        [
+            [ChangeEvent(s0, "foo", MISSING, 1)],
+            # sub0 returned behind sub2
+            [AttachEvent(s2, root), MoveEvent(s1, root, s2), ReorderEvent(root, (s2, s0))],
+        ],
+    )
+
+
+def test_subscribe_batch_reorder():
+    root, s0, s1 = _tree()
+    events = []
+    with subscribe(root, events.append), batch(root):
+        root.children = [s1, s0]
+        s2 = Node("sub2", parent=s1)
+    eq_(events, [AttachEvent(s2, s1), ReorderEvent(root, (s1, s0))])
+
+
+def test_subscribe_batch_rollback():
+    root, s0, s1 = _tree()
+    events = []
+    with subscribe(root, events.append), assert_raises(RuntimeError, "failed"), batch(root):
+        s1.parent = s0
+        raise RuntimeError("failed")
+    eq_(events, [])
+
+
+def test_subscribe_hooks():
+    """The attribute hooks just exist while any subscription or batch exists."""
+
+    def hooked():
+        return ["__setattr__" in vars(cls) and "__delattr__" in vars(cls) for cls in (NodeMixin, LightNodeMixin)]
+
+    root, s0, _ = _tree()
+    eq_(hooked(), [False, False])
+    with subscribe(s0, print), subscribe(root, print):
+        eq_(hooked(), [True, True])
+    eq_(hooked(), [False, False])
+    with batch(root):
+        eq_(hooked(), [True, True])
+        with batch(s0):
+            pass
+        eq_(hooked(), [True, True])
+    eq_(hooked(), [False, False])
+    with assert_raises(ValueError, "fail"), batch(root):
+        raise ValueError("fail")
+    eq_(hooked(), [False, False])
+
+
+def test_subscribe_queue():
+    root, s0, _ = _tree()
+    events = queue.Queue()
+    with subscribe(root, queue=events):
+        s0.foo = 1
+    eq_(events.get_nowait(), ChangeEvent(s0, "foo", MISSING, 1))
+    assert events.empty()
+
+
+def test_subscribe_asyncio():
+    async def main():
+        root, s0, _ = _tree()
+        events = asyncio.Queue()
+        with subscribe(root, queue=events, batched=True):
+            s0.foo = 1
+        return await events.get()
+
+    root_events = asyncio.run(main())
+    eq_([(event.name, event.value) for event in root_events], [("foo", 1)])
+
+
+def test_subscribe_args():
+    root = Node("root")
+    with assert_raises(ValueError, "Either 'callback' or 'queue' is required."):
+        subscribe(root)
+    with assert_raises(ValueError, "Either 'callback' or 'queue' is required."):
+        subscribe(root, print, queue=queue.Queue())
+
+
+def test_subscribe_node_classes():
+    class MerkleNode(MerkleNodeMixin, Node):
+        hashattrs = ("name", "value")
+
+    root = MerkleNode("root", value=1, children=[MerkleNode("sub0", value=2)])
+    link = SymlinkNode(root.children[0], parent=root)
+    before = root.subtree_hash
+    events = []
+    with subscribe(root, events.append):
+        link.value = 3
+    eq_(events, [ChangeEvent(root.children[0], "value", 2, 3)])
+    assert root.subtree_hash != before
+
+
+def test_subscribe_sqlite():
+    with SqliteTree(":memory:") as tree:
+        root = tree.insert(Node("root", value=1, children=[Node("sub0")]))
+        events = []
+        with subscribe(root, events.append):
+            root.value = 2
+            del root.value
+            s1 = SqliteNode(tree, name="sub1", parent=root)
+            s1.value = 3
+        eq_(
+            events,
+            [
+                ChangeEvent(root, "value", 1, 2),
+                ChangeEvent(root, "value", 2, MISSING),
+                AttachEvent(s1, root),
+                ChangeEvent(s1, "value", MISSING, 3),
+            ],
+        )
+        eq_(tree.findall(value=3), (s1,))
@@ -0,0 +1,188 @@
+import random
+
+from anytree import Journal, LoopError, Node, PreOrderIter, TreeError, batch
+
+from .helper import assert_raises, eq_
+
+
+def _state(root):
+    """Structure and public attributes by identity."""
+    return [
+        (
+            id(node),
+            id(node.parent),
+            [id(child) for child in node.children],
+            {name: value for name, value in vars(node).items() if not name.startswith("_")},
+        )
+        for node in PreOrderIter(root)
+    ]
+
+
+def _modify(rnd, root, idx):
+    nodes = list(PreOrderIter(root))
+    node = rnd.choice(nodes)
+    action = rnd.randrange(6)
+    if action == 0:
+        node.value = rnd.randint(0, 3)
+    elif action == 1 and hasattr(node, "value"):
+        del node.value
+    elif action == 2 and node is not root:
+        node.parent = None
+    elif action == 3:
+        Node(f"new{idx}", parent=node, value=idx)
+    elif action == 4:
+        node.children = rnd.sample(node.children, len(node.children))
+    else:
+        other = rnd.choice(nodes)
+        if other is not root and not any(item is other for item in node.iter_path_reverse()):
+            other.parent = node
+
+
+def test_journal_random():
+    rnd = random.Random(42)
+    root = Node("root")
+    for idx in range(30):
+        Node(f"n{idx}", parent=rnd.choice([root, *root.descendants]), value=idx)
+    journal = Journal(root, maxsize=None)
+    states = [_state(root)]
+    for idx in range(100):
+        if idx % 3:
+            _modify(rnd, root, idx)
+        else:
+            with journal.group():
+                for _ in range(5):
+                    _modify(rnd, root, idx)
+        if journal.undos == len(states):
+            states.append(_state(root))
+        else:
+            eq_(_state(root), states[-1])
+    eq_(journal.undos, len(states) - 1)
+    for state in reversed(states[:-1]):
+        assert journal.undo()
+        eq_(_state(root), state)
+    assert not journal.undo()
+    for state in states[1:]:
+        assert journal.redo()
+        eq_(_state(root), state)
+    assert not journal.redo()
+    journal.close()
+
+
+def test_journal_steps():
+    root = Node("root")
+    s0 = Node("sub0", parent=root)
+    s1 = Node("sub1", parent=root)
+    journal = Journal(root, maxsize=2)
+    eq_(repr(journal), "Journal(Node('/root'), undos=0, redos=0)")
+    s0.foo = 1
+    s0.foo = 2
+    s0.foo = 3
+    eq_(journal.undos, 2)
+    assert journal.undo()
+    eq_(s0.foo, 2)
+    eq_(journal.redos, 1)
+    # a new modification drops the redo steps
+    s1.bar = 4
+    eq_((journal.undos, journal.redos), (2, 0))
+    assert journal.undo()
+    assert not hasattr(s1, "bar")
+    assert journal.undo()
+    eq_(s0.foo, 1)
+    assert not journal.undo()
+    journal.clear()
+    eq_((journal.undos, journal.redos), (0, 0))
+    journal.close()
+
+
+def test_journal_scope():
+    root = Node("root")
+    s0 = Node("sub0", parent=root)
+    other = Node("other")
+    journal = Journal(root)
+    # outside
+    Node("foo", parent=other, value=1)
+    other.value = 2
+    eq_(journal.undos, 0)
+    # into and out of the tree
+    s0.parent = other
+    s0.parent = root
+    eq_(journal.undos, 2)
+    assert journal.undo()
+    eq_(s0.parent, other)
+    assert journal.undo()
+    eq_(s0.parent, root)
+    journal.close()
+    s0.value = 3
+    eq_(journal.undos, 0)
+
+
+def test_journal_rollback():
+    root = Node("root")
+    s0 = Node("sub0", parent=root)
+    s1 = Node("sub1", parent=root)
+    journal = Journal(root)
+    with assert_raises(LoopError, "Cannot set parent. Node('/root/sub1') is parent of Node('/root/sub0')."):
+        with journal.group():
+            s1.parent = s0
+            s0.parent = s1
+    eq_(journal.undos, 0)
+    with assert_raises(RuntimeError, "failed"), batch(root):
+        s1.parent = s0
+        raise RuntimeError("failed")
+    eq_(journal.undos, 0)
+    eq_(root.children, (s0, s1))
+    # attributes are rolled back as well
+    with assert_raises(RuntimeError, "failed"), journal.group():
+        s0.name = "foo"
+        s1.value = 1
+        raise RuntimeError("failed")
+    eq_((s0.name, hasattr(s1, "value"), journal.undos), ("sub0", False, 0))
+    journal.close()
+
+
+def test_journal_out_of_sync():
+    root = Node("root")
+    s0 = Node("sub0", parent=root)
+    s1 = Node("sub1", parent=root)
+    journal = Journal(root)
+    with journal.group():
+        s1.parent = s0
+        s0.name = "foo"
+    journal.close()
+    # not recorded anymore
+    s1.parent = None
+    with assert_raises(TreeError, "Cannot replay journal. Node('/sub1') is not a child of Node('/root/sub0')."):
+        journal.undo()
+    eq_((root.children, s0.children, s0.name), ((s0,), (), "foo"))
+    eq_((journal.undos, journal.redos), (1, 0))
+    s1.parent = s0
+    assert journal.undo()
+    eq_((root.children, s0.name), ((s0, s1), "sub0"))
+    s1.parent = None
+    with assert_raises(TreeError, "Cannot replay journal. Node('/sub1') is not a child of Node('/root')."):
+        journal.redo()
+    eq_((root.children, s0.name), ((s0,), "sub0"))
+    eq_((journal.undos, journal.redos), (0, 1))
+
+
+def test_journal_wide():
+    class CountNode(Node):
+        attached = 0
+
+        def _post_attach(self, parent):
+            CountNode.attached += 1
+
+    root = CountNode("root")
+    children = [CountNode(str(idx)) for idx in range(10000)]
+    root.children = children
+    journal = Journal(root)
+    CountNode("new", parent=root)
+    children[5000].parent = None
+    CountNode.attached = 0
+    assert journal.undo()
+    assert journal.undo()
+    eq_(len(root.children), 10000)
+    eq_(root.children[5000], children[5000])
+    # just the modified node is attached again
+    eq_(CountNode.attached, 1)
+    journal.close()
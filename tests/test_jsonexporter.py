@@ -3,9 +3,9 @@ import os
 from tempfile import NamedTemporaryFile
 
 from anytree import AnyNode
-from anytree.exporter import JsonExporter
+from anytree.exporter import DictExporter, JsonExporter
 
-from .helper import eq_
+from .helper import assert_raises, eq_
 
 
 def test_json_exporter():
@@ -91,3 +91,65 @@ def test_json_exporter():
     finally:
         os.remove(ref.name)
         os.remove(gen.name)
+
+
+def test_json_exporter_stream(tmp_path):
+    """Json Exporter streaming output is identical."""
+    root = AnyNode(id="root", b=[1, {"x": None, "y": [2.5, "\n"]}], a={}, z="äö")
+    s0 = AnyNode(id="sub0", parent=root, zz=True)
+    AnyNode(parent=s0)
+    AnyNode(id="sub0A", parent=s0, children=[])
+    s1 = AnyNode(id="sub1", parent=root, nested={"a": {"b": [[], {}]}})
+    AnyNode(id="sub1A", parent=s1)
+
+    variants = [
+        {},
+        {"indent": 2},
+        {"indent": "\t", "sort_keys": True},
+        {"indent": 0},
+        {"sort_keys": True, "ensure_ascii": False},
+        {"separators": (",", ":")},
+        {"indent": 4, "maxlevel": 2},
+        {"indent": 1, "maxlevel": 1},
+        {"indent": 2, "dictexporter": DictExporter(childiter=reversed, attriter=sorted)},
+        {"indent": 2, "dictexporter": DictExporter(attrnames=["id", "zz"], maxlevel=2)},
+        {"indent": 2, "dictexporter": DictExporter(attriter=lambda attrs: [("children", 1), *attrs])},
+    ]
+    for kwargs in variants:
+        exporter = JsonExporter(**kwargs)
+        for node in (root, s0, s1.children[0]):
+            with open(tmp_path / "ref.json", "w", encoding="utf-8") as file:
+                exporter.write(node, file)
+            with open(tmp_path / "stream.json", "w", encoding="utf-8") as file:
+                exporter.write(node, file, stream=True)
+            ref = (tmp_path / "ref.json").read_text(encoding="utf-8")
+            eq_((tmp_path / "stream.json").read_text(encoding="utf-8"), ref)
+
+
+def test_json_exporter_stream_keys(tmp_path):
+    """Json Exporter streaming with non-string keys."""
+    root = AnyNode(id="root")
+    AnyNode(id="sub0", parent=root)
+
+    def attriter(attrs):
+        return [*attrs, (1, "int"), (2.5, "float"), (None, "none"), (True, "true"), (False, "false")]
+
+    exporter = JsonExporter(dictexporter=DictExporter(attriter=attriter), indent=1)
+    with open(tmp_path / "ref.json", "w") as file:
+        exporter.write(root, file)
+    with open(tmp_path / "stream.json", "w") as file:
+        exporter.write(root, file, stream=True)
+    eq_((tmp_path / "stream.json").read_text(), (tmp_path / "ref.json").read_text())
+
+    exporter = JsonExporter(dictexporter=DictExporter(attriter=lambda attrs: [*attrs, ((1,), 1)]), skipkeys=True)
+    with open(tmp_path / "ref.json", "w") as file:
+        exporter.write(root, file)
+    with open(tmp_path / "stream.json", "w") as file:
+        exporter.write(root, file, stream=True)
+    eq_((tmp_path / "stream.json").read_text(), (tmp_path / "ref.json").read_text())
+
+    exporter = JsonExporter(dictexporter=DictExporter(attriter=lambda attrs: [*attrs, ((1,), 1)]))
+    with open(tmp_path / "stream.json", "w") as file, assert_raises(
+        TypeError, "keys must be str, int, float, bool or None, not tuple"
+    ):
+        exporter.write(root, file, stream=True)
@@ -1,3 +1,6 @@
+import io
+import json
+from collections import OrderedDict
 from tempfile import NamedTemporaryFile
 
 from anytree.exporter import DictExporter
@@ -63,3 +66,102 @@ def test_json_importer():
         ref.seek(0)
         imported = DictExporter().export(JsonImporter().read(ref))
     eq_(refdata, imported)
+
+
+def test_json_importer_stream(monkeypatch):
+    """Json Importer streaming is identical."""
+    refdata = {
+        "id": "root",
+        "b": [1, {"x": None, "y": [2.5, "\n", "}]"]}],
+        "a": {"children": [{"id": "nonode"}]},
+        "z": "äö",
+        "children": [
+            {"id": "sub0", "n": -12345678901234567890, "children": [{"f": 1e-5}, {"id": "sub0A"}]},
+            {"id": "sub1", "children": [{"id": "sub1A", "t": True, "children": [{}]}]},
+        ],
+    }
+    texts = [
+        json.dumps(refdata),
+        json.dumps(refdata, indent=2, ensure_ascii=False),
+        json.dumps(refdata, separators=(",", ":")),
+        " \n" + json.dumps(refdata, indent="\t") + "\n ",
+    ]
+    for chunksize in (1, 3, 1 << 16):
+        monkeypatch.setattr("anytree.importer.jsonimporter._CHUNKSIZE", chunksize)
+        for text in texts:
+            ref = DictExporter().export(JsonImporter().read(io.StringIO(text)))
+            eq_(ref, refdata)
+            eq_(DictExporter().export(JsonImporter().read(io.StringIO(text), stream=True)), ref)
+            # bytes with BOM
+            data = io.BytesIO(b"\xef\xbb\xbf" + text.encode("utf-8"))
+            eq_(DictExporter().export(JsonImporter().read(data, stream=True)), ref)
+
+
+def test_json_importer_stream_hooks():
+    """Json Importer streaming with hooks."""
+    text = '{"b": 1, "children": [{"a": 2, "b": 3}], "a": 4}'
+
+    root = JsonImporter(object_pairs_hook=lambda pairs: OrderedDict(reversed(pairs))).read(
+        io.StringIO(text), stream=True
+    )
+    eq_([key for key in root.__dict__ if key in ("a", "b")], ["a", "b"])
+    eq_((root.a, root.b, root.children[0].a, root.children[0].b), (4, 1, 2, 3))
+
+    root = JsonImporter(object_hook=lambda attrs: {key: -value for key, value in attrs.items()}).read(
+        io.StringIO(text), stream=True
+    )
+    eq_((root.a, root.b, root.children[0].a, root.children[0].b), (-4, -1, -2, -3))
+
+    root = JsonImporter(parse_int=str).read(io.StringIO(text), stream=True)
+    eq_((root.a, root.b, root.children[0].a, root.children[0].b), ("4", "1", "2", "3"))
+
+
+def test_json_importer_stream_children():
+    """Json Importer streaming with attributes after the children."""
+    for text in (
+        '{"children": [], "x": 1}',
+        '{"children": [{"y": 2}], "x": 1}',
+        '{"a": 0, "children": [{"children": [], "y": 2}, {"children": [{}], "z": 3}], "x": 1}',
+    ):
+        ref = DictExporter().export(JsonImporter().read(io.StringIO(text)))
+        eq_(DictExporter().export(JsonImporter().read(io.StringIO(text), stream=True)), ref)
+        eq_(JsonImporter().read(io.StringIO(text), stream=True).x, 1)
+
+
+def test_json_importer_stream_deep():
+    """Json Importer streaming a deep tree."""
+    depth = 10000
+    text = '{"id": 0, "children": [' * depth + '{"id": "leaf"}' + "]}" * depth
+    root = JsonImporter().read(io.StringIO(text), stream=True)
+    node = root
+    while node.children:
+        (node,) = node.children
+    eq_(node.id, "leaf")
+    eq_(node.depth, depth)
+    eq_(node.root, root)
+
+
+def test_json_importer_stream_error():
+    """Json Importer streaming errors."""
+    for text in (
+        "",
+        "[]",
+        '{"a": 1',
+        '{"a" 1}',
+        '{"a": 1 "b": 2}',
+        '{"a": 1}}',
+        '{"children": [{}{}]}',
+        '{"a": }',
+        "{1: 2}",
+        '{"a": 1, []: 2}',
+        '{"children": [{true: 1}]}',
+        '{"children": [] "x": 1}',
+        '{"children": [{}] "x": 1}',
+        '{"children": [], }',
+    ):
+        try:
+            JsonImporter().read(io.StringIO(text), stream=True)
+        except json.JSONDecodeError:
+            pass
+        else:
+            raise AssertionError(f"{text!r} did not fail")
@@ -0,0 +1,97 @@
+from collections import defaultdict
+
+from anytree import AnyNode, Node, PreOrderIter
+from anytree.layout import Position, TidyLayout
+
+
+def _tree():
+    root = Node("root")
+    s0 = Node("sub0", parent=root)
+    Node("sub0B", parent=s0)
+    s0a = Node("sub0A", parent=s0)
+    Node("sub0Aa", parent=s0a)
+    Node("sub0Ab", parent=s0a)
+    Node("sub1", parent=root)
+    s2 = Node("sub2", parent=root)
+    s2a = Node("sub2A", parent=s2)
+    for idx in range(5):
+        Node(f"sub2A{idx}", parent=s2a)
+    return root
+
+
+def _check(positions, distance=1.0):
+    """Check the tidy tree rules."""
+    xs = {id(pos.node): pos.x for pos in positions}
+    levels = defaultdict(list)
+    for pos in positions:
+        levels[pos.y].append(pos)
+        children = pos.node.children
+        if children and id(children[0]) in xs:
+            # centered above children
+            assert abs(pos.x - (xs[id(children[0])] + xs[id(children[-1])]) / 2) < 1e-9
+    for row in levels.values():
+        # pre-order keeps the left-to-right order within one level
+        for left, right in zip(row, row[1:]):
+            assert right.x - left.x >= distance - 1e-9
+    assert min(xs.values()) == 0
+
+
+def test_layout():
+    """Positions."""
+    root = _tree()
+    positions = list(TidyLayout(root))
+    assert [pos.node for pos in positions] == list(PreOrderIter(root))
+    assert all(isinstance(pos, Position) for pos in positions)
+    assert [pos.y for pos in positions] == [node.depth for node in PreOrderIter(root)]
+    _check(positions)
+
+
+def test_layout_options():
+    """Distances, child order and maxlevel."""
+    root = _tree()
+    positions = list(TidyLayout(root, distance=3, leveldistance=2, childiter=reversed, maxlevel=3))
+    assert [pos.node.name for pos in positions] == [
+        "root",
+        "sub2",
+        "sub2A",
+        "sub1",
+        "sub0",
+        "sub0A",
+        "sub0B",
+    ]
+    assert [pos.y for pos in positions] == [0, 2, 4, 2, 2, 4, 4]
+    _check(positions, distance=3)
+    assert not list(TidyLayout(root, maxlevel=0))
+    assert list(TidyLayout(root, maxlevel=1)) == [Position(root, 0, 0)]
+
+
+def test_layout_symmetric():
+    """Identical subtrees are drawn identically."""
+    root = Node("root")
+    for idx in range(3):
+        sub = Node(f"sub{idx}", parent=root)
+        for jdx in range(idx + 1):
+            subsub = Node(f"sub{idx}{jdx}", parent=sub)
+            Node(f"sub{idx}{jdx}a", parent=subsub)
+    copy = Node("copy", parent=root)
+    for node in list(root.children[1].children):
+        Node(node.name, parent=copy, children=[Node(child.name) for child in node.children])
+    positions = {pos.node.path: pos for pos in TidyLayout(root)}
+    _check(list(TidyLayout(root)))
+
+    def shape(node):
+        base = positions[node.path].x
+        return [positions[desc.path].x - base for desc in node.descendants]
+
+    assert shape(root.children[1]) == shape(copy)
+
+
+def test_layout_deep():
+    """Deep trees do not hit the recursion limit."""
+    root = AnyNode(id=9999)
+    for idx in range(9998, -1, -1):
+        root = AnyNode(id=idx, children=[root, AnyNode(id=-idx)])
+    positions = list(TidyLayout(root))
+    assert len(positions) == 2 * 9999 + 1
+    assert max(pos.y for pos in positions) == 9999
+    _check(positions)
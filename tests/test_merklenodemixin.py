@@ -0,0 +1,168 @@
+import pickle
+
+from anytree import AnyNode, MerkleNodeMixin, Node, NodeMixin
+from anytree.exporter import DictExporter
+
+
+class MerkleNode(MerkleNodeMixin, Node):
+    hashattrs = ("name", "value")
+
+
+class CountingNode(MerkleNode):
+    calls = 0
+
+    def _get_hashdata(self):
+        CountingNode.calls += 1
+        return super()._get_hashdata()
+
+
+def _tree(cls=MerkleNode, **kwargs):
+    root = cls("root", value=0, **kwargs)
+    s0 = cls("sub0", parent=root, value=1)
+    cls("sub0B", parent=s0, value=2)
+    cls("sub0A", parent=s0)
+    s1 = cls("sub1", parent=root, value=[1, 2])
+    cls("sub1A", parent=s1, value="a")
+    return root
+
+
+def test_equal():
+    """Equal trees have equal hashes."""
+    root, other = _tree(), _tree()
+    assert root.subtree_hash == other.subtree_hash
+    assert isinstance(root.subtree_hash, bytes)
+    assert len(root.subtree_hash) == 16
+    assert root.children[0].subtree_hash != root.children[1].subtree_hash
+    assert root.subtree_hash != _tree(foo=4).children[0].subtree_hash
+    # unhashed attributes
+    other.foo = 5
+    assert root.subtree_hash == other.subtree_hash
+
+
+def test_modify():
+    """Attribute changes, attach, detach and reorder."""
+    root, other = _tree(), _tree()
+    sub0b = root.children[0].children[0]
+    assert root.subtree_hash == other.subtree_hash
+    sub0b.value = 3
+    assert root.subtree_hash != other.subtree_hash
+    sub0b.value = 2
+    assert root.subtree_hash == other.subtree_hash
+    del sub0b.value
+    assert root.subtree_hash != other.subtree_hash
+    sub0b.value = 2
+    assert root.subtree_hash == other.subtree_hash
+    # detach and attach
+    sub0b.parent = None
+    assert root.subtree_hash != other.subtree_hash
+    sub0b.parent = root.children[0]
+    assert root.subtree_hash != other.subtree_hash  # order differs
+    root.children[0].children = list(reversed(root.children[0].children))
+    assert root.subtree_hash == other.subtree_hash
+    # move between subtrees
+    sub1a = root.children[1].children[0]
+    sub1a.parent = root.children[0]
+    assert root.subtree_hash != other.subtree_hash
+    sub1a.parent = root.children[1]
+    assert root.subtree_hash == other.subtree_hash
+    # in-place modification
+    root.children[1].value.append(3)
+    assert root.subtree_hash == other.subtree_hash
+    root.children[1].touch()
+    assert root.subtree_hash != other.subtree_hash
+    del root.children
+    assert root.subtree_hash == MerkleNode("root", value=0).subtree_hash
+
+
+def test_lazy():
+    """Just modified nodes are recalculated."""
+    root = _tree(CountingNode)
+    CountingNode.calls = 0
+    digest = root.subtree_hash
+    assert CountingNode.calls == 6
+    assert root.subtree_hash == digest
+    assert CountingNode.calls == 6
+    root.children[0].children[1].value = 5
+    assert root.subtree_hash != digest
+    assert CountingNode.calls == 6 + 3
+    assert root.children[1].subtree_hash
+    assert CountingNode.calls == 6 + 3
+
+
+def test_mixed():
+    """Parents without hash support."""
+    parent = AnyNode()
+    root = _tree()
+    digest = root.subtree_hash
+    root.parent = parent
+    assert root.subtree_hash == digest
+    root.parent = None
+    assert root.subtree_hash == digest
+
+    class Plain(NodeMixin):
+        pass
+
+    plain = Plain()
+    root.children[0].parent = plain
+    assert root.subtree_hash != digest
+
+
+def test_mixed_children():
+    """Children without hash support are hashed by class name and public attributes."""
+    root = _tree()
+    digest = root.subtree_hash
+    plain = Node("plain", value=1, _private=2)
+    # attaching via the children of a node with hash support is tracked
+    root.children[0].children = [*root.children[0].children, plain]
+    digest1 = root.subtree_hash
+    assert digest1 != digest
+    other = _tree()
+    Node("plain", value=1, parent=other.children[0])
+    assert other.subtree_hash == digest1
+    # the whole subtree is hashed, including descendants with hash support
+    MerkleNode("deep", parent=plain)
+    plain.parent.touch()
+    digest2 = root.subtree_hash
+    assert digest2 not in (digest, digest1)
+    MerkleNode("deep", parent=other.children[0].children[2])
+    other.children[0].touch()
+    assert other.subtree_hash == digest2
+    # another class differs
+    AnyNode(name="plain", value=1, parent=other.children[0])
+    other.children[0].children[2].parent = None
+    other.children[0].touch()
+    assert other.subtree_hash not in (digest1, digest2)
+    # modifications are not tracked
+    plain.value = 2
+    assert root.subtree_hash == digest2
+    root.children[0].touch()
+    assert root.subtree_hash != digest2
+
+
+def test_repr_export_pickle():
+    """The hash is not visible."""
+    root = _tree()
+    digest = root.subtree_hash
+    assert repr(root) == "MerkleNode('/root', value=0)"
+    assert DictExporter().export(root)["name"] == "root"
+    assert "_MerkleNodeMixin__hash" not in DictExporter().export(root)
+    loaded = pickle.loads(pickle.dumps(root))
+    assert loaded.subtree_hash == digest
+    loaded.children[0].value = 7
+    assert loaded.subtree_hash != digest
+
+
+def test_deep():
+    """Deep trees do not hit the recursion limit."""
+    root = MerkleNode("9999")
+    for idx in range(9998, -1, -1):
+        root = MerkleNode(str(idx), children=[root])
+    other = MerkleNode("9999")
+    for idx in range(9998, -1, -1):
+        other = MerkleNode(str(idx), children=[other])
+    assert root.subtree_hash == other.subtree_hash
+    leaf = root
+    while leaf.children:
+        leaf = leaf.children[0]
+    leaf.name = "leaf"
+    assert root.subtree_hash != other.subtree_hash
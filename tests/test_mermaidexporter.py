@@ -1,7 +1,9 @@
+from pathlib import Path
+
 from pytest import fixture
 from test2ref import assert_refdata
 
-from anytree import Node
+from anytree import AnyNode, Node, PreOrderIter
 from anytree.exporter import MermaidExporter
 
 
@@ -64,3 +66,90 @@ def test_tree_maxlevel(tmp_path, root):
     """Tree with maxlevel."""
     MermaidExporter(root, maxlevel=2).to_file(tmp_path / "tree_maxlevel.md")
     assert_refdata(test_tree_maxlevel, tmp_path)
+
+
+def test_tree_summary(tmp_path, root):
+    """Summarised Tree."""
+    MermaidExporter(root, maxnodes=7, maxchildren=2).to_file(tmp_path / "tree.md")
+    assert_refdata(test_tree_summary, tmp_path)
+
+
+def test_tree_summary_custom(tmp_path):
+    """Summarised Tree with custom functions, which do not apply to `... N more` nodes."""
+    root = AnyNode(id="root", edge=0)
+    for idx in range(5):
+        AnyNode(id=f"sub{idx}", parent=root, edge=idx)
+    MermaidExporter(
+        root,
+        maxchildren=3,
+        nodenamefunc=lambda node: node.id,
+        nodefunc=lambda node: f'("{node.id}")',
+        edgefunc=lambda node, child: f"--{child.edge}-->",
+        filter_=lambda node: node.id != "sub1",
+        stop=lambda node: node.id == "sub0",
+    ).to_file(tmp_path / "tree.md")
+    assert_refdata(test_tree_summary_custom, tmp_path)
+
+
+def test_tree_stream(tmp_path, root):
+    """Tree with edges right after their node."""
+    MermaidExporter(root, stream=True, filter_=lambda node: node.name != "sub0A").to_file(tmp_path / "tree_stream.md")
+    assert_refdata(test_tree_stream, tmp_path)
+
+
+def test_to_files(tmp_path, root):
+    """Tree split into linked chunks."""
+    filenames = MermaidExporter(root, filter_=lambda node: node.name != "sub0A").to_files(tmp_path, maxnodes=4)
+    assert [Path(filename).name for filename in filenames] == ["0.md", "1.md", "2.md", "3.md"]
+    assert_refdata(test_to_files, tmp_path)
+
+
+def test_reuse(root):
+    """Node identifiers just live in the scope of one export."""
+    exporter = MermaidExporter(root)
+    lines = list(exporter)
+    assert list(exporter) == lines
+    exporter.node = root.children[1]
+    assert list(exporter)[1] == 'N0["sub1"]'
+    assert not exporter._MermaidExporter__node_ids
+
+
+def test_default_nodenamefunc(root):
+    """Subclasses can use and overwrite `_default_nodenamefunc`."""
+
+    class PrefixExporter(MermaidExporter):
+        def _default_nodenamefunc(self, node):
+            return "P" + super()._default_nodenamefunc(node)
+
+    exporter = PrefixExporter(root)
+    lines = list(exporter)
+    assert lines[1:3] == ['PN0["root"]', 'PN1["sub0"]']
+    assert list(exporter) == lines
+    exporter = MermaidExporter(root)
+    assert [exporter._default_nodenamefunc(node) for node in (root, root.children[0], root)] == ["N0", "N1", "N0"]
+
+
+def test_nodenamefunc_once(root):
+    """`nodenamefunc` is called once per node."""
+    calls = []
+
+    def nodenamefunc(node):
+        calls.append(node.name)
+        return node.name.replace("\\", "").replace('"', "")
+
+    for stream in (False, True):
+        calls.clear()
+        list(MermaidExporter(root, nodenamefunc=nodenamefunc, stream=stream))
+        assert sorted(calls) == sorted(node.name for node in PreOrderIter(root))
+
+
+def test_tree_deep():
+    """Deep trees do not hit the recursion limit."""
+    root = Node("9999")
+    for idx in range(9998, -1, -1):
+        root = Node(str(idx), children=[root])
+    for stream in (False, True):
+        lines = list(MermaidExporter(root, stream=stream))
+        assert len(lines) == 1 + 10000 + 9999
+        assert lines[1] == 'N0["0"]'
+        assert lines[-1] == ('N9999["9999"]' if stream else "N9998-->N9999")
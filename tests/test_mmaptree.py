@@ -0,0 +1,110 @@
+import gc
+import random
+
+from anytree import LevelOrderIter, Node, PostOrderIter, PreOrderIter, Resolver, SymlinkNode, TreeError, Walker
+from anytree.exporter import BinaryExporter
+from anytree.store import MmapTree
+
+from .helper import assert_raises, eq_
+
+
+def _create(tmp_path):
+    root = Node("root", value=0)
+    s0 = Node("sub0", parent=root, value=1, flag=True)
+    Node("sub0B", parent=s0, obj={"a": [1]})
+    s0a = Node("sub0A", parent=s0, flag=False)
+    s1 = Node("sub1", parent=root)
+    Node("sub1A", parent=s1, size=3)
+    SymlinkNode(s0a, parent=s1)
+    filepath = tmp_path / "tree.bin"
+    with open(filepath, "wb") as file:
+        BinaryExporter().write(root, file)
+    return root, filepath
+
+
+def test_mmaptree(tmp_path):
+    """Memory-mapped tree."""
+    root, filepath = _create(tmp_path)
+    with MmapTree(filepath) as tree:
+        eq_(len(tree), 7)
+        mroot = tree.root
+        eq_(mroot is tree.root, True)
+        eq_([node.name for node in PreOrderIter(mroot)], [node.name for node in PreOrderIter(root)])
+        eq_([node.name for node in PostOrderIter(mroot)], ["sub0B", "sub0A", "sub0", "sub1A", "sub0A", "sub1", "root"])
+        eq_([node.name for node in LevelOrderIter(mroot, maxlevel=2)], ["root", "sub0", "sub1"])
+        sub0, sub1 = mroot.children
+        eq_(sub0.parent is mroot, True)
+        eq_(mroot.parent, None)
+        eq_(str(sub0), "MmapNode(flag=True, name='sub0', value=1)")
+        eq_((sub0.value, sub0.flag, sub0.children[1].flag, sub0.children[0].obj), (1, True, False, {"a": [1]}))
+        eq_(sub1.children[1].target is sub0.children[1], True)
+        eq_(sub1.children[0].getattr("size"), 3)
+        eq_(sub1.children[0].getattr("flag", None), None)
+        with assert_raises(AttributeError, "'MmapNode' object has no attribute 'flag'"):
+            sub1.flag  # noqa: B018
+        with assert_raises(AttributeError, "'MmapNode' object has no attribute 'unknown'"):
+            sub1.unknown  # noqa: B018
+
+        eq_(mroot.descendants, (sub0, *sub0.children, sub1, *sub1.children))
+        eq_(mroot.leaves, (*sub0.children, *sub1.children))
+        eq_((mroot.height, sub0.height, sub0.children[0].height), (2, 1, 0))
+        eq_((mroot.size, sub0.size, sub1.children[0].size), (7, 3, 1))
+        eq_((mroot.is_leaf, sub1.children[0].is_leaf), (False, True))
+        eq_(sub0.children[1].path, (mroot, sub0, sub0.children[1]))
+        eq_(sub0.children[1].depth, 2)
+        eq_(sub0.children[1].root is mroot, True)
+        eq_(sub0.siblings, (sub1,))
+
+        resolver = Resolver()
+        eq_(resolver.get(mroot, "sub1/sub1A") is sub1.children[0], True)
+        eq_(resolver.get(sub0, "../sub1") is sub1, True)
+        eq_(resolver.glob(mroot, "*/sub0?"), [*sub0.children, sub1.children[1]])
+        eq_(str(sub1.children[1]), "MmapNode(target=MmapNode(flag=False, name='sub0A'))")
+        eq_(Walker.walk(sub0.children[0], sub1), ((sub0.children[0], sub0), mroot, (sub1,)))
+
+
+def test_mmaptree_views(tmp_path):
+    """Memory-mapped tree views are released."""
+    _, filepath = _create(tmp_path)
+    tree = MmapTree(filepath)
+    node = tree.root.children[0]
+    nodeid = id(node)
+    eq_(node is tree.root.children[0], True)
+    del node
+    gc.collect()
+    eq_([id(node) for node in tree.root.children if id(node) == nodeid], [])
+    tree.close()
+
+
+def test_mmaptree_readonly(tmp_path):
+    """Memory-mapped tree is read-only."""
+    _, filepath = _create(tmp_path)
+    with MmapTree(filepath) as tree:
+        root = tree.root
+        sub0, sub1 = root.children
+        with assert_raises(TreeError, "MmapNode is read-only."):
+            sub0.parent = sub1
+        with assert_raises(TreeError, "MmapNode is read-only."):
+            sub0.parent = None
+        with assert_raises(TreeError, "MmapNode is read-only."):
+            root.children = [sub1]
+        with assert_raises(TreeError, "MmapNode is read-only."):
+            del root.children
+        eq_(root.children, (sub0, sub1))
+
+
+def test_mmaptree_topology(tmp_path):
+    """Children, sizes and heights derived from the parent indices."""
+    rnd = random.Random(7)
+    nodes = [Node("n0")]
+    for idx in range(1, 300):
+        nodes.append(Node(f"n{idx}", parent=rnd.choice(nodes)))
+    filepath = tmp_path / "tree.bin"
+    with filepath.open("wb") as file:
+        BinaryExporter().write(nodes[0], file)
+    with MmapTree(filepath) as tree:
+        for node, view in zip(PreOrderIter(nodes[0]), PreOrderIter(tree.root)):
+            eq_(view.name, node.name)
+            eq_([child.name for child in view.children], [child.name for child in node.children])
+            eq_([desc.name for desc in view.descendants], [desc.name for desc in node.descendants])
+            eq_((view.size, view.height, view.is_leaf), (node.size, node.height, node.is_leaf))
@@ -1,6 +1,9 @@
+import copy
 import pickle
 
-from anytree import Node, RenderTree, SymlinkNode
+from anytree import LightNodeMixin, Node, RenderTree, SymlinkNode
+
+from .helper import assert_raises
 
 
 def test_pickle(tmp_path):
@@ -26,3 +29,184 @@ def test_pickle(tmp_path):
         loaded = pickle.load(file)
 
     assert str(RenderTree(loaded)).splitlines() == lines
+
+
+class LightNode(LightNodeMixin):
+    __slots__ = ["__dict__", "name"]
+
+    def __init__(self, name, parent=None, **kwargs):
+        self.name = name
+        self.parent = parent
+        self.__dict__.update(kwargs)
+
+
+class StateNode(Node):
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["name"] = state["name"].upper()
+        return state
+
+    def __setstate__(self, state):
+        state["restored"] = True
+        self.__dict__.update(state)
+
+
+class ReduceNode(Node):
+    def __reduce__(self):
+        return _make_reduce_node, (self.name.upper(),), self.__dict__
+
+
+def _make_reduce_node(name):
+    node = ReduceNode.__new__(ReduceNode)
+    node.reduced = name
+    return node
+
+
+class BrokenNode(Node):
+    def __setstate__(self, state):
+        raise ValueError("broken")
+
+
+def test_pickle_deep():
+    """Deep trees do not hit the recursion limit."""
+    root = Node("9999")
+    for idx in range(9998, -1, -1):
+        root = Node(str(idx), children=[root])
+
+    loaded = pickle.loads(pickle.dumps(root))
+    idx = 0
+    node = loaded
+    while node.children:
+        (node,) = node.children
+        idx += 1
+        assert node.name == str(idx)
+    assert idx == 9999
+    assert node.depth == 9999
+
+
+def test_pickle_child():
+    """Pickling a child pickles the whole tree."""
+    root = Node("root", foo=1)
+    a = Node("a", parent=root)
+    b = Node("b", parent=a)
+    c = Node("c", parent=root, ref=a)
+
+    loaded = pickle.loads(pickle.dumps(b))
+    assert loaded.path[0].name == "root"
+    assert str(RenderTree(loaded.root)) == str(RenderTree(root))
+    assert loaded.root.children[1].ref is loaded.parent
+
+    loadeda, loadedc, loadedroot = pickle.loads(pickle.dumps([a, c, root]))
+    assert loadeda.parent is loadedroot
+    assert loadedc.parent is loadedroot
+    assert loadedc.ref is loadeda
+    assert loadedroot.children == (loadeda, loadedc)
+
+
+def test_pickle_symlink():
+    """Symlink targets stay intact - within and across trees."""
+    root = Node("root")
+    a = Node("a", parent=root)
+    b = Node("b", parent=a)
+    other = Node("other")
+    c = SymlinkNode(b, parent=root)
+    d = SymlinkNode(other, parent=b)
+
+    loaded = pickle.loads(pickle.dumps(root))
+    loadedb = loaded.children[0].children[0]
+    loadedc = loaded.children[1]
+    assert loadedc.target is loadedb
+    assert loadedc.name == "b"
+    assert loadedb.children[0].target.name == "other"
+    assert loadedb.children[0].target.parent is None
+
+
+def test_pickle_lightnode():
+    """LightNodeMixin with slots and instance attributes."""
+    root = LightNode("root", foo=4)
+    sub = LightNode("sub", parent=root)
+    LightNode("subsub", parent=sub, bar=[1, 2])
+
+    loaded = pickle.loads(pickle.dumps(root))
+    assert loaded.name == "root"
+    assert loaded.foo == 4
+    (loadedsub,) = loaded.children
+    assert loadedsub.name == "sub"
+    assert loadedsub.parent is loaded
+    (loadedsubsub,) = loadedsub.children
+    assert loadedsubsub.bar == [1, 2]
+    assert loadedsubsub.parent is loadedsub
+
+
+def test_pickle_custom_state():
+    """Classes with their own state handling."""
+    root = Node("root")
+    StateNode("sub", parent=root)
+
+    loaded = pickle.loads(pickle.dumps(root))
+    (sub,) = loaded.children
+    assert sub.name == "SUB"
+    assert sub.restored
+    assert sub.parent is loaded
+
+    root = StateNode("root")
+    Node("sub", parent=root)
+    loaded = pickle.loads(pickle.dumps(root))
+    assert loaded.name == "ROOT"
+    assert loaded.children[0].parent is loaded
+
+
+def test_pickle_custom_reduce():
+    """Classes with their own `__reduce__`."""
+    root = ReduceNode("root")
+    sub = ReduceNode("sub", parent=root)
+    ReduceNode("subsub", parent=sub)
+    loaded = pickle.loads(pickle.dumps(root))
+    assert loaded.reduced == "ROOT"
+    (loadedsub,) = loaded.children
+    assert loadedsub.reduced == "SUB"
+    assert loadedsub.parent is loaded
+    assert loadedsub.children[0].reduced == "SUBSUB"
+
+    root = Node("root")
+    sub = ReduceNode("sub", parent=root)
+    Node("subsub", parent=sub)
+    loadedsub, loaded = pickle.loads(pickle.dumps([sub, root]))
+    assert loadedsub.reduced == "SUB"
+    assert loaded.children == (loadedsub,)
+    assert loadedsub.parent is loaded
+    (loadedsubsub,) = loadedsub.children
+    assert loadedsubsub.name == "subsub"
+    assert loadedsubsub.parent is loadedsub
+
+
+def test_pickle_failed():
+    """A failed unpickle leaves nothing behind."""
+    root = Node("root")
+    BrokenNode("sub", parent=root)
+    data = pickle.dumps(root)
+    with assert_raises(ValueError, "broken"):
+        pickle.loads(data)
+    root = Node("root")
+    Node("sub", parent=root)
+    loaded = pickle.loads(pickle.dumps(root))
+    assert loaded.parent is None
+    assert loaded.children[0].parent is loaded
+
+
+def test_copy():
+    """Shallow copy keeps the links, deep copy copies the tree."""
+    root = Node("root")
+    a = Node("a", parent=root)
+    b = Node("b", parent=a)
+
+    copied = copy.copy(a)
+    assert copied.parent is root
+    assert copied.children == (b,)
+
+    copied = copy.deepcopy(a)
+    assert copied.name == "a"
+    assert copied.parent is not root
+    assert copied.parent.name == "root"
+    assert copied.children[0].name == "b"
+    assert copied.children[0].parent is copied
@@ -166,3 +166,221 @@ def test_repr():
     bystr = str(anytree.RenderTree(root)).splitlines()
     byident = anytree.RenderTree(root).by_attr(lambda node: node).splitlines()
     assert bystr == byident
+
+
+def test_window():
+    """Windowed rendering."""
+    root = anytree.Node("root")
+    s0 = anytree.Node("sub0", parent=root)
+    anytree.Node("sub0B", parent=s0)
+    s0a = anytree.Node("sub0A", parent=s0)
+    anytree.Node("sub0Aa", parent=s0a)
+    s1 = anytree.Node("sub1", parent=root)
+    anytree.Node("sub1A", parent=s1)
+    anytree.Node("sub1B", parent=s1)
+
+    for kwargs in ({}, {"maxlevel": 2}, {"maxlevel": 3}, {"childiter": reversed}):
+        r = anytree.RenderTree(root, **kwargs)
+        rows = list(r)
+        assert r.count() == len(rows)
+        for offset in range(len(rows) + 2):
+            for limit in (None, 0, 1, 2, 5):
+                stop = None if limit is None else offset + limit
+                assert list(r.window(offset, limit)) == rows[offset:stop], (kwargs, offset, limit)
+
+
+def test_window_skip():
+    """Windowed rendering does not touch skipped subtrees twice."""
+    visits = []
+
+    def childiter(children):
+        visits.extend(children)
+        return children
+
+    root = anytree.Node("root")
+    for idx in range(10):
+        sub = anytree.Node(f"sub{idx}", parent=root)
+        for jdx in range(10):
+            anytree.Node(f"sub{idx}{jdx}", parent=sub)
+
+    r = anytree.RenderTree(root, childiter=childiter)
+    assert r.count() == 111
+    visits.clear()
+    assert [row.node.name for row in r.window(100, 3)] == ["sub9", "sub90", "sub91"]
+    assert len(visits) == 20
+
+
+def test_window_wide():
+    """Windowed rendering of a wide tree finds the start without walking the preceding siblings again."""
+    visits = []
+
+    def childiter(children):
+        visits.append(len(children))
+        return children
+
+    root = anytree.Node("root", children=[anytree.Node(f"sub{idx}") for idx in range(10000)])
+    r = anytree.RenderTree(root, childiter=childiter)
+    assert [row.node.name for row in r.window(9998)] == ["sub9997", "sub9998", "sub9999"]
+    visits.clear()
+    for offset in range(1, 10001, 997):
+        assert [row.node.name for row in r.window(offset, 1)] == [f"sub{offset - 1}"]
+    assert visits == []
+    assert [row.pre for row in r.window(9999, 5)] == ["├── ", "└── "]
+
+
+def test_window_deep():
+    """Row counting and windowed rendering of a deep tree do not recurse."""
+    root = anytree.Node("n2999")
+    for idx in reversed(range(2999)):
+        root = anytree.Node(f"n{idx}", children=[root])
+    r = anytree.RenderTree(root)
+    assert r.count() == 3000
+    assert [row.node.name for row in r.window(2998)] == ["n2998", "n2999"]
+    assert anytree.RenderTree(root, maxlevel=100).count() == 100
+
+
+def test_max_children():
+    """Truncate children."""
+    root = anytree.Node("root")
+    for idx in range(5):
+        sub = anytree.Node(f"sub{idx}", parent=root)
+        for jdx in range(3):
+            anytree.Node(f"sub{idx}{jdx}", parent=sub)
+
+    r = anytree.RenderTree(root, max_children=2)
+    assert str(r).splitlines() == [
+        "Node('/root')",
+        "├── Node('/root/sub0')",
+        "│   ├── Node('/root/sub0/sub00')",
+        "│   ├── Node('/root/sub0/sub01')",
+        "│   └── ... 1 more",
+        "├── Node('/root/sub1')",
+        "│   ├── Node('/root/sub1/sub10')",
+        "│   ├── Node('/root/sub1/sub11')",
+        "│   └── ... 1 more",
+        "└── ... 3 more",
+    ]
+    summary = list(r)[-1].node
+    assert isinstance(summary, anytree.RenderSummary)
+    assert summary.count == 3
+    assert summary.size == 12
+    assert [node.name for node in summary.nodes] == ["sub2", "sub3", "sub4"]
+
+    rows = list(r)
+    assert r.count() == len(rows)
+    for offset in range(len(rows)):
+        assert [row.pre for row in r.window(offset, 3)] == [row.pre for row in rows[offset : offset + 3]]
+
+    assert anytree.RenderTree(root, max_children=5, maxlevel=2).by_attr().splitlines() == [
+        "root",
+        "├── sub0",
+        "├── sub1",
+        "├── sub2",
+        "├── sub3",
+        "└── sub4",
+    ]
+    assert anytree.RenderTree(root, max_children=0).by_attr(lambda n: n.name).splitlines() == [
+        "root",
+        "└── ... 5 more",
+    ]
+
+
+def test_max_rows():
+    """Truncate rows."""
+    root = anytree.Node("root")
+    s0 = anytree.Node("sub0", parent=root)
+    anytree.Node("sub0A", parent=s0)
+    anytree.Node("sub1", parent=root)
+
+    assert anytree.RenderTree(root, max_rows=2).by_attr().splitlines() == [
+        "root",
+        "├── sub0",
+        "...",
+    ]
+    assert anytree.RenderTree(root, max_rows=4).by_attr().splitlines() == [
+        "root",
+        "├── sub0",
+        "│   └── sub0A",
+        "└── sub1",
+    ]
+    summary = list(anytree.RenderTree(root, max_rows=1))[-1].node
+    assert summary.count is None
+    assert summary.size is None
+    assert anytree.RenderTree(root, max_rows=2, max_children=1).by_attr().splitlines() == [
+        "root",
+        "├── sub0",
+        "...",
+    ]
+    assert repr(anytree.RenderSummary()) == "..."
+
+    # the rows behind `max_rows` are not visited
+    visits = []
+
+    class VisitNode(anytree.Node):
+        @property
+        def children(self):
+            visits.append(self.name)
+            return super().children
+
+    root = VisitNode("root")
+    for idx in range(100):
+        VisitNode("leaf", parent=VisitNode(f"sub{idx}", parent=root))
+    visits.clear()
+    assert len(anytree.RenderTree(root, max_rows=5).by_attr().splitlines()) == 6
+    assert len(visits) < 10
+
+
+def test_summary_size():
+    """The size of the omitted nodes is just determined on request and once."""
+    visits = []
+
+    class SizeNode(anytree.Node):
+        @property
+        def size(self):
+            visits.append(self)
+            return super().size
+
+    root = anytree.Node("root")
+    for idx in range(3):
+        SizeNode(f"sub{idx}", parent=root)
+    summary = list(anytree.RenderTree(root, max_children=1))[-1].node
+    assert repr(summary) == "... 2 more"
+    assert not visits
+    assert [summary.size, summary.size] == [2, 2]
+    assert len(visits) == 2
+
+
+def test_render_str_path():
+    """Rendering derives node paths from the parent row."""
+
+    class SepNode(anytree.Node):
+        separator = "|"
+
+    class ReprNode(anytree.Node):
+        def __repr__(self):
+            return f"ReprNode({self.name})"
+
+    root = anytree.Node("root")
+    s0 = anytree.Node("sub0", parent=root, foo=1)
+    s0a = SepNode("sub0A", parent=s0)
+    anytree.Node("sub0Aa", parent=s0a)
+    s1 = ReprNode("sub1", parent=root)
+    anytree.Node("sub1A", parent=s1)
+    anytree.Node(2, parent=s1)
+
+    lines = str(anytree.RenderTree(root)).splitlines()
+    assert lines == [
+        "Node('/root')",
+        "├── Node('/root/sub0', foo=1)",
+        "│   └── SepNode('|root|sub0|sub0A')",
+        "│       └── Node('/root/sub0/sub0A/sub0Aa')",
+        "└── ReprNode(sub1)",
+        "    ├── Node('/root/sub1/sub1A')",
+        "    └── Node('/root/sub1/2')",
+    ]
+    assert [line.lstrip("│├└─ ") for line in lines] == [repr(node) for node in anytree.PreOrderIter(root)]
+    assert str(anytree.RenderTree(s0)).splitlines() == [
+        "Node('/root/sub0', foo=1)",
+        "└── SepNode('|root|sub0|sub0A')",
+        "    └── Node('/root/sub0/sub0A/sub0Aa')",
+    ]
@@ -0,0 +1,156 @@
+import gc
+import tracemalloc
+
+from anytree import AnyNode, Node, PreOrderIter, SharedNode, TreeError
+from anytree.exporter import DictExporter
+from anytree.importer import DictImporter
+from anytree.sharing import intern_subtrees
+
+from .helper import assert_raises, eq_
+
+
+def _hosts(count):
+    root = Node("hosts")
+    for idx in range(count):
+        host = Node(f"host{idx}", parent=root)
+        Node("config", parent=host, mtu=1500, children=[Node("eth0", ip=None), Node("eth1", ip=None)])
+    return root
+
+
+def test_intern_subtrees():
+    root = _hosts(100)
+    data = DictExporter().export(root)
+    eq_(intern_subtrees(root), root)
+    configs = [host.children[0] for host in root.children]
+    assert all(isinstance(config, SharedNode) for config in configs)
+    assert all(config.target is configs[0].target for config in configs)
+    assert configs[0].target.parent is None
+    eq_(DictExporter().export(root), data)
+    eq_(root.size, 401)
+    eq_(configs[3].children[1].path[-1].name, "eth1")
+    eq_(configs[3].children[1].parent, configs[3])
+    # interning again keeps everything
+    intern_subtrees(root)
+    assert all(host.children[0] is config for host, config in zip(root.children, configs))
+
+
+def test_intern_subtrees_minsize():
+    root = _hosts(3)
+    intern_subtrees(root, minsize=4)
+    assert not any(isinstance(node, SharedNode) for node in PreOrderIter(root))
+    intern_subtrees(root, minsize=1)
+    # the config subtrees are the topmost identical ones
+    eq_([type(host.children[0]) for host in root.children], [SharedNode] * 3)
+
+
+def test_intern_subtrees_attrs():
+    root = _hosts(3)
+    root.children[1].children[0].children[0].ip = "10.0.0.1"
+    intern_subtrees(root)
+    eq_([type(host.children[0]) for host in root.children], [SharedNode, Node, SharedNode])
+    # attributes are compared independent of their order
+    root = Node("root", children=[Node("a", children=[Node("b", x=1, y=2)]), Node("a", children=[Node("b", y=2, x=1)])])
+    intern_subtrees(root)
+    eq_([type(child) for child in root.children], [SharedNode, SharedNode])
+    # just the exported attributes are compared
+    root = _hosts(3)
+    root.children[1].children[0].children[0].ip = "10.0.0.1"
+    intern_subtrees(root, exporter=DictExporter(attriter=lambda attrs: [(k, v) for k, v in attrs if k != "ip"]))
+    eq_([type(host.children[0]) for host in root.children], [SharedNode] * 3)
+
+
+def test_intern_subtrees_class():
+    class OtherNode(Node):
+        pass
+
+    root = _hosts(3)
+    config = root.children[1].children[0]
+    config.children = [OtherNode("eth0", ip=None), Node("eth1", ip=None)]
+    intern_subtrees(root)
+    eq_([type(host.children[0]) for host in root.children], [SharedNode, Node, SharedNode])
+    eq_(type(root.children[1].children[0].children[0]), OtherNode)
+
+
+def test_intern_subtrees_deep():
+    chains = []
+    for _ in range(2):
+        chain = Node("leaf")
+        for idx in range(5000):
+            chain = Node(str(idx), children=[chain])
+        chains.append(chain)
+    root = Node("root", children=chains)
+    intern_subtrees(root)
+    eq_([type(child) for child in root.children], [SharedNode, SharedNode])
+    node = root.children[1]
+    for _ in range(5000):
+        node = node.children[0]
+    eq_(node.name, "leaf")
+    eq_(node.depth, 5001)
+
+
+def test_shared_node_readonly():
+    root = _hosts(2)
+    intern_subtrees(root)
+    config = root.children[0].children[0]
+    with assert_raises(TreeError, "SharedNode is read-only."):
+        config.mtu = 9000
+    with assert_raises(TreeError, "SharedNode is read-only."):
+        config.children[0].ip = "10.0.0.1"
+    with assert_raises(TreeError, "SharedNode is read-only."):
+        config.children = []
+    with assert_raises(TreeError, "SharedNode is read-only."):
+        del config.children
+    with assert_raises(TreeError, "SharedNode is read-only."):
+        config.children[0].parent = None
+    with assert_raises(TreeError, "SharedNode is read-only."):
+        SharedNode(Node("foo"), parent=config)
+    eq_(config.target.mtu, 1500)
+    # the view itself can be moved
+    config.parent = root
+    eq_(root.children[-1], config)
+    eq_(config.children[0].path[0], root)
+
+
+def test_dictimporter_intern():
+    root = _hosts(100)
+    data = DictExporter().export(root)
+    interned = DictImporter(nodecls=Node, intern=True).import_(data)
+    configs = [host.children[0] for host in interned.children]
+    assert all(isinstance(config, SharedNode) for config in configs)
+    assert all(config.target is configs[0].target for config in configs)
+    eq_(DictExporter().export(interned), data)
+    plain = DictImporter(intern=True).import_({"a": 0, "children": [{"a": 1}, {"a": 1}]})
+    eq_([type(child) for child in plain.children], [AnyNode, AnyNode])
+    # the very same dictionary listed repeatedly
+    template = {"name": "config", "children": [{"name": "eth0"}]}
+    interned = DictImporter(nodecls=Node, intern=True).import_({"name": "root", "children": [template] * 3})
+    eq_([type(child) for child in interned.children], [SharedNode] * 3)
+
+
+def test_shared_node_memory():
+    """Traversing the views does not keep them."""
+    template = {"name": "config", "children": [{"name": f"eth{idx}", "mtu": 1500} for idx in range(20)]}
+    data = {"name": "hosts", "children": [{"name": f"host{idx}", "children": [template]} for idx in range(500)]}
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        root = DictImporter(nodecls=Node).import_(data)
+        plain = tracemalloc.get_traced_memory()[0] - start
+        del root
+        gc.collect()
+        start = tracemalloc.get_traced_memory()[0]
+        root = DictImporter(nodecls=Node, intern=True).import_(data)
+        interned = tracemalloc.get_traced_memory()[0] - start
+        eq_(sum(1 for _ in PreOrderIter(root)), 11001)
+        gc.collect()
+        traversed = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+    assert interned < plain / 4
+    assert traversed < plain / 4
+    # views in use stay the same
+    config = root.children[0].children[0]
+    eth0 = config.children[0]
+    assert config.children[0] is eth0
+    eq_(len(eth0.siblings), 19)
+    assert all(sibling is child for sibling, child in zip(eth0.siblings, config.children[1:]))
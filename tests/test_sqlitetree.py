@@ -0,0 +1,189 @@
+import gc
+
+from anytree import Node, PreOrderIter, RenderTree, TreeError
+from anytree.search import CountError
+from anytree.store import SqliteNode, SqliteTree
+
+from .helper import assert_raises, eq_
+
+
+def _names(nodes):
+    return [node.name for node in nodes]
+
+
+def test_sqlitetree(tmp_path):
+    """Persistent tree."""
+    filepath = tmp_path / "tree.db"
+    with SqliteTree(filepath) as tree:
+        root = SqliteNode(tree, name="root", value=0)
+        s0 = SqliteNode(tree, name="sub0", parent=root, flag=True, obj={"a": [1]})
+        SqliteNode(tree, name="sub0B", parent=s0)
+        SqliteNode(tree, name="sub0A", parent=s0, _private=4)
+        s1 = SqliteNode(tree, name="sub1", parent=root)
+        lines = str(RenderTree(root)).splitlines()
+        rootid = root.nodeid
+
+    with SqliteTree(filepath) as tree:
+        eq_(len(tree), 5)
+        (root,) = tree.roots
+        eq_(root.nodeid, rootid)
+        eq_(tree.get(rootid) is root, True)
+        eq_(str(RenderTree(root)).splitlines(), lines)
+        s0, s1 = root.children
+        eq_((s0.flag, s0.obj, root.value), (True, {"a": [1]}, 0))
+        eq_(hasattr(s0.children[1], "_private"), False)
+        eq_(s0.parent is root, True)
+        eq_(_names(root.descendants), ["sub0", "sub0B", "sub0A", "sub1"])
+        eq_(_names(s0.children[0].ancestors), ["root", "sub0"])
+        eq_((root.size, root.height, s0.children[0].depth), (5, 2, 2))
+        eq_(s0.children[0].root is root, True)
+        with assert_raises(KeyError, "'Unknown node id 99.'"):
+            tree.get(99)
+        with assert_raises(AttributeError, "'SqliteNode' object has no attribute 'foo'"):
+            s1.foo  # noqa: B018
+
+
+def test_sqlitetree_lazy(tmp_path):
+    """Nodes are loaded on demand and released again."""
+    filepath = tmp_path / "tree.db"
+    with SqliteTree(filepath) as tree:
+        tree.insert(Node("root", children=[Node("sub0", children=[Node("sub0A")]), Node("sub1")]))
+
+    with SqliteTree(filepath) as tree:
+        (root,) = tree.roots
+        eq_("_NodeMixin__children" in vars(root), False)
+        eq_("name" in vars(root), False)
+        sub0 = tree.find(name="sub0")
+        eq_(sub0.parent is root, True)
+        eq_("_NodeMixin__children" in vars(root), False)
+        eq_(root.children[0] is sub0, True)
+        sub0id = sub0.nodeid
+        del root, sub0
+        gc.collect()
+        eq_(tree.get(sub0id).name, "sub0")
+
+
+def test_sqlitetree_modify(tmp_path):
+    """Modifications are persisted."""
+    filepath = tmp_path / "tree.db"
+    with SqliteTree(filepath) as tree:
+        root = tree.insert(Node("root", children=[Node("sub0", children=[Node("sub0A"), Node("sub0B")]), Node("sub1")]))
+        sub0, sub1 = root.children
+        sub0a, sub0b = sub0.children
+        sub0.parent = sub1
+        sub0b.parent = None
+        sub0a.value = 4
+        sub0a.value = 5
+        sub1.name = "SUB1"
+        sub1.children = [SqliteNode(tree, name="new"), sub0]
+        del sub0.name
+        with assert_raises(AttributeError, "name"):
+            del sub0.name
+
+    with SqliteTree(filepath) as tree:
+        root, sub0b = tree.roots
+        eq_(
+            str(RenderTree(root)).splitlines(),
+            [
+                "SqliteNode(name='root')",
+                "└── SqliteNode(name='SUB1')",
+                "    ├── SqliteNode(name='new')",
+                "    └── SqliteNode()",
+                "        └── SqliteNode(name='sub0A', value=5)",
+            ],
+        )
+        eq_(sub0b.name, "sub0B")
+        sub0a = tree.find(value=5)
+        eq_(_names(sub0a.ancestors[:2]), ["root", "SUB1"])
+        eq_(sub0a.depth, 3)
+        eq_(root.height, 3)
+        eq_(root.size, 5)
+        tree.delete(root.children[0].children[1])
+        eq_(len(tree), 4)
+        eq_(tree.find(value=5), None)
+        eq_(root.size, 3)
+
+
+def test_sqlitetree_find(tmp_path):
+    """Attribute queries."""
+    with SqliteTree(tmp_path / "tree.db") as tree:
+        root = SqliteNode(tree, name="root")
+        s0 = SqliteNode(tree, name="sub0", parent=root, kind="a", tags=("x",))
+        SqliteNode(tree, name="sub0A", parent=s0, kind="b", flag=True)
+        SqliteNode(tree, name="sub0B", parent=s0, kind="a", flag=1)
+        SqliteNode(tree, name="sub1", parent=root, kind="a")
+        eq_(_names(tree.findall(kind="a")), ["sub0", "sub0B", "sub1"])
+        eq_(_names(tree.findall(s0, kind="a")), ["sub0", "sub0B"])
+        eq_(_names(tree.findall(kind="a", flag=1)), ["sub0B"])
+        eq_(_names(tree.findall(flag=True)), ["sub0A"])
+        eq_(_names(tree.findall(tags=("x",))), ["sub0"])
+        eq_(tree.find(name="sub1").kind, "a")
+        eq_(tree.find(name="foo"), None)
+        msg = (
+            "Expecting 1 elements at maximum, but found 3. (SqliteNode(kind='a', name='sub0', tags=('x',)), "
+            "SqliteNode(flag=1, kind='a', name='sub0B'), SqliteNode(kind='a', name='sub1'))"
+        )
+        with assert_raises(CountError, msg):
+            tree.find(kind="a")
+        eq_(
+            _names(PreOrderIter(root, filter_=lambda node: getattr(node, "kind", None) == "a")),
+            ["sub0", "sub0B", "sub1"],
+        )
+
+
+def test_sqlitetree_insert(tmp_path):
+    """Insert deep tree."""
+    node = Node("299")
+    for idx in range(298, -1, -1):
+        node = Node(str(idx), children=[node])
+    with SqliteTree(tmp_path / "tree.db") as tree:
+        root = SqliteNode(tree, name="root")
+        top = tree.insert(node, parent=root)
+        eq_(top.parent is root, True)
+        eq_(root.height, 300)
+        leaf = tree.find(name="299")
+        eq_(leaf.depth, 300)
+        eq_(len(leaf.ancestors), 300)
+        eq_(len(root.descendants), 300)
+
+
+def test_sqlitetree_insert_sqlitenode(tmp_path):
+    """Insert subtree of another database."""
+    with SqliteTree(tmp_path / "a.db") as tree:
+        root = SqliteNode(tree, name="root")
+        sub = SqliteNode(tree, name="sub", parent=root, size_=4)
+        SqliteNode(tree, name="subsub", parent=sub)
+    with SqliteTree(tmp_path / "a.db") as tree, SqliteTree(tmp_path / "b.db") as other:
+        top = other.insert(tree.find(name="sub"))
+        other.insert(tree.roots[0], parent=top)
+        eq_(
+            str(RenderTree(top)).splitlines(),
+            [
+                "SqliteNode(name='sub', size_=4)",
+                "├── SqliteNode(name='subsub')",
+                "└── SqliteNode(name='root')",
+                "    └── SqliteNode(name='sub', size_=4)",
+                "        └── SqliteNode(name='subsub')",
+            ],
+        )
+        eq_(len(tree), 3)
+        eq_(len(other), 5)
+
+
+def test_sqlitetree_insert_private(tmp_path):
+    """Attributes starting with an underscore are not stored."""
+    with SqliteTree(tmp_path / "tree.db") as tree:
+        node = Node("root", _private=1, size_=4)
+        root = tree.insert(node)
+        eq_(root.size_, 4)
+        eq_(hasattr(root, "_private"), False)
+
+
+def test_sqlitetree_error(tmp_path):
+    """Nodes of other trees cannot be attached."""
+    with SqliteTree(tmp_path / "a.db") as tree, SqliteTree(tmp_path / "b.db") as other:
+        root = SqliteNode(tree, name="root")
+        with assert_raises(TreeError, "Parent node Node('/foo') is not part of the same 'SqliteTree'."):
+            SqliteNode(tree, name="sub", parent=Node("foo"))
+        with assert_raises(TreeError, "Parent node SqliteNode(name='root') is not part of the same 'SqliteTree'."):
+            SqliteNode(other, name="sub", parent=root)
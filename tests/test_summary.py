@@ -0,0 +1,149 @@
+from anytree import Node, PreOrderIter, RenderTree
+from anytree.exporter import SummaryNode, summarize
+from anytree.exporter.summary import _iter_chunks
+
+from .helper import assert_raises
+
+
+def _render(summary):
+    return "\n".join(f"{row.pre}{row.node.label}" for row in RenderTree(summary))
+
+
+def _wide(count):
+    root = Node("root")
+    for idx in range(count):
+        sub = Node(f"sub{idx}", parent=root)
+        Node(f"sub{idx}A", parent=sub)
+    return root
+
+
+def test_summarize_unlimited():
+    """Without limits the summary mirrors the tree."""
+    root = _wide(3)
+    summary = summarize(root)
+    assert [node.name for node in PreOrderIter(summary)] == [node.name for node in PreOrderIter(root)]
+    assert all(isinstance(node, SummaryNode) for node in PreOrderIter(summary))
+    assert summary.node is root
+    assert summary.children[0].children[0].node is root.children[0].children[0]
+    # original tree is untouched
+    assert root.parent is None
+    assert len(root.children) == 3
+
+
+def test_summarize_maxnodes():
+    """The node budget is never exceeded."""
+    root = _wide(100)
+    for maxnodes in (1, 2, 50, 101, 150, 201, 1000):
+        summary = summarize(root, maxnodes=maxnodes)
+        count = len(list(PreOrderIter(summary)))
+        assert count <= maxnodes
+        # all nodes are shown or reported as hidden
+        assert count + sum(node.hidden for node in PreOrderIter(summary)) == 201
+    assert _render(summarize(root, maxnodes=100)) == "root (+200)"
+    assert len(list(PreOrderIter(summarize(root, maxnodes=150)))) == 150
+
+
+def test_summarize_maxchildren():
+    """Fan-out is capped by a `... N more` node."""
+    root = _wide(5)
+    summary = summarize(root, maxchildren=3)
+    assert _render(summary).splitlines() == [
+        "root",
+        "├── sub0",
+        "│   └── sub0A",
+        "├── sub1",
+        "│   └── sub1A",
+        "└── ... 3 more (6 nodes)",
+    ]
+    more = summary.children[-1]
+    assert more.node is None
+    assert more.more == 3
+    assert more.hidden == 6
+    assert repr(more) == "SummaryNode(None, hidden=6, more=3)"
+    assert repr(summary.children[0]) == "SummaryNode(Node('/root/sub0'))"
+
+
+def test_summarize_attributes():
+    """Attributes are forwarded to the summarised node."""
+    root = Node("root", foo=4)
+    summary = summarize(root)
+    assert summary.foo == 4
+    assert summary.label == "root"
+    with assert_raises(AttributeError, "'Node' object has no attribute 'bar'"):
+        summary.bar  # noqa: B018
+    with assert_raises(AttributeError, "'SummaryNode' object has no attribute '_foo'"):
+        summary._foo  # noqa: B018
+
+
+def test_summarize_deep():
+    """Deep trees do not hit the recursion limit."""
+    root = Node("9999")
+    for idx in range(9998, -1, -1):
+        root = Node(str(idx), children=[root])
+    summary = summarize(root, maxnodes=10)
+    assert [node.name for node in PreOrderIter(summary)] == [str(idx) for idx in range(10)]
+    assert summary.children[0].children[0].children[0].children[0].children[0].depth == 5
+    assert _render(summary).splitlines()[-1].endswith("└── 9 (+9990)")
+
+
+def _check_chunks(root, maxnodes, maxsize=None, **kwargs):
+    chunks = list(_iter_chunks(root, maxnodes, "{}.md", **kwargs))
+    assert [idx for idx, _ in chunks][-1] == 0
+    assert sorted(idx for idx, _ in chunks) == list(range(len(chunks)))
+    # just wide nodes exceed the limit
+    maxsize = max(maxnodes, maxsize or 0)
+    shown = []
+    for _, chunk in chunks:
+        nodes = list(PreOrderIter(chunk))
+        assert len(nodes) <= maxsize
+        shown += [node.node for node in nodes if not node.link]
+        for node in nodes:
+            if node.link:
+                assert node.is_leaf
+                idx = int(node.link.split(".")[0])
+                assert dict(chunks)[idx].node is node.node
+                assert len(list(PreOrderIter(dict(chunks)[idx]))) <= node.hidden + 1
+    return chunks, shown
+
+
+def test_chunks():
+    """Chunks are bounded and contain every node once."""
+    root = _wide(10)
+    for maxnodes in (2, 3, 5, 8, 21, 100):
+        chunks, shown = _check_chunks(root, maxnodes, maxsize=11)
+        assert sorted(map(id, shown)) == sorted(map(id, PreOrderIter(root)))
+        assert (len(chunks) == 1) == (maxnodes >= 21)
+    chunks = list(_iter_chunks(root, 15, "{}.md"))
+    assert [(idx, len(list(PreOrderIter(chunk)))) for idx, chunk in chunks] == [
+        (1, 2),
+        (2, 2),
+        (3, 2),
+        (4, 2),
+        (5, 2),
+        (6, 2),
+        (0, 15),
+    ]
+    assert repr(chunks[-1][1].children[0]) == "SummaryNode(Node('/root/sub0'), hidden=1, link='1.md')"
+    assert repr(chunks[-1][1].children[-1]) == "SummaryNode(Node('/root/sub9'))"
+
+
+def test_chunks_stop_maxlevel():
+    """`stop` and `maxlevel` prune the tree before chunking."""
+    root = _wide(10)
+    _, shown = _check_chunks(root, 5, maxsize=11, stop=lambda node: node.name == "sub3")
+    assert len(shown) == 21 - 2
+    _, shown = _check_chunks(root, 5, maxsize=11, maxlevel=2)
+    assert len(shown) == 11
+    assert not list(_iter_chunks(root, 5, "{}.md", maxlevel=0))
+    assert not list(_iter_chunks(root, 5, "{}.md", stop=lambda node: node is root))
+
+
+def test_chunks_deep():
+    """Deep trees do not hit the recursion limit."""
+    root = Node("9999")
+    for idx in range(9998, -1, -1):
+        root = Node(str(idx), children=[root])
+    chunks, shown = _check_chunks(root, 100)
+    assert len(chunks) == 101
+    assert max(len(list(PreOrderIter(chunk))) for _, chunk in chunks) == 100
+    assert len(shown) == 10000
@@ -0,0 +1,58 @@
+from xml.etree import ElementTree
+
+from test2ref import assert_refdata
+
+from anytree import AnyNode, Node
+from anytree.exporter import SvgExporter
+
+
+def _root():
+    root = Node("root")
+    s0 = Node("sub0", parent=root)
+    Node("sub0B", parent=s0)
+    Node("sub0A", parent=s0)
+    s1 = Node("sub1", parent=root)
+    Node("sub1A", parent=s1)
+    Node('sub1"B', parent=s1)
+    s1c = Node("sub1<C>&", parent=s1)
+    Node("sub1Ca", parent=s1c)
+    return root
+
+
+def test_tree(tmp_path):
+    """Tree."""
+    SvgExporter(_root()).to_file(tmp_path / "tree.svg")
+    assert_refdata(test_tree, tmp_path)
+
+
+def test_tree_custom(tmp_path):
+    """Tree Custom."""
+    SvgExporter(
+        _root(),
+        nodenamefunc=lambda node: node.name.upper(),
+        nodeattrfunc=lambda node: 'fill="yellow"',
+        childiter=reversed,
+        maxlevel=2,
+        fontsize=10,
+        indent=4,
+    ).to_file(tmp_path / "tree_custom.svg")
+    assert_refdata(test_tree_custom, tmp_path)
+
+
+def test_valid():
+    """Output is well-formed XML with one box and one label per node."""
+    svg = ElementTree.fromstring("\n".join(SvgExporter(_root())))
+    ns = "{http://www.w3.org/2000/svg}"
+    assert len(svg.findall(f"{ns}g/{ns}rect")) == 9
+    assert len(svg.findall(f"{ns}g/{ns}path")) == 8
+    assert [text.text for text in svg.findall(f"{ns}g/{ns}text")][-2:] == ["sub1<C>&", "sub1Ca"]
+
+
+def test_deep():
+    """Deep trees do not hit the recursion limit."""
+    root = AnyNode(id=9999)
+    for idx in range(9998, -1, -1):
+        root = AnyNode(id=idx, children=[root])
+    lines = list(SvgExporter(root, nodenamefunc=lambda node: node.id))
+    assert len(lines) == 1 + 3 * 2 + 9999 + 2 * 10000 + 1
+    assert lines[-3] == '    <text x="30.8" y="559965">9999</text>'
@@ -68,6 +68,12 @@ def test_tree_maxlevel(tmp_path, root):
     assert_refdata(test_tree_maxlevel, tmp_path)
 
 
+def test_tree_summary(tmp_path, root):
+    """Summarised Tree."""
+    UniqueDotExporter(root, maxnodes=7, maxchildren=2).to_dotfile(tmp_path / "tree_summary.dot")
+    assert_refdata(test_tree_summary, tmp_path)
+
+
 def test_esc():
     """Test proper escape of quotes."""
     n = Node(r'6"-6\"')